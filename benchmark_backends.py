@@ -0,0 +1,70 @@
+"""
+Benchmark: eager PyTorch vs ONNX Runtime latency for batch sizes 1-32
+
+Usage:
+    python benchmark_backends.py [model_path] [onnx_path]
+
+If onnx_path does not exist, the checkpoint is exported to it first.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import torch
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.backends import OnnxRuntimeBackend
+from src.ai.evaluation import softmax
+from src.ai.model_handler import SoundClassifier
+from src.ai.onnx_export import export_onnx
+
+
+BATCH_SIZES = (1, 2, 4, 8, 16, 32)
+REPEATS = 5
+
+
+def time_backend(backend, batch, repeats=REPEATS):
+    """Best-of-N wall time in ms (after one warmup run)"""
+    backend.run(batch)
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        backend.run(batch)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(model_path="models/best_convnext_tiny.pth", onnx_path="models/model.onnx"):
+    """Time both backends and check they agree"""
+    classifier = SoundClassifier(model_path=model_path)
+    if classifier.use_mock:
+        print("[ERROR] Checkpoint could not be loaded")
+        return
+
+    if not os.path.exists(onnx_path):
+        export_onnx(classifier.model, onnx_path)
+        print(f"[INFO] Exported {onnx_path}")
+
+    torch_backend = classifier.backend
+    ort_backend = OnnxRuntimeBackend(onnx_path)
+
+    print("="*60)
+    print(f"Inference latency, torch {torch.get_num_threads()} threads")
+    print("="*60)
+    print(f"  {'Batch':>5s}  {'PyTorch':>10s}  {'ORT':>10s}  {'Speedup':>8s}  {'ms/clip ORT':>11s}  {'Max |Δp|':>9s}")
+
+    rng = np.random.default_rng(0)
+    for batch_size in BATCH_SIZES:
+        batch = rng.standard_normal((batch_size, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+
+        torch_ms = time_backend(torch_backend, batch)
+        ort_ms = time_backend(ort_backend, batch)
+        diff = np.abs(softmax(torch_backend.run(batch)) - softmax(ort_backend.run(batch))).max()
+
+        print(f"  {batch_size:>5d}  {torch_ms:>7.1f} ms  {ort_ms:>7.1f} ms  {torch_ms / ort_ms:>7.2f}x"
+              f"  {ort_ms / batch_size:>8.1f} ms  {diff:>9.2e}")
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:3])
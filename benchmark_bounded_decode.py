@@ -0,0 +1,59 @@
+"""
+Benchmark: preprocessing latency vs file length, full decode vs bounded decode
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from src.ai.audio_config import CLIP_SECONDS
+from src.ai.audio_processor import load_and_preprocess_audio
+
+
+FILE_SECONDS = (5, 30, 120, 600)
+FILE_SR = 48000
+
+
+def write_test_file(path, seconds, sr=FILE_SR, seed=0):
+    """Write a stereo 16-bit WAV of synthetic noise"""
+    import soundfile as sf
+
+    rng = np.random.default_rng(seed)
+    audio = (rng.standard_normal((int(sr * seconds), 2)) * 0.1).astype(np.float32)
+    sf.write(path, audio, sr, subtype='PCM_16')
+
+
+def time_call(fn, repeats=3):
+    """Best-of-N wall time in ms"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark():
+    """Time both decode modes for increasingly long files"""
+    print("="*60)
+    print(f"Preprocessing latency vs file length ({FILE_SR} Hz stereo WAV)")
+    print("="*60)
+    print(f"  {'Length':>8s}  {'Full decode':>12s}  {'Bounded':>10s}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for seconds in FILE_SECONDS:
+            path = os.path.join(tmp, f"clip_{seconds}s.wav")
+            write_test_file(path, seconds)
+
+            full_ms = time_call(lambda: load_and_preprocess_audio(path))
+            bounded_ms = time_call(lambda: load_and_preprocess_audio(path, max_seconds=CLIP_SECONDS))
+
+            print(f"  {seconds:>7d}s  {full_ms:>9.1f} ms  {bounded_ms:>7.1f} ms")
+
+    print("\nBounded decode reads only the first "
+          f"{CLIP_SECONDS:.0f} s, so its latency stays flat as files grow.")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,87 @@
+"""
+Benchmark: checkpoint load time and peak memory, legacy torch.load vs mmap vs safetensors
+
+Each loader runs in a fresh process; peak RSS is measured relative to the
+process after torch and timm are imported.
+
+Usage:
+    python benchmark_checkpoint_load.py [checkpoint.pth]
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+LOADERS = ('legacy', 'mmap_pth', 'safetensors')
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (Linux reports KB)"""
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def legacy_load(checkpoint_path):
+    """The original SoundClassifier._load_model path: full read, key walk, copy into a fresh model"""
+    import torch
+    from src.ai.model_handler import create_model
+
+    model = create_model()
+    checkpoint = torch.load(checkpoint_path, map_location='cpu')
+    if isinstance(checkpoint, dict):
+        checkpoint = checkpoint.get('model_state_dict', checkpoint.get('state_dict', checkpoint))
+    state_dict = {key[7:] if key.startswith('module.') else key: value for key, value in checkpoint.items()}
+    model.load_state_dict(state_dict)
+    return model.eval()
+
+
+def measure(loader, checkpoint_path):
+    """Load once and report time and peak memory"""
+    import torch  # noqa: F401
+    import timm  # noqa: F401
+    from src.ai.checkpoint_io import converted_path
+    from src.ai.model_handler import load_model
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+
+    if loader == 'legacy':
+        model = legacy_load(checkpoint_path)
+    elif loader == 'mmap_pth':
+        model = load_model(checkpoint_path)
+    else:
+        model = load_model(converted_path(checkpoint_path))
+
+    load_ms = (time.perf_counter() - start) * 1000
+    params = sum(p.numel() for p in model.parameters())
+    return {'loader': loader, 'load_ms': load_ms, 'peak_mb': peak_rss_mb() - baseline, 'params': params}
+
+
+def benchmark(checkpoint_path="models/best_convnext_tiny.pth"):
+    """Convert if needed, then run each loader in its own process"""
+    from src.ai.checkpoint_io import converted_path, convert_to_safetensors
+
+    if not os.path.exists(converted_path(checkpoint_path)):
+        convert_to_safetensors(checkpoint_path)
+
+    print("="*60)
+    print(f"Checkpoint load ({os.path.getsize(checkpoint_path) / (1024 * 1024):.0f} MB)")
+    print("="*60)
+    print(f"  {'Loader':12s} {'Load time':>10s} {'Peak RSS':>10s}")
+
+    for loader in LOADERS:
+        output = subprocess.run(
+            [sys.executable, __file__, '--child', loader, checkpoint_path],
+            capture_output=True, text=True, check=True
+        ).stdout
+        row = json.loads(output.strip().splitlines()[-1])
+        print(f"  {row['loader']:12s} {row['load_ms']:>7.0f} ms {row['peak_mb']:>7.0f} MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        print(json.dumps(measure(sys.argv[2], sys.argv[3])))
+    else:
+        benchmark(*sys.argv[1:2])
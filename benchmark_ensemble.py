@@ -0,0 +1,72 @@
+"""
+Benchmark: ensemble / TTA cost, one predict() per variant vs one batched pass
+
+Usage:
+    python benchmark_ensemble.py [model_path] [extra_checkpoint ...]
+
+Without extra checkpoints the base checkpoint is reused as the other
+ensemble members (same weights, same cost).
+"""
+import sys
+import time
+
+import numpy as np
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.ensemble import EnsembleSpec, build_tta_batch
+from src.ai.model_handler import SoundClassifier, load_model
+
+
+TIME_SHIFTS = (0.0, 0.5, 1.0, 1.5)
+NUM_MODELS = 3
+
+
+def time_call(fn, repeats=3):
+    """Best-of-N wall time in ms (after one warmup call)"""
+    fn()
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(model_path="models/best_convnext_tiny.pth", *extra_checkpoints):
+    """Compare sequential calls with the batched ensemble path"""
+    classifier = SoundClassifier(model_path=model_path)
+    if classifier.use_mock:
+        print("[ERROR] Checkpoint could not be loaded")
+        return
+
+    checkpoints = list(extra_checkpoints) or [classifier.loaded_path] * (NUM_MODELS - 1)
+    members = [classifier.model] + [load_model(path) for path in checkpoints]
+    x = np.random.default_rng(0).standard_normal((1, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+
+    def sequential():
+        # One forward per (model, variant), like calling predict() in a loop
+        for variant in build_tta_batch(x, TIME_SHIFTS):
+            for model in members:
+                classifier.backend.model = model
+                classifier.backend.run(variant[None])
+        classifier.backend.model = members[0]
+
+    looped = EnsembleSpec(checkpoints, TIME_SHIFTS, stack_weights=False)
+    stacked = EnsembleSpec(checkpoints, TIME_SHIFTS, stack_weights=True)
+
+    single_ms = time_call(lambda: classifier.backend.run(x))
+    sequential_ms = time_call(sequential)
+    looped_ms = time_call(lambda: classifier.classify_ensemble(x, looped))
+    stacked_ms = time_call(lambda: classifier.classify_ensemble(x, stacked))
+
+    print("="*60)
+    print(f"{len(members)} models x {len(TIME_SHIFTS)} time shifts")
+    print("="*60)
+    print(f"  {'Single predict()':32s} {single_ms:>8.1f} ms")
+    print(f"  {'Sequential (model x variant)':32s} {sequential_ms:>8.1f} ms")
+    print(f"  {'Batched, loop over models':32s} {looped_ms:>8.1f} ms")
+    print(f"  {'Batched, stacked weights (vmap)':32s} {stacked_ms:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
@@ -0,0 +1,80 @@
+"""
+Benchmark: first-window latency after launch, cold vs warmed up, eager vs TorchScript
+
+Each configuration runs in a fresh process because kernel selection and
+first-touch allocation happen once per process.
+
+Usage:
+    python benchmark_first_window.py [model_path]
+"""
+import json
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+CONFIGS = (
+    ('pytorch', False),
+    ('pytorch', True),
+    ('torchscript', False),
+    ('torchscript', True),
+)
+
+
+def measure(model_path, backend, warmup):
+    """Load, optionally wait for warmup, then time the first and a steady-state window"""
+    from src.ai.audio_config import N_MELS, FIXED_WIDTH
+    from src.ai.model_handler import SoundClassifier
+
+    start = time.perf_counter()
+    classifier = SoundClassifier(model_path=model_path, backend=backend, warmup=warmup)
+    load_ms = (time.perf_counter() - start) * 1000
+    if warmup:
+        classifier.warmup_done.wait()
+
+    rng = np.random.default_rng(1)
+    windows = rng.standard_normal((2, 1, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+
+    start = time.perf_counter()
+    classifier.predict(windows[0])
+    first_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    classifier.predict(windows[1])
+    steady_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        'backend': classifier.backend_name,
+        'warmup': warmup,
+        'load_ms': load_ms,
+        'warmup_ms': classifier.warmup_ms or 0.0,
+        'first_ms': first_ms,
+        'steady_ms': steady_ms,
+    }
+
+
+def benchmark(model_path="models/best_convnext_tiny.pth"):
+    """Run every configuration in a child process and print the table"""
+    print("="*72)
+    print("First-window latency after launch")
+    print("="*72)
+    print(f"  {'Backend':12s} {'Warmup':>7s} {'Load':>9s} {'Warmup':>9s} {'1st window':>11s} {'Steady':>9s}")
+
+    for backend, warmup in CONFIGS:
+        output = subprocess.run(
+            [sys.executable, __file__, '--child', model_path, backend, str(int(warmup))],
+            capture_output=True, text=True, check=True
+        ).stdout
+        row = json.loads(output.strip().splitlines()[-1])
+        print(f"  {row['backend']:12s} {'yes' if row['warmup'] else 'no':>7s} {row['load_ms']:>6.0f} ms "
+              f"{row['warmup_ms']:>6.0f} ms {row['first_ms']:>8.1f} ms {row['steady_ms']:>6.1f} ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        result = measure(sys.argv[2], sys.argv[3], bool(int(sys.argv[4])))
+        print(json.dumps(result))
+    else:
+        benchmark(*sys.argv[1:2])
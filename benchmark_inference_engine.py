@@ -0,0 +1,75 @@
+"""
+Benchmark: concurrent callers, direct SoundClassifier.predict vs micro-batching engine
+
+Usage:
+    python benchmark_inference_engine.py [model_path]
+"""
+import sys
+import threading
+import time
+
+import numpy as np
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.inference_engine import InferenceEngine
+from src.ai.model_handler import SoundClassifier
+
+
+NUM_CALLERS = 8
+REQUESTS_PER_CALLER = 4
+
+
+def run_callers(predictor, num_callers=NUM_CALLERS, requests_per_caller=REQUESTS_PER_CALLER):
+    """Each caller thread issues predict() calls back to back; returns (samples/s, avg latency ms)"""
+    rng = np.random.default_rng(0)
+    inputs = rng.standard_normal((num_callers, 1, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+    latencies = []
+    lock = threading.Lock()
+
+    def caller(x):
+        for _ in range(requests_per_caller):
+            start = time.perf_counter()
+            predictor.predict(x)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=caller, args=(inputs[i],)) for i in range(num_callers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    return num_callers * requests_per_caller / elapsed, 1000 * float(np.mean(latencies))
+
+
+def benchmark(model_path="models/best_convnext_tiny.pth"):
+    """Compare throughput with and without micro-batching"""
+    classifier = SoundClassifier(model_path=model_path)
+    if classifier.use_mock:
+        print("[ERROR] Checkpoint could not be loaded")
+        return
+
+    # Warmup
+    classifier.predict(np.zeros((1, 1, N_MELS, FIXED_WIDTH), dtype=np.float32))
+
+    print("="*60)
+    print(f"{NUM_CALLERS} concurrent callers x {REQUESTS_PER_CALLER} requests")
+    print("="*60)
+    print(f"  {'Mode':24s} {'Samples/s':>10s} {'Avg latency':>12s} {'Avg batch':>10s}")
+
+    throughput, latency = run_callers(classifier)
+    print(f"  {'Direct predict()':24s} {throughput:>10.2f} {latency:>9.1f} ms {1.0:>10.1f}")
+
+    for max_batch_size in (4, 8):
+        engine = InferenceEngine(classifier, max_batch_size=max_batch_size, max_wait_ms=10.0)
+        throughput, latency = run_callers(engine)
+        stats = engine.get_stats()
+        engine.stop()
+        label = f"Engine (max batch {max_batch_size})"
+        print(f"  {label:24s} {throughput:>10.2f} {latency:>9.1f} ms {stats['avg_batch_size']:>10.1f}")
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:2])
@@ -0,0 +1,67 @@
+"""
+Pick the fastest verified inference backend for this machine
+
+Times every backend that can be built and checks its logits against eager
+PyTorch on real clips. The winner is saved to the per-host backend profile,
+which SoundClassifier reads when 'inference_backend' is set to 'auto'.
+Nothing is calibrated while the app loads, so run this once per host
+(and again after replacing the checkpoint).
+
+Usage:
+    python calibrate_backends.py [model_path] --clips <audio_dir> [--max-clips 16] [--repeats 10]
+"""
+import argparse
+import os
+import sys
+
+from src.ai.backend_selection import BACKEND_PROFILE_PATH, CALIBRATION_REPEATS, CHECK_CLIPS
+from src.ai.model_handler import SoundClassifier
+from evaluate_store import find_audio_files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate inference backends and save the fastest")
+    parser.add_argument("model_path", nargs='?', default="models/best_convnext_tiny.pth")
+    parser.add_argument("--clips", help="Audio folder for the parity check (random input if omitted)")
+    parser.add_argument("--max-clips", type=int, default=CHECK_CLIPS)
+    parser.add_argument("--onnx", default="models/model.onnx", help="Model used by the onnxruntime backend")
+    parser.add_argument("--repeats", type=int, default=CALIBRATION_REPEATS, help="Timed runs per backend")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model_path):
+        print(f"[ERROR] Checkpoint not found: {args.model_path}")
+        sys.exit(1)
+
+    batches = None
+    if args.clips:
+        from src.ai.quantization import load_calibration_batches
+
+        paths = find_audio_files(args.clips)
+        if not paths:
+            print(f"[ERROR] No audio clips found in {args.clips}")
+            sys.exit(1)
+        print(f"[INFO] Preprocessing {min(len(paths), args.max_clips)} clips for the parity check")
+        batches = load_calibration_batches(paths, max_clips=args.max_clips)
+
+    classifier = SoundClassifier(model_path=args.model_path, backend='pytorch', onnx_path=args.onnx)
+    if classifier.use_mock:
+        print("[ERROR] Model could not be loaded")
+        sys.exit(1)
+
+    results = classifier.calibrate_backends(batches, args.repeats)
+
+    print("="*60)
+    print("Backend calibration")
+    print("="*60)
+    print(f"  {'Backend':14s} {'Status':12s} {'Median':>10s} {'Max |Δ|':>10s}")
+    for name, row in results.items():
+        median = f"{row['median_ms']:7.1f} ms" if 'median_ms' in row else '-'
+        diff = f"{row['max_abs_diff']:.2e}" if 'max_abs_diff' in row else '-'
+        print(f"  {name:14s} {row['status']:12s} {median:>10s} {diff:>10s}")
+
+    print(f"\n  Selected: {classifier.backend_name} ({classifier.backend_reason})")
+    print(f"[SUCCESS] Saved backend profile to {BACKEND_PROFILE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Convert a training .pth checkpoint to the fast-loading .safetensors format
+
+Usage:
+    python convert_checkpoint.py [checkpoint_path] [output_path]
+
+SoundClassifier picks up models/best_convnext_tiny.safetensors automatically
+when it sits next to (and is newer than) the configured .pth.
+"""
+import os
+import sys
+
+from src.ai.checkpoint_io import convert_to_safetensors, safetensors_available
+
+
+def main():
+    checkpoint_path = sys.argv[1] if len(sys.argv) > 1 else "models/best_convnext_tiny.pth"
+    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    if not safetensors_available():
+        print("[ERROR] safetensors is not installed: pip install safetensors")
+        sys.exit(1)
+
+    if not os.path.exists(checkpoint_path):
+        print(f"[ERROR] Checkpoint not found: {checkpoint_path}")
+        sys.exit(1)
+
+    try:
+        output_path = convert_to_safetensors(checkpoint_path, output_path)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+    print(f"[OK] Saved {output_path} ({size_mb:.1f} MB, keys normalized, round trip verified)")
+
+
+if __name__ == "__main__":
+    main()
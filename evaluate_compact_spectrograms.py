@@ -0,0 +1,84 @@
+"""
+Measure the accuracy impact of compact (float16 / int8) spectrogram storage
+
+Usage:
+    python evaluate_compact_spectrograms.py <audio_dir> [model_path]
+"""
+import sys
+
+import numpy as np
+
+from src.ai.audio_config import CLIP_SECONDS
+from src.ai.audio_processor import load_and_preprocess_batch
+from src.ai.model_handler import SoundClassifier
+from src.ai.spectrogram_codec import encode_spectrogram, decode_model_input
+from evaluate_store import find_audio_files
+
+
+def evaluate_codecs(audio_dir, model_path="models/best_convnext_tiny.pth", batch_size=16):
+    """
+    Compare predictions on original vs compact spectrograms
+
+    Args:
+        audio_dir: Folder of audio clips
+        model_path: Checkpoint for SoundClassifier
+        batch_size: Clips per forward pass
+
+    Returns:
+        dict mode -> {'agreement', 'max_prob_diff', 'mean_prob_diff', 'bytes'}
+    """
+    classifier = SoundClassifier(model_path=model_path)
+    paths = find_audio_files(audio_dir)
+
+    modes = ('float16', 'int8')
+    stats = {mode: {'agree': 0, 'max_diff': 0.0, 'diff_sum': 0.0, 'bytes': 0} for mode in modes}
+    reference_bytes = 0
+    total = 0
+
+    for start in range(0, len(paths), batch_size):
+        batch, specs = load_and_preprocess_batch(paths[start:start + batch_size], max_seconds=CLIP_SECONDS)
+        reference = classifier.predict_batch(batch)
+        reference_top = reference.argmax(axis=1)
+        reference_bytes += sum(spec.numel() * 4 for spec in specs)  # float32 dB spectrograms
+        total += len(batch)
+
+        for mode in modes:
+            compacts = [encode_spectrogram(spec, mode) for spec in specs]
+            decoded = np.concatenate([decode_model_input(c) for c in compacts], axis=0)
+            probs = classifier.predict_batch(decoded)
+
+            diff = np.abs(probs - reference)
+            stats[mode]['agree'] += int((probs.argmax(axis=1) == reference_top).sum())
+            stats[mode]['max_diff'] = max(stats[mode]['max_diff'], float(diff.max()))
+            stats[mode]['diff_sum'] += float(diff.max(axis=1).sum())
+            stats[mode]['bytes'] += sum(c.nbytes for c in compacts)
+
+    print("="*60)
+    print(f"Compact spectrogram storage on {total} clips")
+    print("="*60)
+    print(f"  {'Mode':8s} {'Top-1 agree':>12s} {'Max |Δp|':>10s} {'Mean |Δp|':>10s} {'KB/clip':>9s} {'Ratio':>7s}")
+    print(f"  {'float32':8s} {'100.00%':>12s} {0.0:>10.4f} {0.0:>10.4f} "
+          f"{reference_bytes / max(total, 1) / 1024:>9.1f} {1.0:>6.1f}x")
+
+    results = {}
+    for mode in modes:
+        s = stats[mode]
+        results[mode] = {
+            'agreement': 100.0 * s['agree'] / max(total, 1),
+            'max_prob_diff': s['max_diff'],
+            'mean_prob_diff': s['diff_sum'] / max(total, 1),
+            'bytes': s['bytes'] / max(total, 1),
+        }
+        r = results[mode]
+        print(f"  {mode:8s} {r['agreement']:>11.2f}% {r['max_prob_diff']:>10.4f} {r['mean_prob_diff']:>10.4f} "
+              f"{r['bytes'] / 1024:>9.1f} {reference_bytes / max(s['bytes'], 1):>6.1f}x")
+
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python evaluate_compact_spectrograms.py <audio_dir> [model_path]")
+        sys.exit(1)
+
+    evaluate_codecs(sys.argv[1], *sys.argv[2:3])
@@ -0,0 +1,134 @@
+"""
+Batch evaluation on a memory-mapped spectrogram store
+
+Usage:
+    python evaluate_store.py build <audio_dir> <store_path>
+    python evaluate_store.py eval <store_path> [--meta esc50.csv] [--out results.csv]
+"""
+import argparse
+import csv
+import os
+import time
+
+from src.ai.model_handler import SoundClassifier
+from src.utils.spectrogram_store import SpectrogramStore, build_spectrogram_store
+
+
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.ogg', '.flac')
+
+
+def find_audio_files(audio_dir):
+    """Recursively list audio files, sorted for a stable store order"""
+    paths = []
+    for root, _, files in os.walk(audio_dir):
+        for name in files:
+            if name.lower().endswith(AUDIO_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def load_labels(meta_path):
+    """
+    Read ground-truth labels keyed by file name
+
+    Accepts the ESC-50 meta file (filename, category) or any CSV with
+    path/label columns.
+    """
+    labels = {}
+    with open(meta_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            name = row.get('filename') or row.get('path')
+            label = row.get('category') or row.get('label')
+            if name and label:
+                labels[os.path.basename(name)] = label
+    return labels
+
+
+def evaluate_store(store_path, model_path="models/best_convnext_tiny.pth", batch_size=32,
+                   meta_path=None, out_path=None):
+    """
+    Run the classifier over every clip in a store
+
+    Args:
+        store_path: Spectrogram store path
+        model_path: Checkpoint for SoundClassifier
+        batch_size: Clips per forward pass
+        meta_path: Optional CSV with ground-truth labels
+        out_path: Optional CSV for per-clip predictions
+
+    Returns:
+        Accuracy in percent, or None without labels
+    """
+    store = SpectrogramStore(store_path)
+    classifier = SoundClassifier(model_path=model_path)
+    labels = load_labels(meta_path) if meta_path else {}
+
+    rows = []
+    correct = 0
+    labelled = 0
+    start = time.perf_counter()
+
+    for items, batch in store.iter_batches(batch_size):
+        probs = classifier.predict_batch(batch)
+        for item, p in zip(items, probs):
+            result = classifier.result_from_probs(p)
+            truth = labels.get(os.path.basename(item['path']))
+            if truth is not None:
+                labelled += 1
+                correct += int(truth == result['label'])
+            rows.append({
+                'path': item['path'],
+                'label': result['label'],
+                'confidence': f"{result['confidence']:.2f}",
+                'truth': truth or '',
+            })
+
+    elapsed = time.perf_counter() - start
+
+    print("="*60)
+    print(f"Evaluated {len(store)} clips in {elapsed:.2f}s ({len(store) / max(elapsed, 1e-9):.1f} clips/s)")
+    accuracy = None
+    if labelled:
+        accuracy = 100.0 * correct / labelled
+        print(f"Top-1 accuracy: {accuracy:.2f}% ({correct}/{labelled})")
+    print("="*60)
+
+    if out_path:
+        with open(out_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['path', 'label', 'confidence', 'truth'])
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"[INFO] Predictions saved to: {out_path}")
+
+    return accuracy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='Preprocess an audio folder into a store')
+    build.add_argument('audio_dir')
+    build.add_argument('store_path')
+    build.add_argument('--batch-size', type=int, default=32)
+
+    evaluate = sub.add_parser('eval', help='Classify every clip in a store')
+    evaluate.add_argument('store_path')
+    evaluate.add_argument('--model', default="models/best_convnext_tiny.pth")
+    evaluate.add_argument('--batch-size', type=int, default=32)
+    evaluate.add_argument('--meta', help='CSV with filename/category (ESC-50 meta) or path/label')
+    evaluate.add_argument('--out', help='CSV file for per-clip predictions')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        paths = find_audio_files(args.audio_dir)
+        print(f"[INFO] Found {len(paths)} audio files in {args.audio_dir}")
+        count = build_spectrogram_store(paths, args.store_path, batch_size=args.batch_size)
+        print(f"[SUCCESS] Wrote {count} spectrograms to {args.store_path}")
+    else:
+        evaluate_store(args.store_path, args.model, args.batch_size, args.meta, args.out)
+
+
+if __name__ == "__main__":
+    main()
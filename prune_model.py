@@ -0,0 +1,173 @@
+"""
+Structured pruning sweep: latency vs top-1 agreement
+
+Prunes MLP hidden channels and/or whole blocks of ConvNeXt-Tiny at every
+combination of the given ratios, optionally fine-tunes each variant on a
+local labelled folder, and reports latency, size and agreement with the
+unpruned model.
+
+Usage:
+    python prune_model.py --eval-dir <audio_dir> [--mlp-ratios 0,0.25,0.5] [--block-ratios 0,0.34]
+                          [--finetune-dir DIR] [--meta esc50.csv] [--epochs 2]
+                          [--checkpoint PATH] [--output-dir DIR]
+
+Labels for fine-tuning come from --meta (ESC-50 meta / path,label CSV), the
+parent folder name, or the ESC-50 file name (<fold>-<id>-<take>-<target>.wav).
+Unlabelled clips are used for distillation only.
+
+Outputs (next to the checkpoint by default):
+    best_convnext_tiny_pruned_mlp<R>_blk<R>.pth - load with SoundClassifier(model_path=...)
+    pruning_report.json                         - latency, parameters, size, agreement per variant
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.backends import TorchBackend
+from src.ai.model_handler import load_model, ESC50_CLASSES, ESC50_TARGET_ORDER
+from src.ai.pruning import prune_model, save_pruned_checkpoint, finetune, count_parameters
+from src.ai.evaluation import measure_latency, compare_to_reference, file_size_mb
+from src.ai.quantization import load_calibration_batches
+from evaluate_store import find_audio_files, load_labels
+
+
+def parse_ratios(text):
+    """'0,0.25,0.5' -> [0.0, 0.25, 0.5]"""
+    return [float(value) for value in text.split(',') if value.strip()]
+
+
+def clip_targets(paths, meta_path=None):
+    """Class index per clip (-1 if unknown)"""
+    meta = load_labels(meta_path) if meta_path else {}
+    targets = []
+    for path in paths:
+        name = os.path.basename(path)
+        label = meta.get(name) or os.path.basename(os.path.dirname(path))
+        if label in ESC50_CLASSES:
+            targets.append(ESC50_CLASSES.index(label))
+            continue
+        # ESC-50 naming: <fold>-<clip id>-<take>-<target>.wav, target in the dataset's own order
+        stem = os.path.splitext(name)[0].split('-')
+        if len(stem) == 4 and stem[-1].isdigit() and int(stem[-1]) < len(ESC50_TARGET_ORDER):
+            targets.append(ESC50_CLASSES.index(ESC50_TARGET_ORDER[int(stem[-1])]))
+        else:
+            targets.append(-1)
+    return targets
+
+
+def batch_targets(targets, batch_size):
+    """Split per-clip targets like load_calibration_batches splits clips"""
+    return [np.array(targets[i:i + batch_size]) for i in range(0, len(targets), batch_size)]
+
+
+def accuracy(run, batches, targets):
+    """Top-1 accuracy (%) on labelled clips, None without labels"""
+    correct = total = 0
+    for batch, labels in zip(batches, targets):
+        labelled = labels >= 0
+        if labelled.any():
+            predictions = run(batch).argmax(axis=1)
+            correct += int((predictions[labelled] == labels[labelled]).sum())
+            total += int(labelled.sum())
+    return 100.0 * correct / total if total else None
+
+
+def print_report(rows):
+    """Print the sweep table"""
+    print("\n" + "="*92)
+    print("Pruning sweep (latency: batch of 1, CPU)")
+    print("="*92)
+    print(f"  {'Variant':24s} {'Params':>8s} {'Size MB':>8s} {'Latency':>10s} {'Speedup':>8s} "
+          f"{'Top-1 agree':>12s} {'Accuracy':>9s}")
+    baseline = rows[0]['latency_ms']
+    for row in rows:
+        acc = f"{row['accuracy']:.1f}%" if row['accuracy'] is not None else "-"
+        print(f"  {row['name']:24s} {row['parameters'] / 1e6:>7.1f}M {row['size_mb']:>8.1f} "
+              f"{row['latency_ms']:>7.1f} ms {baseline / row['latency_ms']:>7.2f}x "
+              f"{row['top1_agreement']:>11.2f}% {acc:>9s}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Structured pruning sweep for the sound classifier")
+    parser.add_argument('--eval-dir', required=True, help="Clips for agreement / accuracy")
+    parser.add_argument('--mlp-ratios', default="0,0.25,0.5", help="Fractions of MLP channels removed")
+    parser.add_argument('--block-ratios', default="0,0.34", help="Fractions of blocks removed per stage")
+    parser.add_argument('--finetune-dir', help="Labelled clips for fine-tuning (skipped if omitted)")
+    parser.add_argument('--meta', help="CSV with labels (ESC-50 meta or path,label)")
+    parser.add_argument('--epochs', type=int, default=2)
+    parser.add_argument('--lr', type=float, default=1e-4)
+    parser.add_argument('--checkpoint', default="models/best_convnext_tiny.pth")
+    parser.add_argument('--output-dir', help="Default: folder of the checkpoint")
+    parser.add_argument('--max-clips', type=int, default=256)
+    parser.add_argument('--batch-size', type=int, default=8)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.checkpoint):
+        print(f"[ERROR] Checkpoint not found: {args.checkpoint}")
+        sys.exit(1)
+
+    eval_paths = find_audio_files(args.eval_dir)[:args.max_clips]
+    if not eval_paths:
+        print("[ERROR] No audio clips found")
+        sys.exit(1)
+
+    output_dir = args.output_dir or os.path.dirname(args.checkpoint) or '.'
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(args.checkpoint))[0]
+
+    print(f"[INFO] Preprocessing {len(eval_paths)} evaluation clips")
+    eval_batches = load_calibration_batches(eval_paths, args.batch_size)
+    eval_targets = batch_targets(clip_targets(eval_paths, args.meta), args.batch_size)
+
+    train_batches = train_targets = None
+    if args.finetune_dir:
+        train_paths = find_audio_files(args.finetune_dir)[:args.max_clips]
+        print(f"[INFO] Preprocessing {len(train_paths)} fine-tuning clips")
+        train_batches = load_calibration_batches(train_paths, args.batch_size)
+        train_targets = batch_targets(clip_targets(train_paths, args.meta), args.batch_size)
+
+    latency_input = np.random.default_rng(0).standard_normal((1, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+    float_model = load_model(args.checkpoint, 'cpu')
+    reference = TorchBackend(float_model, 'cpu')
+
+    def report_row(name, path, model, ratios):
+        backend = TorchBackend(model, 'cpu')
+        row = {'name': name, 'path': path, 'mlp_ratio': ratios[0], 'block_ratio': ratios[1],
+               'parameters': count_parameters(model), 'size_mb': file_size_mb(path),
+               'latency_ms': measure_latency(backend.run, latency_input),
+               'accuracy': accuracy(backend.run, eval_batches, eval_targets)}
+        row.update(compare_to_reference(reference.run, backend.run, eval_batches))
+        return row
+
+    rows = [report_row("Unpruned", args.checkpoint, float_model, (0.0, 0.0))]
+
+    for block_ratio in parse_ratios(args.block_ratios):
+        for mlp_ratio in parse_ratios(args.mlp_ratios):
+            if mlp_ratio == 0 and block_ratio == 0:
+                continue
+            name = f"mlp{mlp_ratio:.0%} blocks{block_ratio:.0%}"
+            print(f"[INFO] Pruning: {name}")
+            pruned, spec = prune_model(float_model, mlp_ratio, block_ratio)
+
+            if train_batches:
+                finetune(pruned, float_model, train_batches, train_targets, args.epochs, args.lr)
+
+            path = os.path.join(output_dir, f"{stem}_pruned_mlp{int(mlp_ratio * 100)}_blk{int(block_ratio * 100)}.pth")
+            save_pruned_checkpoint(pruned, spec, path, args.checkpoint)
+            # Reload through the normal path to prove SoundClassifier can serve it
+            rows.append(report_row(name, path, load_model(path, 'cpu'), (mlp_ratio, block_ratio)))
+
+    print_report(rows)
+
+    report_path = os.path.join(output_dir, "pruning_report.json")
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump({'clips': rows[0]['clips'], 'finetuned': bool(train_batches), 'models': rows}, f, indent=2)
+    print(f"\n[OK] Report saved to: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
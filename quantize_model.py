@@ -0,0 +1,114 @@
+"""
+Build INT8 versions of the classifier and report latency / size / accuracy
+
+Usage:
+    python quantize_model.py --clips <audio_dir> [--mode dynamic|static|both]
+                             [--checkpoint PATH] [--onnx PATH] [--eval-dir DIR]
+
+Outputs (next to the checkpoint by default):
+    best_convnext_tiny_int8.pth   - PyTorch dynamic int8 (load with SoundClassifier(model_path=...))
+    model_int8.onnx               - ONNX Runtime static int8 (load with backend='onnxruntime')
+    quantization_report.json      - latency, model size, top-1 agreement vs float
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.backends import TorchBackend, OnnxRuntimeBackend
+from src.ai.model_handler import load_model
+from src.ai.onnx_export import export_model
+from src.ai.evaluation import measure_latency, compare_to_reference, file_size_mb
+from src.ai.quantization import (
+    quantize_dynamic, save_quantized_checkpoint, quantize_onnx_static, load_calibration_batches
+)
+from evaluate_store import find_audio_files
+
+
+def print_report(rows):
+    """Print the report table"""
+    print("\n" + "="*78)
+    print("Quantization report (latency: batch of 1, CPU)")
+    print("="*78)
+    print(f"  {'Model':28s} {'Size MB':>8s} {'Latency':>10s} {'Speedup':>8s} {'Top-1 agree':>12s} {'Max |Δp|':>9s}")
+    baseline = rows[0]['latency_ms']
+    for row in rows:
+        print(f"  {row['name']:28s} {row['size_mb']:>8.1f} {row['latency_ms']:>7.1f} ms "
+              f"{baseline / row['latency_ms']:>7.2f}x {row['top1_agreement']:>11.2f}% {row['max_prob_diff']:>9.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="INT8 quantization for the sound classifier")
+    parser.add_argument('--clips', required=True, help="Calibration clips folder")
+    parser.add_argument('--eval-dir', help="Clips for the agreement check (default: --clips)")
+    parser.add_argument('--mode', choices=('dynamic', 'static', 'both'), default='both')
+    parser.add_argument('--checkpoint', default="models/best_convnext_tiny.pth")
+    parser.add_argument('--onnx', default="models/model.onnx", help="Float ONNX model (exported if missing)")
+    parser.add_argument('--output-dir', help="Default: folder of the checkpoint")
+    parser.add_argument('--max-clips', type=int, default=256)
+    parser.add_argument('--batch-size', type=int, default=8)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.checkpoint):
+        print(f"[ERROR] Checkpoint not found: {args.checkpoint}")
+        sys.exit(1)
+
+    calibration_paths = find_audio_files(args.clips)
+    eval_paths = find_audio_files(args.eval_dir) if args.eval_dir else calibration_paths
+    if not calibration_paths or not eval_paths:
+        print("[ERROR] No audio clips found")
+        sys.exit(1)
+
+    output_dir = args.output_dir or os.path.dirname(args.checkpoint) or '.'
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"[INFO] Preprocessing {min(len(eval_paths), args.max_clips)} evaluation clips")
+    eval_batches = load_calibration_batches(eval_paths, args.batch_size, args.max_clips)
+    latency_input = np.random.default_rng(0).standard_normal((1, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+
+    float_model = load_model(args.checkpoint, 'cpu')
+    reference = TorchBackend(float_model, 'cpu')
+
+    def report_row(name, path, backend):
+        row = {'name': name, 'path': path, 'size_mb': file_size_mb(path),
+               'latency_ms': measure_latency(backend.run, latency_input)}
+        row.update(compare_to_reference(reference.run, backend.run, eval_batches))
+        return row
+
+    rows = [report_row("PyTorch fp32", args.checkpoint, reference)]
+
+    if args.mode in ('dynamic', 'both'):
+        print("[INFO] PyTorch dynamic int8 quantization (Linear layers)")
+        quantized_path = os.path.join(output_dir, "best_convnext_tiny_int8.pth")
+        save_quantized_checkpoint(quantize_dynamic(float_model), quantized_path, args.checkpoint)
+        # Reload through the normal path to prove SoundClassifier can serve it
+        quantized_model = load_model(quantized_path, 'cpu')
+        rows.append(report_row("PyTorch dynamic int8", quantized_path, TorchBackend(quantized_model, 'cpu')))
+
+    if args.mode in ('static', 'both'):
+        if not os.path.exists(args.onnx):
+            export_model(args.checkpoint, args.onnx, ort_path=None)
+        rows.append(report_row("ONNX Runtime fp32", args.onnx, OnnxRuntimeBackend(args.onnx)))
+
+        print(f"[INFO] ONNX Runtime static int8 quantization ({min(len(calibration_paths), args.max_clips)} clips)")
+        calibration_batches = (
+            eval_batches if calibration_paths == eval_paths
+            else load_calibration_batches(calibration_paths, args.batch_size, args.max_clips)
+        )
+        static_path = os.path.join(output_dir, "model_int8.onnx")
+        quantize_onnx_static(args.onnx, static_path, calibration_batches)
+        rows.append(report_row("ONNX Runtime static int8", static_path, OnnxRuntimeBackend(static_path)))
+
+    print_report(rows)
+
+    report_path = os.path.join(output_dir, "quantization_report.json")
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump({'clips': rows[0]['clips'], 'models': rows}, f, indent=2)
+    print(f"\n[OK] Report saved to: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Activity Gate
+Skips live windows that are silent or sit at the site's noise floor
+
+Each window is measured by RMS and peak level in dBFS. The gate opens when
+the window is louder than both the configured threshold and the recent
+noise floor plus a margin. The noise floor is a low percentile of recent
+window levels, so steady background noise (HVAC, traffic hum) is learned
+and closed out. It can raise the gate by at most MAX_FLOOR_RISE_DB, which
+stops a long, loud sound from becoming the "floor" and being muted.
+
+Torch-free (numpy only).
+"""
+from collections import deque
+
+import numpy as np
+
+
+# Default gate (dBFS): below this a window counts as silent regardless of history
+DEFAULT_GATE_DB = -50.0
+
+# A window must beat the noise floor by this much (RMS)
+FLOOR_MARGIN_DB = 6.0
+
+# Recent windows used for the noise floor, and the percentile taken
+FLOOR_HISTORY = 60
+FLOOR_PERCENTILE = 20
+
+# The floor can push the gate at most this far above the configured threshold
+MAX_FLOOR_RISE_DB = 20.0
+
+# Transients (door knock, glass) can have low RMS over 5 s but a clear peak
+PEAK_MARGIN_DB = 20.0
+
+_EPS = 1e-10
+
+
+def level_db(waveform):
+    """
+    RMS and peak level of a waveform
+
+    Args:
+        waveform: Mono samples in [-1, 1] (numpy array or tensor)
+
+    Returns:
+        (rms_db, peak_db) in dBFS
+    """
+    samples = np.asarray(waveform, dtype=np.float32).reshape(-1)
+    if samples.size == 0:
+        return 20 * np.log10(_EPS), 20 * np.log10(_EPS)
+    rms = np.sqrt(np.mean(np.square(samples, dtype=np.float64)))
+    peak = np.max(np.abs(samples))
+    return float(20 * np.log10(rms + _EPS)), float(20 * np.log10(peak + _EPS))
+
+
+class ActivityGate:
+    """Decides per window whether the model needs to run"""
+
+    def __init__(self, gate_db=DEFAULT_GATE_DB, floor_margin_db=FLOOR_MARGIN_DB,
+                 history=FLOOR_HISTORY, percentile=FLOOR_PERCENTILE):
+        """
+        Args:
+            gate_db: Absolute RMS threshold in dBFS
+            floor_margin_db: Required RMS margin over the noise floor
+            history: Number of recent windows in the noise-floor estimate
+            percentile: Percentile of recent levels taken as the floor
+        """
+        self.gate_db = gate_db
+        self.floor_margin_db = floor_margin_db
+        self.percentile = percentile
+        self.levels = deque(maxlen=history)
+
+    @property
+    def noise_floor_db(self):
+        """Current noise-floor estimate in dBFS (None until a window was seen)"""
+        if not self.levels:
+            return None
+        return float(np.percentile(self.levels, self.percentile))
+
+    @property
+    def threshold_db(self):
+        """Effective RMS gate: configured threshold raised by the noise floor, within limits"""
+        floor = self.noise_floor_db
+        if floor is None:
+            return self.gate_db
+        return min(max(self.gate_db, floor + self.floor_margin_db), self.gate_db + MAX_FLOOR_RISE_DB)
+
+    def check(self, waveform):
+        """
+        Measure a window and update the noise floor
+
+        Args:
+            waveform: Latest window of raw audio
+
+        Returns:
+            dict with 'active', 'rms_db', 'peak_db', 'threshold_db', 'noise_floor_db'
+        """
+        rms_db, peak_db = level_db(waveform)
+        threshold = self.threshold_db
+
+        active = rms_db >= threshold or peak_db >= threshold + PEAK_MARGIN_DB
+
+        # The floor is estimated after the decision so a window never gates itself
+        self.levels.append(rms_db)
+
+        return {
+            'active': active,
+            'rms_db': rms_db,
+            'peak_db': peak_db,
+            'threshold_db': threshold,
+            'noise_floor_db': self.noise_floor_db,
+        }
+
+    def reset(self):
+        """Forget the noise-floor history (e.g. when monitoring restarts)"""
+        self.levels.clear()
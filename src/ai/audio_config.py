@@ -0,0 +1,24 @@
+"""
+Audio Preprocessing Constants
+Kept free of torch imports so lightweight workers can share them
+"""
+
+# Constants - match Kaggle exactly
+SR = 44100
+N_MELS = 128
+N_FFT = 2048
+HOP_LENGTH = 512
+TOP_DB = 80
+FIXED_WIDTH = 431
+CLIP_SECONDS = 5.0  # ESC-50 clip length (220500 samples -> 431 frames)
+
+# Everything that changes the model input (used in cache keys)
+PREPROCESSING_PARAMS = {
+    'sr': SR,
+    'n_mels': N_MELS,
+    'n_fft': N_FFT,
+    'hop_length': HOP_LENGTH,
+    'top_db': TOP_DB,
+    'fixed_width': FIXED_WIDTH,
+    'normalization': 'zscore',
+}
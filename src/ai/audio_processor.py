@@ -6,25 +6,36 @@ import torchaudio
 import torchaudio.transforms as T
 import torch.nn.functional as F
 import numpy as np
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import matplotlib.pyplot as plt
 from io import BytesIO
 from PIL import Image
 from src.utils.performance_metrics import performance_metrics
+from src.ai.feature_extractor import (
+    SR, N_MELS, N_FFT, HOP_LENGTH, FIXED_WIDTH,
+    get_feature_extractor, normalize_spectrogram
+)
+from src.ai.resampler import resample
 
 
-# Constants - match Kaggle exactly
-SR = 44100
-N_MELS = 128
-FIXED_WIDTH = 431
+# Extra source samples read past the clip end so the resampler's sinc
+# filter sees real audio instead of zero padding at the crop boundary
+RESAMPLE_MARGIN = 256
 
 
-def load_and_preprocess_audio(file_path, device='cpu'):
+def load_and_preprocess_audio(file_path, device='cpu', max_seconds=None):
     """
     Load and preprocess audio EXACTLY like Kaggle code
     
     Args:
         file_path: Path to audio file
         device: torch device ('cpu' or 'cuda')
+        max_seconds: Only decode the first max_seconds of audio (None = whole file).
+            With CLIP_SECONDS the file is processed as if trimmed to one
+            training clip, so latency no longer grows with file length.
     
     Returns:
         preprocessed: Tensor ready for model (1, 1, 128, 431)
@@ -33,60 +44,182 @@ def load_and_preprocess_audio(file_path, device='cpu'):
     # Mark preprocessing start
     performance_metrics.mark_phase_start('preprocessing')
     
-    # a. Load audio (trying to use torchaudio.load directly, fallback to soundfile)
+    # a-c. Load, convert to mono and resample to 44100 (EXACTLY like Kaggle)
+    waveform = decode_audio(file_path, max_seconds=max_seconds)
+    
+    # d-h. Mel-Spectrogram, dB, z-score and fixed width (EXACTLY like Kaggle)
+    extractor = get_feature_extractor(SR, N_FFT, HOP_LENGTH, N_MELS, device)
+    preprocessed, spec_for_display = extractor(waveform, FIXED_WIDTH)  # (1, 1, 128, 431)
+    
+    # Mark preprocessing end
+    performance_metrics.mark_phase_end('preprocessing')
+    
+    return preprocessed, spec_for_display
+
+
+def get_audio_info(file_path):
+    """
+    Get file length without decoding the audio
+    
+    Some backends report 0 frames for compressed files (e.g. mp3 without
+    a length header); those are decoded once to count the samples.
+    
+    Returns:
+        num_frames: Samples per channel
+        sr: Sample rate of the file
+    """
     try:
-        waveform, sr = torchaudio.load(file_path)
-    except Exception as e:
+        info = torchaudio.info(file_path)
+        num_frames, sr = info.num_frames, info.sample_rate
+    except Exception:
+        import soundfile as sf
+        info = sf.info(file_path)
+        num_frames, sr = info.frames, info.samplerate
+    
+    if num_frames <= 0:
+        waveform, sr = _read_audio(file_path)
+        num_frames = waveform.shape[1]
+    
+    return num_frames, sr
+
+
+def _read_audio(file_path, frame_offset=0, num_frames=-1):
+    """
+    Read an audio file with torchaudio, falling back to soundfile
+    
+    Args:
+        file_path: Path to audio file
+        frame_offset: First sample to read (at the file's sample rate)
+        num_frames: Number of samples to read (-1 = until the end)
+    
+    Returns:
+        waveform: Tensor (channels, samples)
+        sr: Sample rate of the file
+    """
+    try:
+        waveform, sr = torchaudio.load(file_path, frame_offset=frame_offset, num_frames=num_frames)
+    except Exception:
         # Fallback to soundfile if torchaudio.load fails
         import soundfile as sf
-        audio_data, sr = sf.read(file_path, dtype='float32')
+        audio_data, sr = sf.read(file_path, start=frame_offset, frames=num_frames, dtype='float32')
         waveform = torch.from_numpy(audio_data).float()
         if waveform.ndim == 1:
             waveform = waveform.unsqueeze(0)
         else:
             waveform = waveform.t()
     
-    # b. Convert to mono (EXACTLY like Kaggle)
+    return waveform, sr
+
+
+def decode_audio(file_path, max_seconds=None, offset_seconds=0.0):
+    """
+    Load an audio file as a mono waveform at 44100 Hz (EXACTLY like Kaggle)
+    
+    Args:
+        file_path: Path to audio file
+        max_seconds: Only decode this many seconds (None = until the end)
+        offset_seconds: Start position in seconds
+    
+    Returns:
+        Mono waveform tensor (1, samples)
+    """
+    if max_seconds is None and not offset_seconds:
+        waveform, sr = _read_audio(file_path)
+    else:
+        # Read only the region we need, plus a small margin for the resampler
+        _, sr = get_audio_info(file_path)
+        frame_offset = int(round(offset_seconds * sr))
+        num_frames = -1
+        if max_seconds is not None:
+            num_frames = int(math.ceil(max_seconds * sr)) + RESAMPLE_MARGIN
+        waveform, sr = _read_audio(file_path, frame_offset, num_frames)
+    
+    # Convert to mono
     if waveform.shape[0] > 1:
         waveform = waveform.mean(0, keepdim=True)
     
-    # c. Resample to 44100 (EXACTLY like Kaggle)
+    # Resample to 44100
     if sr != SR:
-        waveform = T.Resample(sr, SR)(waveform)
+        waveform = resample(waveform, sr, SR)
     
-    # d. Create Mel-Spectrogram (EXACTLY like Kaggle)
-    mel_spec = T.MelSpectrogram(
-        sample_rate=SR, 
-        n_fft=2048, 
-        hop_length=512, 
-        n_mels=N_MELS
-    ).to(device)
+    if max_seconds is not None:
+        waveform = waveform[:, :int(round(max_seconds * SR))]
     
-    db_trans = T.AmplitudeToDB(top_db=80).to(device)
+    return waveform
+
+
+def iter_audio_blocks(file_path, block_seconds=60.0):
+    """
+    Decode a file front to back in large blocks (mono, 44100 Hz)
     
-    # e. Generate spectrogram
-    with torch.no_grad():
-        spec = db_trans(mel_spec(waveform.to(device))).cpu().squeeze(0)
-        
-        # Keep a copy for display (before normalization)
-        spec_for_display = spec.clone()
+    Every source sample is read and resampled once. Blocks start on the
+    resampler's phase grid and are resampled with RESAMPLE_MARGIN context on
+    both sides, so the concatenated blocks equal resampling the whole file.
+    
+    Args:
+        file_path: Path to audio file
+        block_seconds: Approximate block length in seconds
+    
+    Yields:
+        Mono waveform tensors (1, samples) in file order
+    """
+    total, sr = get_audio_info(file_path)
+    
+    # Block boundaries must map to whole output samples: multiples of sr / gcd(sr, SR)
+    stride = sr // math.gcd(sr, SR)
+    block = max(1, int(round(block_seconds * sr / stride))) * stride
+    margin = 0 if sr == SR else int(math.ceil(RESAMPLE_MARGIN / stride)) * stride
+    
+    for start in range(0, total, block):
+        end = min(start + block, total)
+        read_start = max(0, start - margin)
+        read_end = min(total, end + margin)
+        waveform, _ = _read_audio(file_path, read_start, read_end - read_start)
         
-        # f. Z-score normalization (EXACTLY like Kaggle)
-        spec = (spec - spec.mean()) / (spec.std() + 1e-6)
+        if waveform.shape[0] > 1:
+            waveform = waveform.mean(0, keepdim=True)
         
-        # g. Fixed width 128x431 (EXACTLY like Kaggle)
-        if spec.shape[1] < FIXED_WIDTH:
-            spec = F.pad(spec, (0, FIXED_WIDTH - spec.shape[1]))
-        else:
-            spec = spec[:, :FIXED_WIDTH]
+        if sr != SR:
+            waveform = resample(waveform, sr, SR)
+            first = (start - read_start) * SR // sr
+            last = int(math.ceil((end - read_start) * SR / sr))
+            waveform = waveform[:, first:last]
         
-        # h. Add batch and channel dimensions and convert to numpy
-        preprocessed = spec.unsqueeze(0).unsqueeze(0).numpy().astype(np.float32)  # (1, 1, 128, 431)
+        yield waveform
+
+
+def load_and_preprocess_batch(file_paths, device='cpu', max_workers=None, max_seconds=None):
+    """
+    Load and preprocess several audio files into one model batch
+    
+    Files are decoded in parallel on a thread pool, then STFT, mel, dB,
+    z-score and padding run once over the stacked waveforms.
+    
+    Args:
+        file_paths: List of paths to audio files
+        device: torch device ('cpu' or 'cuda')
+        max_workers: Decoder threads (default: one per file, capped at CPU count)
+        max_seconds: Only decode the first max_seconds of each file (None = whole file)
+    
+    Returns:
+        batch: Contiguous array ready for model (N, 1, 128, 431)
+        specs_for_display: List of N mel-spectrograms for visualization (before normalization)
+    """
+    performance_metrics.mark_phase_start('preprocessing')
+    
+    file_paths = list(file_paths)
+    if max_workers is None:
+        max_workers = max(1, min(len(file_paths), os.cpu_count() or 1))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        waveforms = list(pool.map(partial(decode_audio, max_seconds=max_seconds), file_paths))
+    
+    extractor = get_feature_extractor(SR, N_FFT, HOP_LENGTH, N_MELS, device)
+    batch, specs_for_display = extractor.preprocess_batch(waveforms, FIXED_WIDTH)
     
-    # Mark preprocessing end
     performance_metrics.mark_phase_end('preprocessing')
     
-    return preprocessed, spec_for_display
+    return batch, specs_for_display
 
 
 def mel_spectrogram_to_image(spec_tensor):
@@ -172,16 +305,7 @@ def load_audio(file_path, sr=44100, duration=5.0):
     Backward compatibility wrapper
     Returns: numpy array, sample rate
     """
-    try:
-        waveform, sample_rate = torchaudio.load(file_path)
-    except:
-        import soundfile as sf
-        audio_data, sample_rate = sf.read(file_path, dtype='float32')
-        waveform = torch.from_numpy(audio_data).float()
-        if waveform.ndim == 1:
-            waveform = waveform.unsqueeze(0)
-        else:
-            waveform = waveform.t()
+    waveform, sample_rate = _read_audio(file_path)
     
     if waveform.shape[0] > 1:
         waveform = waveform.mean(0, keepdim=True)
@@ -194,23 +318,9 @@ def generate_mel_spectrogram(audio, sr=44100, n_mels=128, n_fft=2048, hop_length
     Backward compatibility wrapper
     Returns: numpy array (mel-spectrogram in dB)
     """
-    if isinstance(audio, np.ndarray):
-        audio = torch.from_numpy(audio).unsqueeze(0)
-    
-    device = torch.device('cpu')
-    mel_spec = T.MelSpectrogram(
-        sample_rate=sr,
-        n_fft=n_fft,
-        hop_length=hop_length,
-        n_mels=n_mels
-    ).to(device)
-    
-    db_trans = T.AmplitudeToDB(top_db=80).to(device)
+    extractor = get_feature_extractor(sr, n_fft, hop_length, n_mels, 'cpu')
     
-    with torch.no_grad():
-        spec = db_trans(mel_spec(audio.to(device))).cpu().squeeze(0)
-    
-    return spec.numpy()
+    return extractor.mel_db(audio).numpy()
 
 
 def preprocess_for_model(mel_spec, target_shape=(128, 431)):
@@ -218,20 +328,4 @@ def preprocess_for_model(mel_spec, target_shape=(128, 431)):
     Backward compatibility wrapper
     Returns: numpy array (1, 1, 128, 431)
     """
-    if isinstance(mel_spec, np.ndarray):
-        mel_spec = torch.from_numpy(mel_spec)
-    
-    # Z-score normalization
-    spec = (mel_spec - mel_spec.mean()) / (mel_spec.std() + 1e-6)
-    
-    # Pad or crop
-    target_width = target_shape[1]
-    if spec.shape[1] < target_width:
-        spec = F.pad(spec, (0, target_width - spec.shape[1]))
-    else:
-        spec = spec[:, :target_width]
-    
-    # Add dimensions
-    spec = spec.unsqueeze(0).unsqueeze(0)
-    
-    return spec.numpy().astype(np.float32)
+    return normalize_spectrogram(mel_spec, target_shape[1])
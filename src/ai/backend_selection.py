@@ -0,0 +1,156 @@
+"""
+Backend Selection
+Calibration that picks the fastest verified backend for this host
+
+Run explicitly (calibrate_backends.py), never while the app is loading.
+Every backend that can be built is timed on a single 5 s window. Its logits
+are also checked against eager PyTorch on real preprocessed clips. The
+fastest backend within tolerance wins. The result is stored per host and
+checkpoint in a JSON profile, which backend='auto' reads on startup.
+"""
+import json
+import os
+import time
+
+import numpy as np
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.thread_tuning import host_key
+
+
+BACKEND_PROFILE_PATH = "cache/backend_profile.json"
+
+CALIBRATION_REPEATS = 10
+
+# Logit agreement with eager PyTorch (same as the ONNX export parity check)
+CALIBRATION_ATOL = 1e-4
+CALIBRATION_RTOL = 1e-3
+
+# Clips used for the parity check
+CHECK_CLIPS = 16
+
+
+def checkpoint_id(checkpoint_path):
+    """Cheap identity of a checkpoint file (path, size, mtime)"""
+    stat = os.stat(checkpoint_path)
+    return f"{os.path.abspath(checkpoint_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def _time_backend(backend, batch, repeats):
+    """Median wall time in ms (after one warmup run)"""
+    backend.run(batch)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        backend.run(batch)
+        times.append((time.perf_counter() - start) * 1000)
+    return float(np.median(times))
+
+
+def _check_inputs(batches):
+    """Parity batch and timing window from real clips, random only as a fallback"""
+    if batches:
+        check_batch = np.concatenate([np.asarray(batch, dtype=np.float32) for batch in batches])[:CHECK_CLIPS]
+        return check_batch, check_batch[:1]
+
+    print("[WARNING] No calibration clips given, checking backend parity on random input "
+          "(pass real clips for a meaningful check)")
+    rng = np.random.default_rng(0)
+    check_batch = rng.standard_normal((3, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+    return check_batch, check_batch[:1]
+
+
+def calibrate_backends(builders, batches=None, repeats=CALIBRATION_REPEATS,
+                       atol=CALIBRATION_ATOL, rtol=CALIBRATION_RTOL):
+    """
+    Time and verify candidate backends
+
+    Args:
+        builders: Dict name -> callable returning a backend; the first entry
+            is the eager reference and must build
+        batches: Preprocessed clips (list of (N, 1, 128, 431) arrays, e.g. from
+            quantization.load_calibration_batches); random input if None
+        repeats: Timed runs per backend
+        atol: Absolute logit tolerance against the reference
+        rtol: Relative logit tolerance against the reference
+
+    Returns:
+        (winner name, winner backend, results dict, reason string)
+    """
+    check_batch, window = _check_inputs(batches)
+
+    reference_name = next(iter(builders))
+    reference = None
+    results, backends = {}, {}
+
+    for name, build in builders.items():
+        try:
+            backend = build()
+            logits = backend.run(check_batch)
+        except Exception as e:
+            results[name] = {'status': 'unavailable', 'detail': str(e)}
+            print(f"[INFO] Backend {name}: unavailable ({e})")
+            continue
+
+        if reference is None:
+            reference = logits
+        max_diff = float(np.abs(logits - reference).max())
+        if not np.allclose(logits, reference, atol=atol, rtol=rtol):
+            results[name] = {'status': 'mismatch', 'max_abs_diff': max_diff}
+            print(f"[WARNING] Backend {name}: outputs differ from eager (max |Δ| {max_diff:.2e}), skipped")
+            continue
+
+        median_ms = _time_backend(backend, window, repeats)
+        results[name] = {'status': 'ok', 'median_ms': median_ms, 'max_abs_diff': max_diff}
+        backends[name] = backend
+        print(f"[INFO] Backend {name}: {median_ms:.1f} ms (max |Δ| {max_diff:.2e})")
+
+    if reference_name not in backends:
+        raise RuntimeError(f"Reference backend '{reference_name}' failed: {results[reference_name]}")
+
+    winner = min(backends, key=lambda name: results[name]['median_ms'])
+    winner_ms = results[winner]['median_ms']
+    reference_ms = results[reference_name]['median_ms']
+
+    if winner == reference_name:
+        reason = f"eager PyTorch was fastest ({winner_ms:.1f} ms)"
+    else:
+        reason = (f"fastest of {len(backends)} verified backends: {winner_ms:.1f} ms vs "
+                  f"{reference_ms:.1f} ms eager ({reference_ms / winner_ms:.2f}x)")
+
+    return winner, backends[winner], results, reason
+
+
+def _read_profiles(profile_path):
+    if not os.path.exists(profile_path):
+        return {}
+    try:
+        with open(profile_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Could not read backend profile {profile_path}: {e}")
+        return {}
+
+
+def save_backend_profile(checkpoint, backend, reason, results, profile_path=BACKEND_PROFILE_PATH):
+    """Store the calibration result for this host (other hosts are kept)"""
+    profiles = _read_profiles(profile_path)
+    profiles[host_key()] = {
+        'checkpoint': checkpoint,
+        'backend': backend,
+        'reason': reason,
+        'results': results,
+        'calibrated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+    os.makedirs(os.path.dirname(profile_path) or '.', exist_ok=True)
+    with open(profile_path, 'w', encoding='utf-8') as f:
+        json.dump(profiles, f, indent=2)
+
+
+def load_backend_profile(checkpoint, profile_path=BACKEND_PROFILE_PATH):
+    """Calibration result for this host and checkpoint, or None"""
+    profile = _read_profiles(profile_path).get(host_key())
+    if profile is None or profile.get('checkpoint') != checkpoint:
+        return None
+    return profile
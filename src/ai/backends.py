@@ -0,0 +1,155 @@
+"""
+Inference Backends
+Pluggable execution backends for SoundClassifier
+
+Every backend takes a float32 batch (N, 1, 128, 431) and returns logits
+(N, num_classes) as a numpy array, so the classifier does not care which
+runtime produced them.
+
+Backends:
+    pytorch       - eager PyTorch (reference)
+    channels_last - eager PyTorch with NHWC weights and inputs
+    torchscript   - traced + frozen TorchScript graph (see torchscript.py)
+    onnxruntime   - ONNX Runtime CPU session with full graph optimization
+"""
+import threading
+
+import numpy as np
+import torch
+
+
+BACKENDS = ('pytorch', 'channels_last', 'torchscript', 'onnxruntime')
+
+# Number of distinct batch shapes kept bound in the ONNX Runtime backend
+MAX_BOUND_SHAPES = 16
+
+
+class TorchBackend:
+    """PyTorch execution (eager module or TorchScript graph)"""
+
+    def __init__(self, model, device, name='pytorch', memory_format=None, autocast_dtype=None):
+        """
+        Args:
+            model: torch.nn.Module in eval mode (or ScriptModule)
+            device: torch.device the model lives on
+            name: Backend name reported to the UI
+            memory_format: Layout inputs are converted to (e.g. torch.channels_last)
+            autocast_dtype: Run under autocast with this dtype (e.g. torch.bfloat16), None = fp32
+        """
+        self.model = model
+        self.device = device
+        self.name = name
+        self.memory_format = memory_format
+        self.autocast_dtype = autocast_dtype
+
+    def run(self, batch):
+        """
+        Run a forward pass
+
+        Args:
+            batch: numpy array or tensor (N, 1, 128, 431)
+
+        Returns:
+            numpy array of logits (N, num_classes)
+        """
+        input_tensor = torch.as_tensor(batch).float().to(self.device)
+        if self.memory_format is not None:
+            input_tensor = input_tensor.contiguous(memory_format=self.memory_format)
+        with torch.no_grad(), torch.autocast(torch.device(self.device).type, dtype=self.autocast_dtype,
+                                             enabled=self.autocast_dtype is not None):
+            outputs = self.model(input_tensor)
+        return outputs.float().cpu().numpy()
+
+
+class OnnxRuntimeBackend:
+    """
+    ONNX Runtime CPU execution
+
+    Inputs and outputs are bound to preallocated numpy buffers (one pair
+    per batch shape), so repeated calls with the same batch size do not
+    allocate on the hot path.
+    """
+
+    name = 'onnxruntime'
+
+    def __init__(self, onnx_path, intra_op_threads=0, inter_op_threads=0):
+        """
+        Args:
+            onnx_path: Path to .onnx (or .ort) model
+            intra_op_threads: Threads used inside an operator (0 = runtime default)
+            inter_op_threads: Threads used across independent operators (0 = runtime default)
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = int(intra_op_threads or 0)
+        options.inter_op_num_threads = int(inter_op_threads or 0)
+        if inter_op_threads and inter_op_threads > 1:
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+        else:
+            options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+
+        self.onnx_path = onnx_path
+        self.session = ort.InferenceSession(onnx_path, options, providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_name = self.session.get_outputs()[0].name
+        self.intra_op_threads = options.intra_op_num_threads
+        self.inter_op_threads = options.inter_op_num_threads
+
+        output_shape = self.session.get_outputs()[0].shape
+        self.num_classes = output_shape[-1] if isinstance(output_shape[-1], int) else None
+
+        self._bindings = {}
+        self._lock = threading.Lock()
+
+    def _get_binding(self, shape):
+        """IO binding plus input/output buffers for a batch shape"""
+        entry = self._bindings.get(shape)
+        if entry is not None:
+            return entry
+
+        if self.num_classes is None:
+            # Symbolic output dim: run once to discover it
+            probe = np.zeros(shape, dtype=np.float32)
+            self.num_classes = self.session.run([self.output_name], {self.input_name: probe})[0].shape[-1]
+
+        if len(self._bindings) >= MAX_BOUND_SHAPES:
+            self._bindings.clear()
+
+        input_buffer = np.empty(shape, dtype=np.float32)
+        output_buffer = np.empty((shape[0], self.num_classes), dtype=np.float32)
+
+        binding = self.session.io_binding()
+        binding.bind_input(self.input_name, 'cpu', 0, np.float32, input_buffer.shape, input_buffer.ctypes.data)
+        binding.bind_output(self.output_name, 'cpu', 0, np.float32, output_buffer.shape, output_buffer.ctypes.data)
+
+        entry = (binding, input_buffer, output_buffer)
+        self._bindings[shape] = entry
+        return entry
+
+    def run(self, batch):
+        """
+        Run a forward pass
+
+        Args:
+            batch: numpy array or tensor (N, 1, 128, 431)
+
+        Returns:
+            numpy array of logits (N, num_classes)
+        """
+        if isinstance(batch, torch.Tensor):
+            batch = batch.detach().cpu().numpy()
+
+        with self._lock:
+            binding, input_buffer, output_buffer = self._get_binding(tuple(batch.shape))
+            np.copyto(input_buffer, batch, casting='unsafe')
+            self.session.run_with_iobinding(binding)
+            return output_buffer.copy()
+
+
+def channels_last_backend(model, device):
+    """TorchBackend running the model (converted in place) in NHWC layout"""
+    model = model.to(memory_format=torch.channels_last)
+    return TorchBackend(model, device, name='channels_last', memory_format=torch.channels_last)
+
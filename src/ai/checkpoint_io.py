@@ -0,0 +1,114 @@
+"""
+Checkpoint I/O
+Fast, mmap-based checkpoint format for SoundClassifier
+
+A training .pth is converted once into a .safetensors file with normalized
+keys (no 'module.' prefix, no wrapper dict). Loading maps the file
+into memory and hands the tensors straight to a model built on the meta
+device (load_state_dict(assign=True)), so the weights exist once in RAM
+instead of twice.
+"""
+import os
+
+import torch
+
+
+SAFETENSORS_EXT = '.safetensors'
+
+
+def safetensors_available():
+    """True if the safetensors package is installed"""
+    try:
+        import safetensors  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def converted_path(checkpoint_path):
+    """models/x.pth -> models/x.safetensors"""
+    return os.path.splitext(checkpoint_path)[0] + SAFETENSORS_EXT
+
+
+def resolve_checkpoint_path(checkpoint_path):
+    """
+    Prefer an up-to-date converted .safetensors next to a .pth
+
+    Args:
+        checkpoint_path: Configured checkpoint path
+
+    Returns:
+        Path to load
+    """
+    if checkpoint_path.endswith(SAFETENSORS_EXT) or not safetensors_available():
+        return checkpoint_path
+
+    fast_path = converted_path(checkpoint_path)
+    if os.path.exists(fast_path) and (
+        not os.path.exists(checkpoint_path)
+        or os.path.getmtime(fast_path) >= os.path.getmtime(checkpoint_path)
+    ):
+        return fast_path
+    return checkpoint_path
+
+
+def load_safetensors(path):
+    """
+    Memory-map a .safetensors checkpoint
+
+    Args:
+        path: .safetensors file
+
+    Returns:
+        (state_dict, metadata) - metadata is the string dict stored in the header
+    """
+    from safetensors import safe_open
+    from safetensors.torch import load_file
+
+    with safe_open(path, framework='pt') as f:
+        metadata = f.metadata() or {}
+    return load_file(path, device='cpu'), metadata
+
+
+def convert_to_safetensors(checkpoint_path, output_path=None):
+    """
+    One-time conversion of a .pth checkpoint
+
+    Args:
+        checkpoint_path: Source .pth (any format load_checkpoint() understands)
+        output_path: Destination (default: same name with .safetensors)
+
+    Returns:
+        Output path
+
+    Raises:
+        ValueError: For checkpoints that safetensors cannot represent (quantized)
+    """
+    from safetensors.torch import save_file
+    from src.ai.model_handler import load_checkpoint
+
+    output_path = output_path or converted_path(checkpoint_path)
+    state_dict, metadata = load_checkpoint(checkpoint_path)
+
+    if metadata:
+        raise ValueError(
+            f"{checkpoint_path} carries {sorted(metadata)} metadata; "
+            "keep it as .pth (packed quantized weights are not plain tensors)"
+        )
+
+    tensors = {key: value.contiguous() for key, value in state_dict.items()}
+    save_file(tensors, output_path, metadata={
+        'format': 'pt',
+        'architecture': 'convnext_tiny',
+        'source': os.path.basename(checkpoint_path),
+    })
+
+    # Verify the round trip before anyone relies on it
+    reloaded, _ = load_safetensors(output_path)
+    if reloaded.keys() != tensors.keys() or any(
+        not torch.equal(reloaded[key], tensors[key]) for key in tensors
+    ):
+        os.remove(output_path)
+        raise ValueError(f"Round-trip check failed for {output_path}")
+
+    return output_path
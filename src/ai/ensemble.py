@@ -0,0 +1,175 @@
+"""
+Ensembles and Test-Time Augmentation
+Several time-shifted crops and/or several checkpoints in one batched pass
+
+All TTA variants of a clip go into one batch, and each model runs a single
+forward over that batch. Models sharing the architecture can be stacked with
+torch.func (stack_module_state + vmap) into one vectorized call, with a
+plain loop as fallback. Stacking is opt-in: on CPU, vmap turns the convs
+into grouped convs and the loop measured faster (benchmark_ensemble.py).
+Logits are averaged over models and variants before the softmax.
+"""
+import copy
+
+import numpy as np
+import torch
+
+from src.ai.audio_config import SR, HOP_LENGTH
+
+
+class EnsembleSpec:
+    """
+    What to run for one ensemble prediction
+
+    Attributes:
+        checkpoints: Extra checkpoint paths (e.g. other CV folds)
+        time_shifts: Crop offsets in seconds; each adds one TTA variant
+        include_base: Include the classifier's own model
+        stack_weights: Vectorize same-architecture models with vmap
+    """
+
+    def __init__(self, checkpoints=(), time_shifts=(0.0,), include_base=True, stack_weights=False):
+        self.checkpoints = tuple(checkpoints)
+        self.time_shifts = tuple(time_shifts) or (0.0,)
+        self.include_base = include_base
+        self.stack_weights = stack_weights
+
+    @property
+    def models_key(self):
+        """Identifies the set of models (for caching loaded members)"""
+        return (self.checkpoints, self.include_base, self.stack_weights)
+
+    def __repr__(self):
+        return (f"EnsembleSpec(checkpoints={len(self.checkpoints)}, "
+                f"time_shifts={self.time_shifts}, include_base={self.include_base})")
+
+
+def shift_to_frames(seconds):
+    """Crop offset in seconds -> spectrogram frames"""
+    return int(round(seconds * SR / HOP_LENGTH))
+
+
+def build_tta_batch(preprocessed_input, time_shifts):
+    """
+    Time-shifted variants of one model input
+
+    Shifts are circular along the time axis, so every variant keeps the
+    full 5 s of content and the model input shape.
+
+    Args:
+        preprocessed_input: (1, 1, 128, T) numpy array or tensor
+        time_shifts: Offsets in seconds
+
+    Returns:
+        numpy array (len(time_shifts), 1, 128, T) float32
+    """
+    if isinstance(preprocessed_input, torch.Tensor):
+        preprocessed_input = preprocessed_input.detach().cpu().numpy()
+    clip = np.asarray(preprocessed_input, dtype=np.float32).reshape(1, *np.shape(preprocessed_input)[-2:])
+
+    variants = [np.roll(clip, shift_to_frames(shift), axis=-1) for shift in time_shifts]
+    return np.stack(variants)
+
+
+class StackedModels:
+    """Same-architecture models run as one vectorized forward (loop fallback)"""
+
+    def __init__(self, models, device, vectorize=True):
+        self.models = models
+        self.device = device
+        self.vectorized = False
+
+        if vectorize and len(models) > 1:
+            try:
+                from torch.func import stack_module_state, functional_call
+
+                self._params, self._buffers = stack_module_state(models)
+                skeleton = copy.deepcopy(models[0]).to('meta')
+
+                def forward(params, buffers, x):
+                    return functional_call(skeleton, (params, buffers), (x,))
+
+                self._forward = torch.vmap(forward, in_dims=(0, 0, None))
+                self.vectorized = True
+            except Exception as e:
+                print(f"[WARNING] Weight stacking unavailable, looping over models: {e}")
+
+    def __len__(self):
+        return len(self.models)
+
+    def run(self, batch):
+        """
+        Args:
+            batch: numpy array (N, 1, 128, T)
+
+        Returns:
+            numpy logits (num_models, N, num_classes)
+        """
+        input_tensor = torch.as_tensor(batch).float().to(self.device)
+        with torch.no_grad():
+            if self.vectorized:
+                try:
+                    return self._forward(self._params, self._buffers, input_tensor).float().cpu().numpy()
+                except Exception as e:
+                    print(f"[WARNING] Vectorized ensemble failed, looping over models: {e}")
+                    self.vectorized = False
+            return torch.stack([model(input_tensor) for model in self.models]).float().cpu().numpy()
+
+
+class EnsembleRunner:
+    """All members of an ensemble; run() gives per-model logits for a batch"""
+
+    def __init__(self, stacked=None, backends=()):
+        """
+        Args:
+            stacked: StackedModels of torch members (or None)
+            backends: Other members as inference backends (e.g. ONNX Runtime base model)
+        """
+        self.stacked = stacked
+        self.backends = list(backends)
+
+    @property
+    def num_models(self):
+        return (len(self.stacked) if self.stacked else 0) + len(self.backends)
+
+    def run(self, batch):
+        """
+        Args:
+            batch: numpy array (N, 1, 128, T)
+
+        Returns:
+            numpy logits (num_models, N, num_classes)
+        """
+        outputs = []
+        if self.stacked is not None:
+            outputs.append(self.stacked.run(batch))
+        for backend in self.backends:
+            outputs.append(backend.run(batch)[None])
+        return np.concatenate(outputs, axis=0)
+
+
+def build_ensemble(spec, base_model, base_backend, device, load_member):
+    """
+    Assemble the members described by a spec
+
+    Args:
+        spec: EnsembleSpec
+        base_model: Classifier's eager model (None for non-torch backends)
+        base_backend: Classifier's backend
+        device: torch device for the extra checkpoints
+        load_member: checkpoint path -> eager torch model
+
+    Returns:
+        EnsembleRunner
+    """
+    models = [load_member(path) for path in spec.checkpoints]
+    backends = []
+
+    if spec.include_base:
+        if base_model is not None and base_backend.name == 'pytorch':
+            models.insert(0, base_model)
+        else:
+            backends.append(base_backend)
+
+    stacked = StackedModels(models, device, spec.stack_weights) if models else None
+    return EnsembleRunner(stacked, backends)
@@ -0,0 +1,63 @@
+"""
+Evaluation Helpers
+Latency and agreement measurements shared by the model-variant tools
+
+Kept free of audio decoding and quantization imports, so the classifier
+can use them at startup without loading either stack.
+"""
+import os
+import time
+
+import numpy as np
+
+
+def softmax(logits):
+    """Numerically stable softmax over the last axis"""
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def measure_latency(run, batch, repeats=5):
+    """Best-of-N wall time of run(batch) in ms (after one warmup call)"""
+    run(batch)
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run(batch)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def compare_to_reference(reference_run, candidate_run, batches):
+    """
+    Top-1 agreement and probability drift of a candidate against a reference model
+
+    Args:
+        reference_run: batch -> logits (e.g. the float model)
+        candidate_run: batch -> logits (quantized / pruned / bf16 variant)
+        batches: List of numpy inputs
+
+    Returns:
+        dict with 'top1_agreement' (%), 'max_prob_diff', 'clips'
+    """
+    agree = 0
+    total = 0
+    max_diff = 0.0
+    for batch in batches:
+        reference = softmax(reference_run(batch))
+        candidate = softmax(candidate_run(batch))
+        agree += int((reference.argmax(axis=1) == candidate.argmax(axis=1)).sum())
+        total += len(batch)
+        max_diff = max(max_diff, float(np.abs(reference - candidate).max()))
+
+    return {
+        'top1_agreement': 100.0 * agree / max(total, 1),
+        'max_prob_diff': max_diff,
+        'clips': total,
+    }
+
+
+def file_size_mb(path):
+    """Size of a model file in MB"""
+    return os.path.getsize(path) / (1024 * 1024)
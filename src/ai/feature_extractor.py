@@ -0,0 +1,225 @@
+"""
+Feature Extractor Module
+Cached Mel-Spectrogram front end - EXACT MATCH với code Kaggle
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+import torchaudio.functional as AF
+import torchaudio.transforms as T
+
+from src.ai.audio_config import SR, N_MELS, N_FFT, HOP_LENGTH, TOP_DB, FIXED_WIDTH
+
+
+# Number of (sr, n_fft, hop, n_mels, device) front ends kept alive
+EXTRACTOR_CACHE_SIZE = 8
+
+
+class FeatureExtractor:
+    """
+    Mel-Spectrogram + AmplitudeToDB front end built once and reused
+
+    The mel filterbank and STFT window are created in __init__, so calling
+    the extractor only runs the transforms themselves.
+    """
+
+    def __init__(self, sample_rate=SR, n_fft=N_FFT, hop_length=HOP_LENGTH, n_mels=N_MELS, device='cpu'):
+        """
+        Build the transforms
+
+        Args:
+            sample_rate: Sample rate of the incoming waveform
+            n_fft: FFT size
+            hop_length: Hop between STFT frames
+            n_mels: Number of mel bands
+            device: torch device ('cpu' or 'cuda')
+        """
+        self.sample_rate = sample_rate
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.n_mels = n_mels
+        self.device = torch.device(device)
+
+        self.mel_spec = T.MelSpectrogram(
+            sample_rate=sample_rate,
+            n_fft=n_fft,
+            hop_length=hop_length,
+            n_mels=n_mels
+        ).to(self.device)
+
+        self.db_trans = T.AmplitudeToDB(top_db=TOP_DB).to(self.device)
+
+        # Same transform without internal padding: the batch path applies the
+        # reflect padding per item so clips of different length can be stacked
+        self.mel_spec_uncentered = T.MelSpectrogram(
+            sample_rate=sample_rate,
+            n_fft=n_fft,
+            hop_length=hop_length,
+            n_mels=n_mels,
+            center=False
+        ).to(self.device)
+
+    def mel_db(self, waveform):
+        """
+        Compute the dB-scaled mel-spectrogram
+
+        Args:
+            waveform: Mono waveform tensor (1, samples) or numpy array (samples,)
+
+        Returns:
+            Mel-spectrogram in dB on CPU (n_mels, frames)
+        """
+        if isinstance(waveform, np.ndarray):
+            waveform = torch.from_numpy(waveform)
+        if waveform.ndim == 1:
+            waveform = waveform.unsqueeze(0)
+
+        with torch.no_grad():
+            return self.db_trans(self.mel_spec(waveform.to(self.device))).cpu().squeeze(0)
+
+    def __call__(self, waveform, fixed_width=FIXED_WIDTH):
+        """
+        Run the full Kaggle preprocessing chain on a mono waveform
+
+        Args:
+            waveform: Mono waveform already at self.sample_rate
+            fixed_width: Number of time frames fed to the model
+
+        Returns:
+            preprocessed: numpy array ready for model (1, 1, n_mels, fixed_width)
+            spec_for_display: Mel-spectrogram for visualization (before normalization)
+        """
+        spec = self.mel_db(waveform)
+        return normalize_spectrogram(spec, fixed_width), spec.clone()
+
+    def preprocess_batch(self, waveforms, fixed_width=FIXED_WIDTH):
+        """
+        Run the Kaggle preprocessing chain over several clips at once
+
+        Each clip is reflect-padded like torch.stft(center=True), zero-padded to
+        the longest clip and stacked, so STFT and mel run once for the whole
+        batch. dB clamping and z-score statistics are masked to each clip's own
+        frames, which gives the same result as calling the extractor per clip.
+
+        Args:
+            waveforms: List of mono waveforms (1, samples) at self.sample_rate
+            fixed_width: Number of time frames fed to the model
+
+        Returns:
+            batch: Contiguous numpy array (N, 1, n_mels, fixed_width) float32
+            specs_for_display: List of per-clip mel-spectrograms in dB (before normalization)
+        """
+        if not waveforms:
+            return np.zeros((0, 1, self.n_mels, fixed_width), dtype=np.float32), []
+
+        pad = self.n_fft // 2
+        lengths = [w.shape[-1] for w in waveforms]
+        num_frames = torch.tensor([1 + length // self.hop_length for length in lengths], device=self.device)
+
+        stacked = torch.zeros(len(waveforms), max(lengths) + 2 * pad)
+        for i, waveform in enumerate(waveforms):
+            padded = F.pad(waveform.reshape(1, 1, -1).float(), (pad, pad), mode='reflect')
+            stacked[i, :lengths[i] + 2 * pad] = padded.reshape(-1)
+
+        with torch.no_grad():
+            power = self.mel_spec_uncentered(stacked.to(self.device))  # (N, n_mels, frames)
+
+            valid = torch.arange(power.shape[-1], device=self.device)[None, :] < num_frames[:, None]
+            mask = valid[:, None, :]
+
+            # AmplitudeToDB with top_db taken from each clip's own peak
+            spec = AF.amplitude_to_DB(
+                power, self.db_trans.multiplier, self.db_trans.amin, self.db_trans.db_multiplier, None
+            )
+            peak = spec.masked_fill(~mask, torch.finfo(spec.dtype).min).amax(dim=(1, 2))
+            spec = torch.max(spec, (peak - TOP_DB)[:, None, None])
+
+            # Z-score over valid frames only (unbiased std, like Tensor.std)
+            count = (num_frames * self.n_mels).double()
+            spec64 = spec.double().masked_fill(~mask, 0.0)
+            mean = spec64.sum(dim=(1, 2)) / count
+            centered = (spec64 - mean[:, None, None]).masked_fill(~mask, 0.0)
+            std = torch.sqrt((centered ** 2).sum(dim=(1, 2)) / (count - 1))
+
+            normalized = (spec - mean[:, None, None].float()) / (std[:, None, None].float() + 1e-6)
+            normalized = normalized.masked_fill(~mask, 0.0)
+
+            if normalized.shape[-1] < fixed_width:
+                normalized = F.pad(normalized, (0, fixed_width - normalized.shape[-1]))
+            else:
+                normalized = normalized[:, :, :fixed_width]
+
+            batch = np.ascontiguousarray(normalized.unsqueeze(1).cpu().numpy(), dtype=np.float32)
+
+        spec = spec.cpu()
+        specs_for_display = [spec[i, :, :int(num_frames[i])].clone() for i in range(len(waveforms))]
+
+        return batch, specs_for_display
+
+
+def normalize_spectrogram(spec, fixed_width=FIXED_WIDTH):
+    """
+    Z-score normalize and pad/crop a dB spectrogram (EXACTLY like Kaggle)
+
+    Args:
+        spec: Mel-spectrogram in dB (n_mels, frames), tensor or numpy array
+        fixed_width: Number of time frames fed to the model
+
+    Returns:
+        numpy array (1, 1, n_mels, fixed_width) float32
+    """
+    if isinstance(spec, np.ndarray):
+        spec = torch.from_numpy(spec)
+
+    with torch.no_grad():
+        spec = (spec - spec.mean()) / (spec.std() + 1e-6)
+
+        if spec.shape[1] < fixed_width:
+            spec = F.pad(spec, (0, fixed_width - spec.shape[1]))
+        else:
+            spec = spec[:, :fixed_width]
+
+        return spec.unsqueeze(0).unsqueeze(0).numpy().astype(np.float32)
+
+
+_extractor_cache = OrderedDict()
+_extractor_cache_lock = threading.Lock()
+
+
+def get_feature_extractor(sample_rate=SR, n_fft=N_FFT, hop_length=HOP_LENGTH, n_mels=N_MELS, device='cpu'):
+    """
+    Get a shared FeatureExtractor from the LRU cache
+
+    Args:
+        sample_rate: Sample rate of the incoming waveform
+        n_fft: FFT size
+        hop_length: Hop between STFT frames
+        n_mels: Number of mel bands
+        device: torch device ('cpu' or 'cuda')
+
+    Returns:
+        FeatureExtractor instance
+    """
+    key = (int(sample_rate), int(n_fft), int(hop_length), int(n_mels), str(torch.device(device)))
+
+    with _extractor_cache_lock:
+        extractor = _extractor_cache.get(key)
+        if extractor is not None:
+            _extractor_cache.move_to_end(key)
+            return extractor
+
+        extractor = FeatureExtractor(*key)
+        _extractor_cache[key] = extractor
+        if len(_extractor_cache) > EXTRACTOR_CACHE_SIZE:
+            _extractor_cache.popitem(last=False)
+
+    return extractor
+
+
+def clear_feature_extractor_cache():
+    """Drop all cached front ends"""
+    with _extractor_cache_lock:
+        _extractor_cache.clear()
@@ -0,0 +1,254 @@
+"""
+Inference Engine
+Dynamic micro-batching in front of SoundClassifier
+
+Callers submit single inputs from any thread. A worker thread collects
+requests until max_batch_size is reached or max_wait_ms has passed since
+the first one arrived, runs one forward pass for the whole group and
+resolves each caller's future with its own probability vector.
+"""
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+import torch
+
+from src.ai.model_handler import ClassificationResult, mock_prediction
+
+
+# Latencies kept for the percentile counters
+LATENCY_WINDOW = 1000
+
+
+class _Request:
+    __slots__ = ('input', 'future', 'submitted')
+
+    def __init__(self, preprocessed):
+        self.input = preprocessed
+        self.future = Future()
+        self.submitted = time.perf_counter()
+
+
+class InferenceEngine:
+    """
+    Micro-batching wrapper with the same prediction API as SoundClassifier
+
+    Attributes not defined here (classes, use_mock, model_key,
+    result_from_probs, ...) are forwarded to the wrapped classifier, so the
+    engine can be passed to the views in place of the classifier.
+    """
+
+    def __init__(self, classifier, max_batch_size=8, max_wait_ms=5.0):
+        """
+        Initialize the engine (the worker starts on first use)
+
+        Args:
+            classifier: SoundClassifier, or a Future resolving to one (see ModelLoader)
+            max_batch_size: Largest batch sent to the model
+            max_wait_ms: How long the first request in a batch may wait for company
+        """
+        if not isinstance(classifier, Future):
+            loaded = Future()
+            loaded.set_result(classifier)
+            classifier = loaded
+        self._classifier_future = classifier
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue = queue.Queue()
+        self._worker = None
+        self._running = False
+        self._start_lock = threading.Lock()
+
+        # Counters
+        self._stats_lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.batches = 0
+        self.busy_time = 0.0
+
+    @property
+    def classifier(self):
+        """The wrapped classifier (blocks while it is still loading)"""
+        return self._classifier_future.result()
+
+    @property
+    def is_ready(self):
+        """False while the model is still loading in the background (or if loading failed)"""
+        return self._classifier_future.done() and self._classifier_future.exception() is None
+
+    def wait_until_ready(self, timeout=None):
+        """Block until the classifier is loaded"""
+        self._classifier_future.result(timeout=timeout)
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the engine itself
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.classifier, name)
+
+    def start(self):
+        """Start the worker thread"""
+        with self._start_lock:
+            if self._running:
+                return
+            self._running = True
+            self._worker = threading.Thread(target=self._run, daemon=True, name="inference-engine")
+            self._worker.start()
+
+    def stop(self, timeout=2.0):
+        """Stop the worker thread (pending requests are still served)"""
+        with self._start_lock:
+            if not self._running:
+                return
+            self._running = False
+        self._queue.put(None)
+        self._worker.join(timeout=timeout)
+        self._worker = None
+
+    def submit(self, preprocessed_input):
+        """
+        Queue one input
+
+        Args:
+            preprocessed_input: numpy array or tensor (1, 1, 128, T) or (1, 128, T)
+
+        Returns:
+            Future resolving to a probability vector (num_classes,)
+        """
+        if not self._running:
+            self.start()
+
+        if isinstance(preprocessed_input, torch.Tensor):
+            preprocessed_input = preprocessed_input.detach().cpu().numpy()
+        preprocessed_input = np.asarray(preprocessed_input, dtype=np.float32)
+        if preprocessed_input.ndim == 4:
+            preprocessed_input = preprocessed_input[0]
+
+        request = _Request(preprocessed_input)
+        self._queue.put(request)
+        return request.future
+
+    def classify(self, preprocessed_input, k=5):
+        """
+        Drop-in for SoundClassifier.classify (blocks until the batch ran)
+
+        Returns:
+            ClassificationResult
+        """
+        try:
+            classifier = self.classifier
+        except Exception as e:
+            print(f"[ERROR] Prediction error: model unavailable ({e})")
+            return ClassificationResult.from_mock(mock_prediction())
+
+        if classifier.use_mock:
+            return classifier.classify(preprocessed_input, k)
+
+        try:
+            key = classifier.memo.key(preprocessed_input)
+            probabilities = classifier.memo.get(key)
+            if probabilities is None:
+                probabilities = self.submit(preprocessed_input).result()
+                classifier.memo.put(key, probabilities)
+        except Exception as e:
+            print(f"[ERROR] Prediction error: {e}")
+            return ClassificationResult.from_mock(mock_prediction())
+        return ClassificationResult(probabilities, classifier.classes, k)
+
+    def predict(self, preprocessed_input):
+        """Drop-in for SoundClassifier.predict"""
+        return self.classify(preprocessed_input).to_dict()
+
+    def get_top_k_predictions(self, preprocessed_input, k=5):
+        """Drop-in for SoundClassifier.get_top_k_predictions"""
+        return self.classify(preprocessed_input, k).top_k
+
+    def _collect(self, first):
+        """Gather requests until the batch is full or the wait budget is spent"""
+        batch = [first]
+        deadline = first.submitted + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=max(remaining, 0)) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # Stop sentinel: serve what we have, then exit
+                self._queue.put(None)
+                break
+            batch.append(request)
+
+        return batch
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                if not self._running:
+                    return
+                continue
+
+            requests = self._collect(first)
+
+            # Group by input shape (different time widths cannot be stacked)
+            groups = {}
+            for request in requests:
+                groups.setdefault(request.input.shape, []).append(request)
+
+            for group in groups.values():
+                self._run_group(group)
+
+    def _run_group(self, group):
+        """One forward pass for a group of same-shaped requests"""
+        start = time.perf_counter()
+        try:
+            batch = np.stack([request.input for request in group])
+            probabilities = self.classifier.predict_batch(batch)
+        except Exception as e:
+            for request in group:
+                request.future.set_exception(e)
+            return
+
+        finished = time.perf_counter()
+        for request, probs in zip(group, probabilities):
+            request.future.set_result(probs)
+
+        with self._stats_lock:
+            self.requests += len(group)
+            self.batches += 1
+            self.busy_time += finished - start
+            self._latencies.extend(finished - request.submitted for request in group)
+
+    def get_stats(self):
+        """
+        Throughput / latency counters
+
+        Returns:
+            dict with 'requests', 'batches', 'avg_batch_size', 'throughput'
+            (samples/s of model time), 'latency_avg_ms', 'latency_p95_ms'
+        """
+        with self._stats_lock:
+            latencies = np.array(self._latencies) * 1000 if self._latencies else np.zeros(1)
+            return {
+                'requests': self.requests,
+                'batches': self.batches,
+                'avg_batch_size': self.requests / self.batches if self.batches else 0.0,
+                'throughput': self.requests / self.busy_time if self.busy_time else 0.0,
+                'latency_avg_ms': float(latencies.mean()),
+                'latency_p95_ms': float(np.percentile(latencies, 95)),
+            }
+
+    def reset_stats(self):
+        """Reset the counters"""
+        with self._stats_lock:
+            self._latencies.clear()
+            self.requests = 0
+            self.batches = 0
+            self.busy_time = 0.0
@@ -0,0 +1,116 @@
+"""
+Long Recording Analysis
+Sliding 5 s windows over arbitrarily long files with bounded memory
+"""
+import math
+
+import torch
+
+from src.ai.audio_config import SR, N_FFT, HOP_LENGTH, N_MELS, FIXED_WIDTH, CLIP_SECONDS
+from src.ai.audio_processor import get_audio_info, iter_audio_blocks
+from src.ai.feature_extractor import get_feature_extractor
+
+
+# Tail windows shorter than this are dropped (too little audio to classify)
+MIN_WINDOW_SECONDS = 0.5
+
+# Length of the sequential decode blocks windows are sliced from
+DECODE_BLOCK_SECONDS = 60.0
+
+
+def window_starts(duration, window_seconds=CLIP_SECONDS, hop_seconds=CLIP_SECONDS / 2):
+    """
+    Start times of the analysis windows
+
+    Args:
+        duration: File length in seconds
+        window_seconds: Window length
+        hop_seconds: Distance between window starts
+
+    Returns:
+        List of start times in seconds
+    """
+    if hop_seconds <= 0:
+        raise ValueError(f"hop_seconds must be positive, got {hop_seconds}")
+
+    starts = []
+    count = max(1, int(math.ceil(max(duration - window_seconds, 0) / hop_seconds)) + 1)
+    for i in range(count):
+        start = i * hop_seconds
+        if i > 0 and duration - start < MIN_WINDOW_SECONDS:
+            break
+        starts.append(start)
+    return starts
+
+
+def iter_window_detections(file_path, classifier, window_seconds=CLIP_SECONDS, hop_seconds=CLIP_SECONDS / 2,
+                           batch_size=8, top_k=3, device='cpu'):
+    """
+    Classify a long recording window by window
+
+    The file is decoded once, front to back, in DECODE_BLOCK_SECONDS blocks;
+    overlapping windows are sliced from that buffer. Memory stays bounded by
+    one block plus one batch of windows regardless of file length.
+
+    Args:
+        file_path: Path to audio file
+        classifier: SoundClassifier
+        window_seconds: Window length fed to the model
+        hop_seconds: Distance between window starts (< window = overlap)
+        batch_size: Windows per forward pass
+        top_k: Number of predictions kept per window
+        device: torch device for the mel front end
+
+    Yields:
+        dict with 'index', 'start', 'end', 'label', 'confidence', 'icon',
+        'is_alert', 'top_k' and 'total' (number of windows)
+    """
+    num_frames, sr = get_audio_info(file_path)
+    if num_frames <= 0:
+        print(f"[ERROR] No audio samples in {file_path}")
+        raise ValueError(f"No audio samples in {file_path}")
+    duration = num_frames / sr
+    starts = window_starts(duration, window_seconds, hop_seconds)
+    extractor = get_feature_extractor(SR, N_FFT, HOP_LENGTH, N_MELS, device)
+    window_samples = int(round(window_seconds * SR))
+
+    blocks = iter_audio_blocks(file_path, DECODE_BLOCK_SECONDS)
+    buffer = torch.zeros(1, 0)
+    buffer_start = 0  # Sample index (at SR) of buffer[:, 0]
+    exhausted = False
+
+    for batch_start in range(0, len(starts), batch_size):
+        batch_starts = starts[batch_start:batch_start + batch_size]
+        first = int(round(batch_starts[0] * SR))
+        last = int(round(batch_starts[-1] * SR)) + window_samples
+
+        # Drop audio no later window needs, then read on until the batch is covered
+        drop = min(max(first - buffer_start, 0), buffer.shape[1])
+        buffer = buffer[:, drop:]
+        buffer_start += drop
+        while not exhausted and buffer_start + buffer.shape[1] < last:
+            block = next(blocks, None)
+            if block is None:
+                exhausted = True
+            else:
+                buffer = torch.cat((buffer, block), dim=1)
+
+        waveforms = []
+        for start in batch_starts:
+            offset = int(round(start * SR)) - buffer_start
+            waveforms.append(buffer[:, offset:offset + window_samples])
+
+        batch, _ = extractor.preprocess_batch(waveforms, FIXED_WIDTH)
+        probs = classifier.predict_batch(batch)
+
+        for offset, (start, p) in enumerate(zip(batch_starts, probs)):
+            detection = classifier.result_from_probs(p)
+            detection.pop('all_probs', None)
+            detection.update({
+                'index': batch_start + offset,
+                'start': start,
+                'end': min(start + window_seconds, duration),
+                'top_k': classifier.top_k_from_probs(p, top_k),
+                'total': len(starts),
+            })
+            yield detection
@@ -1,13 +1,28 @@
 """
 Sound Classification Model Handler
-Handles PyTorch model loading and inference (using .pth directly)
+Handles model loading and inference (PyTorch .pth or ONNX Runtime, see backends.py)
 """
+import copy
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 import numpy as np
 import torch
 import torch.nn as nn
 from pathlib import Path
 from src.utils.performance_metrics import performance_metrics
+from src.utils.hashing import hash_file
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.checkpoint_io import SAFETENSORS_EXT, load_safetensors, resolve_checkpoint_path
+from src.ai.thread_tuning import apply_thread_settings
+from src.ai.pruning import count_parameters
+from src.ai.precision import PRECISIONS, BF16_MIN_AGREEMENT, REFERENCE_STORE_PATH, bf16_supported, check_bf16, load_reference_batches
+from src.ai.ensemble import EnsembleSpec, build_ensemble, build_tta_batch
+from src.ai.backends import BACKENDS, TorchBackend, OnnxRuntimeBackend, channels_last_backend
+from src.ai.evaluation import softmax
+from src.ai.backend_selection import CALIBRATION_REPEATS, calibrate_backends, checkpoint_id, load_backend_profile, save_backend_profile
 
 
 # ESC-50 Dataset Classes (50 environmental sounds)
@@ -26,6 +41,21 @@ ESC50_CLASSES = [
     "train", "vacuum_cleaner", "washing_machine", "water_drops", "wind"
 ]
 
+# Target numbering of the ESC-50 dataset itself (esc50.csv 'target', last
+# field of <fold>-<clip id>-<take>-<target>.wav); differs from ESC50_CLASSES
+ESC50_TARGET_ORDER = [
+    "dog", "rooster", "pig", "cow", "frog",
+    "cat", "hen", "insects", "sheep", "crow",
+    "rain", "sea_waves", "crackling_fire", "crickets", "chirping_birds",
+    "water_drops", "wind", "pouring_water", "toilet_flush", "thunderstorm",
+    "crying_baby", "sneezing", "clapping", "breathing", "coughing",
+    "footsteps", "laughing", "brushing_teeth", "snoring", "drinking_sipping",
+    "door_wood_knock", "mouse_click", "keyboard_typing", "door_wood_creaks", "can_opening",
+    "washing_machine", "vacuum_cleaner", "clock_alarm", "clock_tick", "glass_breaking",
+    "helicopter", "chainsaw", "siren", "car_horn", "engine",
+    "train", "church_bells", "airplane", "fireworks", "hand_saw"
+]
+
 # Icons mapping for each sound class
 SOUND_ICONS = {
     "dog": "🐕", "rooster": "🐓", "pig": "🐷", "cow": "🐄", "frog": "🐸",
@@ -44,73 +74,587 @@ SOUND_ICONS = {
 ALERT_SOUNDS = ["siren", "car_horn", "glass_breaking", "clock_alarm", "crying_baby", "fireworks"]
 
 
+def create_model(num_classes=len(ESC50_CLASSES)):
+    """
+    Build the served architecture (timm ConvNeXt-Tiny, 1 input channel)
+    
+    Args:
+        num_classes: Number of output classes
+    
+    Returns:
+        Untrained torch.nn.Module
+    """
+    import timm
+    
+    return timm.create_model('convnext_tiny', pretrained=False, num_classes=num_classes, in_chans=1)
+
+
+# Top-level checkpoint entries describing how to rebuild the model
+CHECKPOINT_METADATA_KEYS = ('quantization', 'pruning')
+
+
+def load_checkpoint(checkpoint_path, map_location='cpu', mmap=False):
+    """
+    Read a checkpoint and return a clean state dict plus its metadata
+    
+    Handles raw state dicts, {'model_state_dict': ...} / {'state_dict': ...}
+    wrappers and the 'module.' prefix added by DataParallel.
+    
+    Args:
+        checkpoint_path: Path to .pth file
+        map_location: Device to map tensors to
+        mmap: Memory-map the file instead of reading it (zipfile checkpoints only)
+    
+    Returns:
+        (state_dict, metadata) - metadata holds CHECKPOINT_METADATA_KEYS entries
+    """
+    if mmap:
+        try:
+            checkpoint = torch.load(checkpoint_path, map_location=map_location, mmap=True)
+        except RuntimeError:
+            # Legacy (non-zip) serialization cannot be mapped
+            checkpoint = torch.load(checkpoint_path, map_location=map_location)
+    else:
+        checkpoint = torch.load(checkpoint_path, map_location=map_location)
+    metadata = {}
+    
+    # Handle different checkpoint formats
+    if isinstance(checkpoint, dict):
+        if 'model_state_dict' in checkpoint:
+            state_dict = checkpoint['model_state_dict']
+        elif 'state_dict' in checkpoint:
+            state_dict = checkpoint['state_dict']
+        else:
+            state_dict = checkpoint
+        
+        if state_dict is not checkpoint:
+            metadata = {key: checkpoint[key] for key in CHECKPOINT_METADATA_KEYS if key in checkpoint}
+    else:
+        state_dict = checkpoint
+    
+    # Remove 'module.' prefix if present (from DataParallel)
+    new_state_dict = OrderedDict()
+    for key, value in state_dict.items():
+        if key.startswith('module.'):
+            new_state_dict[key[7:]] = value
+        else:
+            new_state_dict[key] = value
+    
+    # Keep per-module version info (quantized modules need it to load)
+    module_versions = getattr(state_dict, '_metadata', None)
+    if module_versions is not None:
+        new_state_dict._metadata = OrderedDict(
+            (key[7:] if key.startswith('module.') else key, value)
+            for key, value in module_versions.items()
+        )
+    
+    return new_state_dict, metadata
+
+
+def load_state_dict(checkpoint_path, map_location='cpu'):
+    """State dict only, see load_checkpoint()"""
+    return load_checkpoint(checkpoint_path, map_location)[0]
+
+
+def load_model(checkpoint_path, device='cpu'):
+    """
+    Build the model and load a checkpoint into it (strict)
+    
+    .safetensors files and zipfile .pth files are memory-mapped and their
+    tensors assigned to a model built on the meta device, so weights are
+    never held twice. Pruned checkpoints are rebuilt with their recorded
+    shape. Quantized checkpoints are rebuilt with the recorded scheme and
+    always run on CPU.
+    
+    Args:
+        checkpoint_path: Path to .pth or .safetensors file
+        device: Target device
+    
+    Returns:
+        torch.nn.Module in eval mode
+    """
+    if checkpoint_path.endswith(SAFETENSORS_EXT):
+        state_dict, _ = load_safetensors(checkpoint_path)
+        metadata = {}
+    else:
+        state_dict, metadata = load_checkpoint(checkpoint_path, map_location='cpu', mmap=True)
+    
+    if 'quantization' in metadata:
+        from src.ai.quantization import apply_quantization
+        model = create_model()
+        if 'pruning' in metadata:
+            from src.ai.pruning import apply_pruning
+            model = apply_pruning(model, metadata['pruning'])
+        model = apply_quantization(model, metadata['quantization'])
+        model.load_state_dict(state_dict)
+        device = 'cpu'
+    else:
+        with torch.device('meta'):
+            model = create_model()
+            if 'pruning' in metadata:
+                from src.ai.pruning import apply_pruning
+                model = apply_pruning(model, metadata['pruning'])
+        model.load_state_dict(state_dict, assign=True)
+    
+    model.to(device)
+    model.eval()
+    return model
+
+
+# Recent inputs whose probabilities are kept (UI code often asks twice)
+CLASSIFY_MEMO_SIZE = 16
+
+# Dummy inferences run after load (TorchScript needs a few to settle)
+WARMUP_RUNS = 3
+
+
+def mock_prediction():
+    """Random prediction dict used in mock mode (no model loaded)"""
+    import random
+    
+    mock_classes = ["dog", "cat", "rain", "siren", "keyboard_typing", "laughing"]
+    label = random.choice(mock_classes)
+    confidence = random.uniform(65, 95)
+    
+    return {
+        'label': label,
+        'confidence': confidence,
+        'icon': SOUND_ICONS.get(label, "🔊"),
+        'is_alert': label in ALERT_SOUNDS,
+        'all_probs': None
+    }
+
+
+def top_k_indices(probs, k):
+    """Indices of the k largest probabilities, highest first (argpartition, O(n))"""
+    k = min(k, len(probs))
+    idx = np.argpartition(probs, -k)[-k:]
+    return idx[np.argsort(probs[idx])[::-1]]
+
+
+class ClassificationResult:
+    """
+    Everything derived from one forward pass
+    
+    Attributes:
+        probabilities: numpy array (num_classes,), None in mock mode
+        label, confidence (percent), icon, is_alert: top-1 prediction
+        top_k: list of dicts with label, confidence, icon (highest first)
+        alerts: alert-sound labels present in top_k
+    """
+    
+    def __init__(self, probabilities, classes=ESC50_CLASSES, k=5):
+        self.probabilities = probabilities
+        self.top_k = []
+        
+        for idx in top_k_indices(probabilities, k):
+            label = classes[idx]
+            self.top_k.append({
+                'label': label,
+                'confidence': float(probabilities[idx] * 100),
+                'icon': SOUND_ICONS.get(label, "🔊")
+            })
+        
+        top = self.top_k[0]
+        self.label = top['label']
+        self.confidence = top['confidence']
+        self.icon = top['icon']
+        self.is_alert = self.label in ALERT_SOUNDS
+        self.alerts = [p['label'] for p in self.top_k if p['label'] in ALERT_SOUNDS]
+    
+    @classmethod
+    def from_mock(cls, prediction):
+        """Wrap a mock prediction dict (no probability vector)"""
+        result = cls.__new__(cls)
+        result.probabilities = None
+        result.label = prediction['label']
+        result.confidence = prediction['confidence']
+        result.icon = prediction['icon']
+        result.is_alert = prediction['is_alert']
+        result.top_k = [prediction]
+        result.alerts = [result.label] if result.is_alert else []
+        return result
+    
+    def to_dict(self):
+        """Prediction dict as returned by SoundClassifier.predict"""
+        return {
+            'label': self.label,
+            'confidence': self.confidence,
+            'icon': self.icon,
+            'is_alert': self.is_alert,
+            'all_probs': self.probabilities
+        }
+
+
+class PredictionMemo:
+    """Small LRU of input buffer hash -> probability vector"""
+    
+    def __init__(self, max_size=CLASSIFY_MEMO_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(preprocessed_input):
+        """Hash of the input buffer (shape + float32 bytes)"""
+        if isinstance(preprocessed_input, torch.Tensor):
+            preprocessed_input = preprocessed_input.detach().cpu().numpy()
+        array = np.ascontiguousarray(preprocessed_input, dtype=np.float32)
+        digest = hashlib.blake2b(array.data, digest_size=16)
+        digest.update(str(array.shape).encode('ascii'))
+        return digest.hexdigest()
+    
+    def get(self, key):
+        with self._lock:
+            probabilities = self._entries.get(key)
+            if probabilities is not None:
+                self._entries.move_to_end(key)
+            return probabilities
+    
+    def put(self, key, probabilities):
+        with self._lock:
+            self._entries[key] = probabilities
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 class SoundClassifier:
     """
     Sound Classification using PyTorch ConvNeXt model
     """
     
-    def __init__(self, model_path="models/best_convnext_tiny.pth", use_mock=False):
+    def __init__(self, model_path="models/best_convnext_tiny.pth", use_mock=False,
+                 backend='pytorch', onnx_path="models/model.onnx",
+                 intra_op_threads=0, inter_op_threads=0, warmup=False, ensemble=None,
+                 precision='fp32', bf16_min_agreement=BF16_MIN_AGREEMENT, bf16_reference=REFERENCE_STORE_PATH):
         """
         Initialize the classifier
         
         Args:
-            model_path: Path to PyTorch .pth file
+            model_path: Path to PyTorch .pth (or .safetensors) file
             use_mock: If True, use mock predictions (for testing without model)
+            backend: 'auto' (calibration profile of this host), 'pytorch', 'channels_last', 'torchscript'
+                or 'onnxruntime' (falls back to pytorch if unavailable)
+            onnx_path: Exported model used by the onnxruntime backend
+            intra_op_threads: Intra-op threads (0 = tuned profile for PyTorch, default for ONNX Runtime)
+            inter_op_threads: Inter-op threads (0 = tuned profile for PyTorch, default for ONNX Runtime)
+            warmup: Run warmup inferences on a background thread after load
+            ensemble: Default EnsembleSpec for classify_ensemble()
+            precision: 'fp32' or 'bf16' (CPU autocast, kept only if the startup check passes)
+            bf16_min_agreement: Top-1 agreement with fp32 (%) required to keep bf16
+            bf16_reference: Spectrogram store of real clips for the bf16 check
         """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+        if backend != 'auto' and backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected 'auto' or one of {BACKENDS}")
+        
         self.model_path = model_path
+        self.onnx_path = onnx_path
         self.use_mock = use_mock
         self.model = None
+        self.backend = None
+        self.backend_name = backend
+        self.backend_reason = "configured in settings"
+        self.precision = 'fp32'
+        self.requested_precision = precision
+        self.bf16_min_agreement = bf16_min_agreement
+        self.bf16_reference = bf16_reference
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.loaded_path = model_path
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self.classes = ESC50_CLASSES
+        self._checkpoint_hash = None
+        self.memo = PredictionMemo()
+        self.warmup_done = threading.Event()
+        self.warmup_ms = None
+        self.ensemble = ensemble
+        self._ensemble_runner = None
+        self._ensemble_key = None
         
         if not use_mock:
             self._load_model()
+            if precision == 'bf16' and not self.use_mock:
+                self._enable_bf16()
         else:
             print("[WARNING] Using MOCK predictor (no model loaded)")
+        
+        if warmup:
+            self.start_warmup()
     
     def _load_model(self):
+        """Load the model with the configured backend"""
+        if self.backend_name == 'auto':
+            self._use_backend_profile()
+        
+        if self.backend_name == 'onnxruntime':
+            if self._load_onnx_backend():
+                self._report_backend()
+                return
+            print("[WARNING] Falling back to PyTorch backend")
+            self.backend_name = 'pytorch'
+            self.backend_reason = "fallback: ONNX Runtime unavailable"
+        
+        self._load_torch_model()
+        
+        if self.use_mock:
+            self._report_backend()
+            return
+        
+        if self.backend_name == 'channels_last':
+            self.backend = channels_last_backend(self.model, self.device)
+        elif self.backend_name == 'torchscript':
+            if not self._compile_torchscript():
+                print("[WARNING] Falling back to eager PyTorch")
+                self.backend_name = 'pytorch'
+                self.backend_reason = "fallback: TorchScript unavailable"
+        
+        self._report_backend()
+    
+    def _enable_bf16(self):
+        """
+        Switch to bf16 autocast if the host and the accuracy check allow it
+        
+        Stays in fp32 (and says why) when the CPU has no native bf16, the
+        backend is not eager PyTorch, bf16 disagrees with fp32 on the
+        reference clips, or it is not faster.
+        
+        Returns:
+            True if bf16 is now active
+        """
+        def fallback(reason, check=None):
+            print(f"[WARNING] bf16 disabled, staying in fp32: {reason}")
+            performance_metrics.update_precision('fp32', f"bf16 rejected: {reason}", check)
+            return False
+        
+        if self.device.type != 'cpu' or self.backend_name not in ('pytorch', 'channels_last'):
+            return fallback(f"needs eager PyTorch on CPU (backend is {self.backend_name})")
+        
+        supported, reason = bf16_supported()
+        if not supported:
+            return fallback(reason)
+        
+        fp32_backend = self.backend
+        bf16_backend = TorchBackend(
+            self.model, self.device, name=fp32_backend.name,
+            memory_format=fp32_backend.memory_format, autocast_dtype=torch.bfloat16
+        )
+        
+        try:
+            check = check_bf16(fp32_backend.run, bf16_backend.run, load_reference_batches(self.bf16_reference),
+                               min_agreement=self.bf16_min_agreement)
+        except Exception as e:
+            return fallback(f"bf16 run failed ({e})")
+        
+        if not check['accepted']:
+            return fallback(f"top-1 agreement {check['top1_agreement']:.1f}%, "
+                            f"max |Δp| {check['max_prob_diff']:.3f}", check)
+        if not check['faster']:
+            return fallback(f"no gain ({check['bf16_ms']:.1f} ms vs {check['fp32_ms']:.1f} ms)", check)
+        
+        self.backend = bf16_backend
+        self.precision = 'bf16'
+        self.memo.clear()
+        performance_metrics.update_precision('bf16', f"{reason}, {check['top1_agreement']:.0f}% top-1 agreement", check)
+        print(f"[SUCCESS] bf16 autocast enabled: {check['bf16_ms']:.1f} ms vs {check['fp32_ms']:.1f} ms fp32 "
+              f"({check['speedup']:.2f}x, top-1 agreement {check['top1_agreement']:.1f}%)")
+        return True
+    
+    def _use_backend_profile(self):
+        """
+        Take the backend from this host's calibration profile
+        
+        Calibration never runs during load: without a profile the eager
+        model serves until calibrate_backends.py (or calibrate_backends())
+        has been run once.
+        """
+        self.backend_name = 'pytorch'
+        checkpoint_path = resolve_checkpoint_path(self.model_path)
+        if not os.path.exists(checkpoint_path):
+            return  # Mock mode follows
+        
+        profile = load_backend_profile(checkpoint_id(checkpoint_path))
+        if profile is None:
+            self.backend_reason = "no calibration profile yet (run calibrate_backends.py)"
+            print("[INFO] No backend calibration profile for this host, using eager PyTorch")
+            return
+        
+        self.backend_name = profile['backend']
+        self.backend_reason = f"{profile['reason']} (calibrated {profile['calibrated_at']})"
+        print(f"[INFO] Backend from calibration profile: {self.backend_name}")
+    
+    def calibrate_backends(self, batches=None, repeats=CALIBRATION_REPEATS):
+        """
+        Time every available backend against eager PyTorch and switch to the fastest
+        
+        The result is saved to the backend profile, so the next start with
+        backend='auto' loads the winner directly.
+        
+        Args:
+            batches: Real preprocessed clips (list of (N, 1, 128, 431) arrays)
+                for the parity check; random input if None
+            repeats: Timed runs per backend
+        
+        Returns:
+            dict of per-backend results
+        """
+        builders = {
+            'pytorch': lambda: TorchBackend(self.model, self.device),
+        }
+        if self.device.type == 'cpu':
+            builders['channels_last'] = lambda: channels_last_backend(copy.deepcopy(self.model), self.device)
+            builders['torchscript'] = self._build_torchscript_backend
+        builders['onnxruntime'] = self._build_onnx_backend
+        
+        print("[INFO] Calibrating inference backends for this host...")
+        winner, backend, results, reason = calibrate_backends(builders, batches, repeats)
+        
+        self.backend = backend
+        self.backend_name = winner
+        self.backend_reason = reason
+        if winner == 'onnxruntime':
+            self.model = None  # Same state as loading ONNX Runtime directly
+            self.loaded_path = self.onnx_path
+            self._checkpoint_hash = None
+            performance_metrics.update_model_format('.onnx')
+        elif winner == 'channels_last':
+            self.model = backend.model
+        
+        # The winner runs in fp32: drop results and runners of the old backend
+        self.precision = 'fp32'
+        self.memo.clear()
+        self._ensemble_runner = None
+        performance_metrics.update_precision('fp32', "backend recalibrated")
+        self._report_backend()
+        
+        save_backend_profile(checkpoint_id(resolve_checkpoint_path(self.model_path)), winner, reason, results)
+        print(f"[SUCCESS] Selected backend '{winner}': {reason}")
+        
+        if self.requested_precision == 'bf16':
+            self._enable_bf16()
+        return results
+    
+    def _report_backend(self):
+        """Publish the backend in use (and why) to the Tech Stats view"""
+        if self.use_mock:
+            performance_metrics.update_backend('mock', "no model loaded")
+        else:
+            performance_metrics.update_backend(self.backend_name, self.backend_reason)
+    
+    def _build_torchscript_backend(self):
+        """Cached frozen TorchScript graph of the eager model (raises on failure)"""
+        from src.ai.torchscript import load_or_compile
+        
+        compiled, from_cache = load_or_compile(self.model, self.checkpoint_hash)
+        print(f"[INFO] TorchScript graph {'loaded from cache' if from_cache else 'traced and cached'}")
+        return TorchBackend(compiled, self.device, name='torchscript')
+    
+    def _build_onnx_backend(self):
+        """ONNX Runtime session for onnx_path (raises on failure)"""
+        if not os.path.exists(self.onnx_path):
+            raise FileNotFoundError(f"ONNX model not found: {self.onnx_path}")
+        return OnnxRuntimeBackend(
+            self.onnx_path,
+            intra_op_threads=self.intra_op_threads,
+            inter_op_threads=self.inter_op_threads,
+        )
+    
+    def _compile_torchscript(self):
+        """Swap the eager backend for the cached frozen TorchScript graph"""
+        if self.device.type != 'cpu':
+            print("[WARNING] TorchScript backend is tuned for CPU only")
+            return False
+        
+        try:
+            start = time.perf_counter()
+            self.backend = self._build_torchscript_backend()
+            elapsed = (time.perf_counter() - start) * 1000
+        except Exception as e:
+            print(f"[ERROR] TorchScript compilation failed: {e}")
+            return False
+        
+        print(f"[SUCCESS] TorchScript model ready in {elapsed:.0f} ms")
+        return True
+    
+    def start_warmup(self, runs=WARMUP_RUNS):
+        """
+        Run dummy inferences on a background thread
+        
+        Kernel selection and first-touch allocation happen here instead of
+        on the first real window. warmup_done is set when finished.
+        
+        Args:
+            runs: Number of dummy forward passes
+        
+        Returns:
+            The warmup thread, or None in mock mode
+        """
+        if self.use_mock or self.backend is None:
+            self.warmup_done.set()
+            return None
+        
+        def _warmup():
+            dummy = np.random.default_rng(0).standard_normal((1, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+            start = time.perf_counter()
+            try:
+                for _ in range(runs):
+                    self.backend.run(dummy)
+                self.warmup_ms = (time.perf_counter() - start) * 1000
+                print(f"[INFO] Model warmup finished in {self.warmup_ms:.0f} ms")
+            except Exception as e:
+                print(f"[WARNING] Model warmup failed: {e}")
+            finally:
+                self.warmup_done.set()
+        
+        thread = threading.Thread(target=_warmup, daemon=True, name="model-warmup")
+        thread.start()
+        return thread
+    
+    def _load_onnx_backend(self):
+        """Create the ONNX Runtime backend, returns True on success"""
+        try:
+            self.backend = self._build_onnx_backend()
+        except Exception as e:
+            print(f"[ERROR] Error creating ONNX Runtime session: {e}")
+            return False
+        
+        self.loaded_path = self.onnx_path
+        performance_metrics.update_model_format('.onnx')
+        print(f"[SUCCESS] ONNX Runtime model loaded successfully: {self.onnx_path}")
+        print(f"[INFO] Threads: intra-op={self.backend.intra_op_threads or 'auto'}, "
+              f"inter-op={self.backend.inter_op_threads or 'auto'}")
+        return True
+    
+    def _load_torch_model(self):
         """Load PyTorch model"""
         try:
-            import timm
+            # A converted .safetensors next to the .pth loads faster
+            checkpoint_path = resolve_checkpoint_path(self.model_path)
             
-            if not os.path.exists(self.model_path):
+            if not os.path.exists(checkpoint_path):
                 print(f"[WARNING] Model file not found: {self.model_path}")
                 print("[WARNING] Switching to MOCK mode")
                 self.use_mock = True
                 return
             
-            # Create ConvNeXt-Tiny model structure
-            self.model = timm.create_model('convnext_tiny', pretrained=False, num_classes=50, in_chans=1)
-            
-            # Load weights
-            checkpoint = torch.load(self.model_path, map_location=self.device)
+            if self.device.type == 'cpu':
+                apply_thread_settings(self.intra_op_threads, self.inter_op_threads)
             
-            # Handle different checkpoint formats and DataParallel
-            if isinstance(checkpoint, dict):
-                if 'model_state_dict' in checkpoint:
-                    state_dict = checkpoint['model_state_dict']
-                elif 'state_dict' in checkpoint:
-                    state_dict = checkpoint['state_dict']
-                else:
-                    state_dict = checkpoint
-            else:
-                state_dict = checkpoint
+            start = time.perf_counter()
+            self.model = load_model(checkpoint_path, self.device)
+            self.device = next(self.model.parameters()).device
+            self.backend = TorchBackend(self.model, self.device)
+            performance_metrics.update_parameter_count(count_parameters(self.model))
+            self.loaded_path = checkpoint_path
             
-            # Remove 'module.' prefix if present (from DataParallel)
-            new_state_dict = {}
-            for key, value in state_dict.items():
-                if key.startswith('module.'):
-                    new_key = key[7:]  # Remove 'module.' prefix
-                    new_state_dict[new_key] = value
-                else:
-                    new_state_dict[key] = value
-            
-            # Load state dict
-            self.model.load_state_dict(new_state_dict)
-            self.model.to(self.device)
-            self.model.eval()
-            
-            print(f"[SUCCESS] PyTorch model loaded successfully: {self.model_path}")
+            print(f"[SUCCESS] PyTorch model loaded successfully: {checkpoint_path} "
+                  f"({(time.perf_counter() - start) * 1000:.0f} ms)")
             print(f"[INFO] Using device: {self.device}")
             
         except Exception as e:
@@ -118,56 +662,47 @@ class SoundClassifier:
             print("[WARNING] Switching to MOCK mode")
             self.use_mock = True
     
-    def predict(self, preprocessed_input):
+    def classify(self, preprocessed_input, k=5):
         """
-        Run inference on preprocessed input
+        Run one forward pass and derive every view of the output
+        
+        Repeated calls with the same input buffer are served from a small memo.
         
         Args:
-            preprocessed_input: Preprocessed spectrogram (1, 1, 128, 431) as numpy array
+            preprocessed_input: Preprocessed spectrogram (1, 1, 128, 431) as numpy array or tensor
+            k: Number of top predictions in result.top_k
         
         Returns:
-            dict with 'label', 'confidence', 'icon', 'is_alert'
+            ClassificationResult
         """
         if self.use_mock:
-            return self._mock_predict()
+            return ClassificationResult.from_mock(self._mock_predict())
         
         try:
-            # Mark inference phase start
-            performance_metrics.mark_phase_start('inference')
-            
-            # Convert to torch tensor if needed
-            if isinstance(preprocessed_input, np.ndarray):
-                input_tensor = torch.from_numpy(preprocessed_input).float().to(self.device)
-            elif isinstance(preprocessed_input, torch.Tensor):
-                input_tensor = preprocessed_input.float().to(self.device)
-            else:
+            if not isinstance(preprocessed_input, (np.ndarray, torch.Tensor)):
                 raise TypeError(f"Expected np.ndarray or torch.Tensor, got {type(preprocessed_input)}")
             
-            # Run inference
-            with torch.no_grad():
-                outputs = self.model(input_tensor)
+            key = self.memo.key(preprocessed_input)
+            probabilities = self.memo.get(key)
             
-            # Mark inference phase end
-            performance_metrics.mark_phase_end('inference')
+            if probabilities is None:
+                # Mark inference phase start
+                performance_metrics.mark_phase_start('inference')
+                
+                # Run inference
+                outputs = self.backend.run(preprocessed_input)
+                
+                # Mark inference phase end
+                performance_metrics.mark_phase_end('inference')
+                
+                # Get probabilities
+                probabilities = softmax(outputs)[0]
+                self.memo.put(key, probabilities)
             
             # Mark postprocessing start
             performance_metrics.mark_phase_start('postprocessing')
             
-            # Get probabilities
-            probabilities = torch.softmax(outputs, dim=1)[0].cpu().numpy()
-            
-            # Get top prediction
-            top_idx = np.argmax(probabilities)
-            top_prob = probabilities[top_idx]
-            top_label = self.classes[top_idx]
-            
-            result = {
-                'label': top_label,
-                'confidence': float(top_prob * 100),
-                'icon': SOUND_ICONS.get(top_label, "🔊"),
-                'is_alert': top_label in ALERT_SOUNDS,
-                'all_probs': probabilities
-            }
+            result = ClassificationResult(probabilities, self.classes, k)
             
             # Mark postprocessing end
             performance_metrics.mark_phase_end('postprocessing')
@@ -176,23 +711,128 @@ class SoundClassifier:
             
         except Exception as e:
             print(f"[ERROR] Prediction error: {e}")
-            return self._mock_predict()
+            return ClassificationResult.from_mock(self._mock_predict())
     
-    def _mock_predict(self):
-        """Mock prediction for testing"""
-        import random
+    def classify_ensemble(self, preprocessed_input, spec=None, k=5):
+        """
+        Ensemble / test-time-augmentation prediction in one batched pass
         
-        mock_classes = ["dog", "cat", "rain", "siren", "keyboard_typing", "laughing"]
-        label = random.choice(mock_classes)
-        confidence = random.uniform(65, 95)
+        All time-shifted variants form one batch, each model runs once over
+        it, and logits are averaged over models and variants.
         
-        return {
-            'label': label,
-            'confidence': confidence,
-            'icon': SOUND_ICONS.get(label, "🔊"),
-            'is_alert': label in ALERT_SOUNDS,
-            'all_probs': None
-        }
+        Args:
+            preprocessed_input: Preprocessed spectrogram (1, 1, 128, 431)
+            spec: EnsembleSpec (default: the one given at construction)
+            k: Number of top predictions in result.top_k
+        
+        Returns:
+            ClassificationResult
+        """
+        if self.use_mock:
+            return ClassificationResult.from_mock(self._mock_predict())
+        
+        spec = spec or self.ensemble or EnsembleSpec()
+        
+        try:
+            runner = self._get_ensemble_runner(spec)
+            batch = build_tta_batch(preprocessed_input, spec.time_shifts)
+            
+            performance_metrics.mark_phase_start('inference')
+            logits = runner.run(batch)
+            performance_metrics.mark_phase_end('inference')
+            
+            probabilities = softmax(logits.mean(axis=(0, 1)))
+            return ClassificationResult(probabilities, self.classes, k)
+            
+        except Exception as e:
+            print(f"[ERROR] Ensemble prediction error: {e}")
+            return ClassificationResult.from_mock(self._mock_predict())
+    
+    def _get_ensemble_runner(self, spec):
+        """Load (once) the members for a spec"""
+        if self._ensemble_runner is None or self._ensemble_key != spec.models_key:
+            self._ensemble_runner = build_ensemble(
+                spec, self.model, self.backend, self.device,
+                load_member=lambda path: load_model(path, self.device)
+            )
+            self._ensemble_key = spec.models_key
+            print(f"[INFO] Ensemble ready: {self._ensemble_runner.num_models} model(s), "
+                  f"{len(spec.time_shifts)} variant(s)")
+        return self._ensemble_runner
+    
+    def predict(self, preprocessed_input):
+        """
+        Run inference on preprocessed input
+        
+        Args:
+            preprocessed_input: Preprocessed spectrogram (1, 1, 128, 431) as numpy array
+        
+        Returns:
+            dict with 'label', 'confidence', 'icon', 'is_alert', 'all_probs'
+        """
+        return self.classify(preprocessed_input).to_dict()
+    
+    def predict_batch(self, batch):
+        """
+        Run inference on a batch of preprocessed inputs
+        
+        Args:
+            batch: numpy array or tensor (N, 1, 128, 431)
+        
+        Returns:
+            numpy array of probabilities (N, num_classes)
+        """
+        if self.use_mock:
+            return np.random.dirichlet(np.ones(len(self.classes)), size=len(batch)).astype(np.float32)
+        
+        performance_metrics.mark_phase_start('inference')
+        
+        probabilities = softmax(self.backend.run(batch))
+        
+        performance_metrics.mark_phase_end('inference')
+        
+        return probabilities
+    
+    @property
+    def checkpoint_hash(self):
+        """SHA-256 of the loaded model file (computed once)"""
+        if self._checkpoint_hash is None:
+            self._checkpoint_hash = hash_file(self.loaded_path)
+        return self._checkpoint_hash
+    
+    @property
+    def model_key(self):
+        """Identity of what produces the predictions: checkpoint, backend and precision"""
+        return f"{self.checkpoint_hash}:{self.backend_name}:{self.precision}"
+    
+    def result_from_probs(self, probabilities):
+        """
+        Build the prediction dict from a probability vector
+        
+        Args:
+            probabilities: numpy array (num_classes,)
+        
+        Returns:
+            dict with 'label', 'confidence', 'icon', 'is_alert', 'all_probs'
+        """
+        return ClassificationResult(probabilities, self.classes, k=1).to_dict()
+    
+    def top_k_from_probs(self, probs, k=5):
+        """
+        Top-k predictions from a probability vector
+        
+        Args:
+            probs: numpy array (num_classes,)
+            k: Number of top predictions
+        
+        Returns:
+            List of dicts with label, confidence, icon
+        """
+        return ClassificationResult(probs, self.classes, k).top_k
+    
+    def _mock_predict(self):
+        """Mock prediction for testing"""
+        return mock_prediction()
     
     def get_top_k_predictions(self, preprocessed_input, k=5):
         """
@@ -205,23 +845,4 @@ class SoundClassifier:
         Returns:
             List of dicts with label, confidence, icon
         """
-        result = self.predict(preprocessed_input)
-        
-        if result['all_probs'] is None:
-            # Mock mode
-            return [result]
-        
-        # Get top-k
-        probs = result['all_probs']
-        top_k_idx = np.argsort(probs)[-k:][::-1]
-        
-        predictions = []
-        for idx in top_k_idx:
-            label = self.classes[idx]
-            predictions.append({
-                'label': label,
-                'confidence': float(probs[idx] * 100),
-                'icon': SOUND_ICONS.get(label, "🔊")
-            })
-        
-        return predictions
+        return self.classify(preprocessed_input, k).top_k
@@ -0,0 +1,115 @@
+"""
+Model Loader
+Builds the classifier on a background thread so the UI can show immediately
+
+Progress goes through LOAD_STATES. Listeners are called (from the loader
+thread) on every state change, and `future` resolves to the classifier once
+it is ready. If loading fails, `future` resolves to the fallback classifier
+(mock mode) and the state is 'failed'.
+"""
+import threading
+import time
+from concurrent.futures import Future
+
+
+# State -> label shown in the status bar
+LOAD_STATES = {
+    'pending': "Waiting",
+    'importing': "Importing libraries",
+    'loading': "Loading model",
+    'warming_up': "Warming up",
+    'ready': "Ready",
+    'failed': "Failed",
+}
+
+
+class ModelLoader:
+    """Background construction of a SoundClassifier"""
+
+    def __init__(self, factory, warmup=True, fallback=None):
+        """
+        Args:
+            factory: Callable returning the classifier (runs on the loader thread)
+            warmup: Run warmup inferences before reporting 'ready'
+            fallback: Callable returning a classifier to serve if factory fails
+                (e.g. a mock one); without it the future holds the exception
+        """
+        self.factory = factory
+        self.warmup = warmup
+        self.fallback = fallback
+        self.future = Future()
+        self.state = 'pending'
+        self.load_ms = None
+        self._listeners = []
+        self._thread = None
+
+    @property
+    def is_ready(self):
+        """True once a classifier (loaded or fallback) can serve requests"""
+        return self.future.done() and self.future.exception() is None
+
+    @property
+    def label(self):
+        return LOAD_STATES[self.state]
+
+    def add_listener(self, callback):
+        """Register callback(state) for state changes"""
+        self._listeners.append(callback)
+
+    def _set_state(self, state):
+        self.state = state
+        for callback in list(self._listeners):
+            try:
+                callback(state)
+            except Exception as e:
+                print(f"[WARNING] Model loader listener failed: {e}")
+
+    def start(self):
+        """Start loading (no-op if already started)"""
+        if self._thread is not None:
+            return self.future
+        self._thread = threading.Thread(target=self._run, daemon=True, name="model-loader")
+        self._thread.start()
+        return self.future
+
+    def wait(self, timeout=None):
+        """Block until loaded; returns the classifier"""
+        return self.future.result(timeout=timeout)
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            self._set_state('importing')
+            import timm  # noqa: F401 - the slowest import, done off the UI thread
+
+            self._set_state('loading')
+            classifier = self.factory()
+
+            if self.warmup and not classifier.use_mock:
+                self._set_state('warming_up')
+                classifier.start_warmup()
+                classifier.warmup_done.wait()
+        except Exception as e:
+            print(f"[ERROR] Background model load failed: {e}")
+            self._resolve_fallback(e)
+            self._set_state('failed')
+            return
+
+        self.load_ms = (time.perf_counter() - start) * 1000
+        print(f"[INFO] Model ready after {self.load_ms:.0f} ms (background)")
+        # Resolve before notifying so listeners see is_ready == True
+        self.future.set_result(classifier)
+        self._set_state('ready')
+
+    def _resolve_fallback(self, error):
+        """Resolve the future with the fallback classifier, or with the load error"""
+        if self.fallback is not None:
+            try:
+                classifier = self.fallback()
+            except Exception as e:
+                print(f"[ERROR] Fallback classifier failed: {e}")
+            else:
+                print("[WARNING] Serving the fallback classifier (mock mode)")
+                self.future.set_result(classifier)
+                return
+        self.future.set_exception(error)
@@ -0,0 +1,280 @@
+"""
+NumPy Mel-Spectrogram Front End
+Torch-free port of the Kaggle preprocessing chain (numpy.fft / pocketfft)
+
+Mirrors torchaudio's MelSpectrogram(n_fft=2048, hop=512, n_mels=128),
+AmplitudeToDB(top_db=80), z-score and pad/crop, plus the default sinc
+Resample kernel. Importing this module never imports torch, so it can run
+in lightweight worker processes.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.ai.audio_config import SR, N_MELS, N_FFT, HOP_LENGTH, TOP_DB, FIXED_WIDTH
+
+
+AMIN = 1e-10
+
+
+def hann_window(n_fft):
+    """Periodic Hann window (torch.hann_window default)"""
+    k = np.arange(n_fft, dtype=np.float64)
+    return 0.5 - 0.5 * np.cos(2.0 * math.pi * k / n_fft)
+
+
+def _hz_to_mel(freq):
+    """HTK mel scale"""
+    return 2595.0 * np.log10(1.0 + freq / 700.0)
+
+
+def _mel_to_hz(mels):
+    """Inverse HTK mel scale"""
+    return 700.0 * (10.0 ** (mels / 2595.0) - 1.0)
+
+
+def melscale_fbanks(n_freqs, f_min, f_max, n_mels, sample_rate):
+    """
+    Triangular mel filterbank (torchaudio.functional.melscale_fbanks, htk, norm=None)
+
+    Returns:
+        numpy array (n_freqs, n_mels)
+    """
+    all_freqs = np.linspace(0, sample_rate // 2, n_freqs)
+
+    m_pts = np.linspace(_hz_to_mel(f_min), _hz_to_mel(f_max), n_mels + 2)
+    f_pts = _mel_to_hz(m_pts)
+
+    f_diff = f_pts[1:] - f_pts[:-1]
+    slopes = f_pts[None, :] - all_freqs[:, None]
+    down_slopes = (-1.0 * slopes[:, :-2]) / f_diff[:-1]
+    up_slopes = slopes[:, 2:] / f_diff[1:]
+
+    return np.maximum(0.0, np.minimum(down_slopes, up_slopes))
+
+
+class NumpyFeatureExtractor:
+    """
+    Mel-Spectrogram + AmplitudeToDB front end without torch
+
+    Filterbank and window are built once in __init__.
+    """
+
+    def __init__(self, sample_rate=SR, n_fft=N_FFT, hop_length=HOP_LENGTH, n_mels=N_MELS):
+        """
+        Build the filterbank and window
+
+        Args:
+            sample_rate: Sample rate of the incoming waveform
+            n_fft: FFT size
+            hop_length: Hop between STFT frames
+            n_mels: Number of mel bands
+        """
+        self.sample_rate = sample_rate
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.n_mels = n_mels
+
+        self.window = hann_window(n_fft)
+        self.fbanks = melscale_fbanks(n_fft // 2 + 1, 0.0, float(sample_rate // 2), n_mels, sample_rate)
+
+    def mel_power(self, audio):
+        """
+        Mel power spectrogram with reflect-padded, centred frames
+
+        Args:
+            audio: Mono waveform (samples,)
+
+        Returns:
+            numpy array (n_mels, frames) float64
+        """
+        audio = np.asarray(audio, dtype=np.float64).reshape(-1)
+        pad = self.n_fft // 2
+        padded = np.pad(audio, (pad, pad), mode='reflect')
+
+        frames = sliding_window_view(padded, self.n_fft)[::self.hop_length]
+        power = np.abs(np.fft.rfft(frames * self.window, axis=-1)) ** 2  # (frames, n_freqs)
+
+        return (power @ self.fbanks).T
+
+    def mel_db(self, audio):
+        """
+        Compute the dB-scaled mel-spectrogram
+
+        Args:
+            audio: Mono waveform (samples,)
+
+        Returns:
+            numpy array (n_mels, frames) float32
+        """
+        return amplitude_to_db(self.mel_power(audio)).astype(np.float32)
+
+    def __call__(self, audio, fixed_width=FIXED_WIDTH):
+        """
+        Run the full Kaggle preprocessing chain on a mono waveform
+
+        Args:
+            audio: Mono waveform already at self.sample_rate
+            fixed_width: Number of time frames fed to the model
+
+        Returns:
+            preprocessed: numpy array ready for model (1, 1, n_mels, fixed_width)
+            spec_for_display: Mel-spectrogram for visualization (before normalization)
+        """
+        spec = self.mel_db(audio)
+        return normalize_spectrogram(spec, fixed_width), spec
+
+
+def amplitude_to_db(power, top_db=TOP_DB):
+    """
+    Power to dB with top_db clamping (torchaudio AmplitudeToDB, ref=1.0)
+    """
+    spec = 10.0 * np.log10(np.maximum(power, AMIN))
+    return np.maximum(spec, spec.max() - top_db)
+
+
+def normalize_spectrogram(spec, fixed_width=FIXED_WIDTH):
+    """
+    Z-score normalize and pad/crop a dB spectrogram (EXACTLY like Kaggle)
+
+    Args:
+        spec: Mel-spectrogram in dB (n_mels, frames)
+        fixed_width: Number of time frames fed to the model
+
+    Returns:
+        numpy array (1, 1, n_mels, fixed_width) float32
+    """
+    spec = np.asarray(spec, dtype=np.float64)
+    spec = (spec - spec.mean()) / (spec.std(ddof=1) + 1e-6)
+
+    if spec.shape[1] < fixed_width:
+        spec = np.pad(spec, ((0, 0), (0, fixed_width - spec.shape[1])))
+    else:
+        spec = spec[:, :fixed_width]
+
+    return spec[np.newaxis, np.newaxis].astype(np.float32)
+
+
+@lru_cache(maxsize=8)
+def get_numpy_feature_extractor(sample_rate=SR, n_fft=N_FFT, hop_length=HOP_LENGTH, n_mels=N_MELS):
+    """Get a shared NumpyFeatureExtractor"""
+    return NumpyFeatureExtractor(sample_rate, n_fft, hop_length, n_mels)
+
+
+@lru_cache(maxsize=16)
+def _sinc_resample_kernel(orig_freq, new_freq, lowpass_filter_width=6, rolloff=0.99):
+    """
+    Polyphase sinc kernel (torchaudio sinc_interp_hann defaults)
+
+    Returns:
+        kernel: numpy array (new_freq, 2 * width + orig_freq) float32
+        width: Filter half-width in input samples
+    """
+    base_freq = min(orig_freq, new_freq) * rolloff
+    width = math.ceil(lowpass_filter_width * orig_freq / base_freq)
+
+    idx = np.arange(-width, width + orig_freq, dtype=np.float64)[None, :] / orig_freq
+    t = np.arange(0, -new_freq, -1, dtype=np.float64)[:, None] / new_freq + idx
+    t *= base_freq
+    t = np.clip(t, -lowpass_filter_width, lowpass_filter_width)
+
+    window = np.cos(t * math.pi / lowpass_filter_width / 2) ** 2
+    t *= math.pi
+    scale = base_freq / orig_freq
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        kernel = np.where(t == 0, 1.0, np.sin(t) / t)
+    kernel *= window * scale
+
+    return kernel.astype(np.float32), width
+
+
+def resample(audio, orig_sr, target_sr=SR):
+    """
+    Resample a mono waveform (same kernel as torchaudio.transforms.Resample)
+
+    Args:
+        audio: Mono waveform (samples,)
+        orig_sr: Sample rate of the input
+        target_sr: Sample rate to convert to
+
+    Returns:
+        numpy array float32
+    """
+    audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+    if int(orig_sr) == int(target_sr):
+        return audio
+
+    gcd = math.gcd(int(orig_sr), int(target_sr))
+    orig_freq = int(orig_sr) // gcd
+    new_freq = int(target_sr) // gcd
+    kernel, width = _sinc_resample_kernel(orig_freq, new_freq)
+
+    padded = np.pad(audio, (width, width + orig_freq))
+    frames = sliding_window_view(padded, kernel.shape[1])[::orig_freq]
+    resampled = (frames @ kernel.T).reshape(-1)
+
+    target_length = int(math.ceil(new_freq * len(audio) / orig_freq))
+    return resampled[:target_length]
+
+
+def decode_audio(file_path, target_sr=SR):
+    """
+    Load an audio file as mono float32 at target_sr using soundfile
+
+    Args:
+        file_path: Path to audio file
+        target_sr: Sample rate to convert to
+
+    Returns:
+        numpy array (samples,)
+    """
+    import soundfile as sf
+
+    audio, sr = sf.read(file_path, dtype='float32', always_2d=True)
+    audio = audio.mean(axis=1, dtype=np.float32) if audio.shape[1] > 1 else audio[:, 0]
+
+    return resample(audio, sr, target_sr)
+
+
+def load_and_preprocess_audio(file_path):
+    """
+    Torch-free equivalent of src.ai.audio_processor.load_and_preprocess_audio
+
+    Args:
+        file_path: Path to audio file
+
+    Returns:
+        preprocessed: numpy array ready for model (1, 1, 128, 431)
+        spec_for_display: Mel-spectrogram for visualization (before normalization)
+    """
+    audio = decode_audio(file_path)
+    return get_numpy_feature_extractor()(audio)
+
+
+def preprocess_files_in_workers(file_paths, max_workers=None):
+    """
+    Preprocess files in separate processes that never import torch
+
+    Args:
+        file_paths: List of paths to audio files
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        batch: Contiguous numpy array (N, 1, 128, 431) float32
+        specs_for_display: List of N mel-spectrograms in dB
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return np.zeros((0, 1, N_MELS, FIXED_WIDTH), dtype=np.float32), []
+
+    max_workers = max_workers or min(len(file_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(load_and_preprocess_audio, file_paths))
+
+    batch = np.ascontiguousarray(np.concatenate([r[0] for r in results], axis=0))
+    return batch, [r[1] for r in results]
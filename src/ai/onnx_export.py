@@ -0,0 +1,184 @@
+"""
+ONNX Export
+Export the served timm model to ONNX and an offline-optimized ORT model
+
+The model is built with the same code SoundClassifier uses
+(model_handler.load_model), so the exported graph is exactly what the app
+serves. Export only succeeds if the ONNX Runtime logits match PyTorch
+within tolerance on a reference batch; otherwise the outputs are removed.
+"""
+import inspect
+import os
+
+import numpy as np
+import torch
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.model_handler import load_model
+
+
+DEFAULT_OPSET = 17
+PARITY_ATOL = 1e-4
+PARITY_RTOL = 1e-3
+
+# Reference batches for the parity check: (batch size, time frames).
+# The second one exercises the dynamic batch and time axes.
+PARITY_SHAPES = ((4, FIXED_WIDTH), (3, FIXED_WIDTH // 2))
+
+
+class ParityError(RuntimeError):
+    """Exported model output does not match PyTorch"""
+
+
+def export_onnx(model, onnx_path, opset=DEFAULT_OPSET):
+    """
+    Export with dynamic batch and time axes
+
+    Args:
+        model: torch.nn.Module in eval mode (CPU)
+        onnx_path: Output .onnx path
+        opset: ONNX opset version
+    """
+    try:
+        import onnx
+    except ImportError as e:
+        raise ImportError("ONNX export needs the 'onnx' package: pip install onnx") from e
+
+    dummy_input = torch.randn(1, 1, N_MELS, FIXED_WIDTH)
+    kwargs = {}
+    if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+        # The TorchScript exporter honours opset_version/dynamic_axes as given
+        kwargs['dynamo'] = False
+
+    torch.onnx.export(
+        model,
+        dummy_input,
+        onnx_path,
+        export_params=True,
+        opset_version=opset,
+        do_constant_folding=True,
+        input_names=['input'],
+        output_names=['output'],
+        dynamic_axes={
+            'input': {0: 'batch_size', 3: 'time'},
+            'output': {0: 'batch_size'},
+        },
+        **kwargs
+    )
+
+    onnx.checker.check_model(onnx.load(onnx_path))
+
+
+def save_ort_model(onnx_path, ort_path):
+    """
+    Optimize offline and save in ORT format
+
+    Uses the extended optimization level: the extra layout transforms of
+    ORT_ENABLE_ALL are hardware specific and are applied at load time instead.
+
+    Args:
+        onnx_path: Source .onnx model
+        ort_path: Output .ort model
+    """
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    options.optimized_model_filepath = ort_path
+    options.add_session_config_entry('session.save_model_format', 'ORT')
+    ort.InferenceSession(onnx_path, options, providers=['CPUExecutionProvider'])
+
+
+def reference_batches(seed=0):
+    """Deterministic z-scored-like inputs for the parity check"""
+    rng = np.random.default_rng(seed)
+    return [
+        rng.standard_normal((batch_size, 1, N_MELS, frames)).astype(np.float32)
+        for batch_size, frames in PARITY_SHAPES
+    ]
+
+
+def check_parity(model, model_path, batches, atol=PARITY_ATOL, rtol=PARITY_RTOL):
+    """
+    Compare ONNX Runtime logits against PyTorch
+
+    Args:
+        model: Reference torch.nn.Module
+        model_path: .onnx or .ort model to check
+        batches: List of numpy inputs
+        atol: Absolute tolerance on logits
+        rtol: Relative tolerance on logits
+
+    Returns:
+        Max absolute logit difference
+
+    Raises:
+        ParityError: If any logit is outside tolerance
+    """
+    import onnxruntime as ort
+
+    session = ort.InferenceSession(model_path, providers=['CPUExecutionProvider'])
+    input_name = session.get_inputs()[0].name
+
+    max_diff = 0.0
+    for batch in batches:
+        with torch.no_grad():
+            expected = model(torch.from_numpy(batch)).numpy()
+        actual = session.run(None, {input_name: batch})[0]
+
+        if actual.shape != expected.shape:
+            raise ParityError(f"{model_path}: output shape {actual.shape} != {expected.shape}")
+
+        max_diff = max(max_diff, float(np.abs(actual - expected).max()))
+        if not np.allclose(actual, expected, atol=atol, rtol=rtol):
+            raise ParityError(
+                f"{model_path}: logits differ by up to {max_diff:.2e} "
+                f"on input {batch.shape} (atol={atol}, rtol={rtol})"
+            )
+
+    return max_diff
+
+
+def export_model(checkpoint_path, onnx_path="models/model.onnx", ort_path="models/model.ort",
+                 opset=DEFAULT_OPSET, atol=PARITY_ATOL, rtol=PARITY_RTOL):
+    """
+    Full pipeline: load checkpoint -> ONNX -> ORT, with parity checks
+
+    Args:
+        checkpoint_path: PyTorch .pth checkpoint
+        onnx_path: Output .onnx path
+        ort_path: Output .ort path (None to skip)
+        opset: ONNX opset version
+        atol: Absolute tolerance on logits
+        rtol: Relative tolerance on logits
+
+    Returns:
+        dict path -> max absolute logit difference
+
+    Raises:
+        ParityError: If an exported model does not match (its file is removed)
+    """
+    model = load_model(checkpoint_path, 'cpu')
+    batches = reference_batches()
+    report = {}
+
+    print(f"[INFO] Exporting {checkpoint_path} -> {onnx_path} (opset {opset})")
+    export_onnx(model, onnx_path, opset)
+    outputs = [onnx_path]
+
+    if ort_path:
+        print(f"[INFO] Saving optimized ORT model -> {ort_path}")
+        save_ort_model(onnx_path, ort_path)
+        outputs.append(ort_path)
+
+    for path in outputs:
+        try:
+            report[path] = check_parity(model, path, batches, atol, rtol)
+        except ParityError:
+            for output in outputs:
+                if os.path.exists(output):
+                    os.remove(output)
+            raise
+        print(f"[OK] Parity check passed: {path} (max |Δlogit| = {report[path]:.2e})")
+
+    return report
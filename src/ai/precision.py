@@ -0,0 +1,142 @@
+"""
+Inference Precision
+Opt-in bfloat16 autocast for CPU inference with an accuracy guard
+
+bf16 only pays off on CPUs with native bf16 instructions (AVX512-BF16 or
+AMX); elsewhere oneDNN emulates it and it is slower than fp32. On startup the
+host is checked, the bf16 path is compared with fp32 on real reference
+clips, and fp32 stays in place unless top-1 agreement and probability drift
+are within limits.
+
+The reference clips are a spectrogram store of z-scored model inputs, built
+once with:
+    python evaluate_store.py build <audio_dir> models/reference_spectrograms
+"""
+import os
+
+import numpy as np
+import torch
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.evaluation import measure_latency, compare_to_reference
+
+
+PRECISIONS = ('fp32', 'bf16')
+
+# Accuracy guard defaults
+BF16_MIN_AGREEMENT = 99.0  # top-1 agreement with fp32 in percent
+BF16_MAX_PROB_DIFF = 0.05  # largest per-class probability change
+
+# CPU flags that mean native bf16 arithmetic
+BF16_CPU_FLAGS = ('avx512_bf16', 'amx_bf16')
+
+REFERENCE_BATCH_SIZE = 8
+
+# Real clips for the agreement check (spectrogram store, see module docstring)
+REFERENCE_STORE_PATH = "models/reference_spectrograms"
+REFERENCE_CLIPS = 64
+
+
+def _cpu_flags():
+    """CPU feature flags from /proc/cpuinfo (empty set where unavailable)"""
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    return set(line.split(':', 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def bf16_supported():
+    """
+    Whether this host runs bf16 natively
+
+    Returns:
+        (supported, reason)
+    """
+    if not torch.backends.mkldnn.is_available():
+        return False, "oneDNN (mkldnn) not available in this PyTorch build"
+
+    try:
+        if not torch.ops.mkldnn._is_mkldnn_bf16_supported():
+            return False, "oneDNN reports no bf16 support on this CPU"
+    except (AttributeError, RuntimeError):
+        pass
+
+    flags = _cpu_flags()
+    native = [flag for flag in BF16_CPU_FLAGS if flag in flags]
+    if flags and not native:
+        return False, "CPU lacks native bf16 (no AVX512-BF16 / AMX)"
+
+    return True, f"native bf16 ({', '.join(native)})" if native else "bf16 reported by oneDNN"
+
+
+def reference_batch(seed=0):
+    """Fixed random model input (fallback when no reference clips exist)"""
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((REFERENCE_BATCH_SIZE, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+
+
+def load_reference_batches(store_path=REFERENCE_STORE_PATH, max_clips=REFERENCE_CLIPS):
+    """
+    Real z-scored clips for the agreement check
+
+    Args:
+        store_path: Spectrogram store of preprocessed clips
+        max_clips: Use at most this many clips
+
+    Returns:
+        List of numpy arrays (N, 1, 128, 431); a random batch (with a warning)
+        if the store is missing or empty
+    """
+    from src.utils.spectrogram_store import SpectrogramStore, _store_paths
+
+    if store_path and all(os.path.exists(path) for path in _store_paths(store_path)):
+        try:
+            store = SpectrogramStore(store_path)
+            count = min(len(store), max_clips)
+            batches = [np.array(store.get_batch(start, min(start + REFERENCE_BATCH_SIZE, count)))
+                       for start in range(0, count, REFERENCE_BATCH_SIZE)]
+            if batches:
+                return batches
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARNING] Could not read reference clips {store_path}: {e}")
+
+    print(f"[WARNING] No reference clips at {store_path}, checking bf16 on random input "
+          "(build the store for a meaningful check)")
+    return [reference_batch()]
+
+
+def check_bf16(fp32_run, bf16_run, batches=None, min_agreement=BF16_MIN_AGREEMENT,
+               max_prob_diff=BF16_MAX_PROB_DIFF):
+    """
+    Compare bf16 against fp32 and time both at batch 1
+
+    Args:
+        fp32_run: batch -> logits in fp32
+        bf16_run: batch -> logits under bf16 autocast
+        batches: Reference inputs (default: load_reference_batches())
+        min_agreement: Required top-1 agreement in percent
+        max_prob_diff: Largest allowed probability change
+
+    Returns:
+        dict with 'accepted' (accuracy within limits), 'faster', 'top1_agreement',
+        'max_prob_diff', 'fp32_ms', 'bf16_ms', 'speedup'
+    """
+    batches = batches if batches is not None else load_reference_batches()
+    result = compare_to_reference(fp32_run, bf16_run, batches)
+
+    single = batches[0][:1]
+    fp32_ms = measure_latency(fp32_run, single)
+    bf16_ms = measure_latency(bf16_run, single)
+
+    result.update({
+        'accepted': result['top1_agreement'] >= min_agreement and result['max_prob_diff'] <= max_prob_diff,
+        'faster': bf16_ms < fp32_ms,
+        'fp32_ms': fp32_ms,
+        'bf16_ms': bf16_ms,
+        'speedup': fp32_ms / bf16_ms if bf16_ms else 0.0,
+    })
+    return result
@@ -0,0 +1,211 @@
+"""
+Structured Pruning
+Smaller ConvNeXt-Tiny variants that keep the served input/output interface
+
+Two structured cuts, both leaving the residual width of every stage intact:
+    mlp    - remove hidden channels of each block's MLP (fc1 rows / fc2 columns),
+             ranked by |fc1 row|_1 * |gamma * fc2 column|_1
+    blocks - drop whole blocks per stage, ranked by |gamma|_1 (layer scale:
+             how much the block adds to the residual stream); at least one
+             block is kept per stage
+
+The resulting shape is recorded as 'pruning' metadata in the checkpoint, and
+load_model() rebuilds the smaller architecture from it before loading the
+weights, so SoundClassifier serves pruned checkpoints like any other.
+"""
+import copy
+import os
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+
+# Hidden widths are rounded to this multiple (keeps GEMMs SIMD-friendly)
+CHANNEL_MULTIPLE = 8
+
+# Distillation temperature used when fine-tuning against the unpruned model
+DISTILL_TEMPERATURE = 2.0
+
+
+def _blocks(model):
+    """(stage index, block) for every ConvNeXt block, in order"""
+    return [(i, block) for i, stage in enumerate(model.stages) for block in stage.blocks]
+
+
+def _round_channels(count, total):
+    return int(min(total, max(CHANNEL_MULTIPLE, CHANNEL_MULTIPLE * round(count / CHANNEL_MULTIPLE))))
+
+
+def mlp_channel_scores(block):
+    """Importance of each MLP hidden channel of a block"""
+    fc1, fc2 = block.mlp.fc1, block.mlp.fc2
+    scale = block.gamma.detach().abs() if block.gamma is not None else torch.ones(fc2.out_features)
+    incoming = fc1.weight.detach().abs().sum(dim=1)
+    outgoing = (fc2.weight.detach().abs() * scale[:, None]).sum(dim=0)
+    return incoming * outgoing
+
+
+def _prune_linear_pair(block, keep):
+    """Keep only the given hidden channels of a block's MLP"""
+    fc1, fc2 = block.mlp.fc1, block.mlp.fc2
+    new_fc1 = nn.Linear(fc1.in_features, len(keep), bias=fc1.bias is not None)
+    new_fc2 = nn.Linear(len(keep), fc2.out_features, bias=fc2.bias is not None)
+    with torch.no_grad():
+        new_fc1.weight.copy_(fc1.weight[keep])
+        if fc1.bias is not None:
+            new_fc1.bias.copy_(fc1.bias[keep])
+        new_fc2.weight.copy_(fc2.weight[:, keep])
+        if fc2.bias is not None:
+            new_fc2.bias.copy_(fc2.bias)
+    block.mlp.fc1, block.mlp.fc2 = new_fc1, new_fc2
+
+
+def prune_model(model, mlp_ratio=0.0, block_ratio=0.0):
+    """
+    Structurally prune a ConvNeXt model
+
+    Args:
+        model: Float model (left untouched)
+        mlp_ratio: Fraction of MLP hidden channels removed in every block
+        block_ratio: Fraction of blocks removed in every stage
+
+    Returns:
+        (pruned copy in eval mode, pruning spec for the checkpoint)
+    """
+    model = copy.deepcopy(model).cpu().eval()
+
+    if block_ratio > 0:
+        for stage in model.stages:
+            blocks = list(stage.blocks)
+            drop = min(int(len(blocks) * block_ratio), len(blocks) - 1)
+            if drop <= 0:
+                continue
+            strength = [block.gamma.detach().abs().sum().item() for block in blocks]
+            keep = sorted(np.argsort(strength)[drop:])
+            stage.blocks = nn.Sequential(*[blocks[i] for i in keep])
+
+    if mlp_ratio > 0:
+        for _, block in _blocks(model):
+            hidden = block.mlp.fc1.out_features
+            keep_count = _round_channels(hidden * (1 - mlp_ratio), hidden)
+            keep = torch.argsort(mlp_channel_scores(block), descending=True)[:keep_count].sort().values
+            _prune_linear_pair(block, keep)
+
+    return model, pruning_spec(model, mlp_ratio, block_ratio)
+
+
+def pruning_spec(model, mlp_ratio=0.0, block_ratio=0.0):
+    """Architecture description stored as checkpoint['pruning']"""
+    return {
+        'depths': [len(stage.blocks) for stage in model.stages],
+        'mlp_hidden': [[block.mlp.fc1.out_features for block in stage.blocks] for stage in model.stages],
+        'mlp_ratio': mlp_ratio,
+        'block_ratio': block_ratio,
+    }
+
+
+def apply_pruning(model, spec):
+    """
+    Rebuild the pruned structure recorded in a checkpoint
+
+    Works on meta-device models too (new layers follow the default device).
+
+    Args:
+        model: Model from create_model()
+        spec: checkpoint['pruning'] dict
+
+    Returns:
+        Model ready for load_state_dict() of the pruned weights
+    """
+    for stage, depth, hidden_sizes in zip(model.stages, spec['depths'], spec['mlp_hidden']):
+        stage.blocks = nn.Sequential(*list(stage.blocks)[:depth])
+        for block, hidden in zip(stage.blocks, hidden_sizes):
+            fc1, fc2 = block.mlp.fc1, block.mlp.fc2
+            if fc1.out_features != hidden:
+                block.mlp.fc1 = nn.Linear(fc1.in_features, hidden, bias=fc1.bias is not None)
+                block.mlp.fc2 = nn.Linear(hidden, fc2.out_features, bias=fc2.bias is not None)
+    return model
+
+
+def save_pruned_checkpoint(model, spec, path, source_path=None):
+    """
+    Save a pruned model with its metadata
+
+    Args:
+        model: Model returned by prune_model() (optionally fine-tuned)
+        spec: Pruning spec returned by prune_model()
+        path: Output .pth path
+        source_path: Float checkpoint it was derived from
+    """
+    spec = dict(spec, source=os.path.basename(source_path) if source_path else None)
+    torch.save({'model_state_dict': model.state_dict(), 'pruning': spec}, path)
+
+
+def count_parameters(model):
+    """Number of parameters (including packed weights of dynamically quantized Linear layers)"""
+    total = sum(p.numel() for p in model.parameters())
+    for module in model.modules():
+        weight, bias = getattr(module, 'weight', None), getattr(module, 'bias', None)
+        if callable(weight) and callable(bias):
+            total += weight().numel() + (bias().numel() if bias() is not None else 0)
+    return total
+
+
+def finetune(model, teacher, batches, targets=None, epochs=1, lr=1e-4, distill_weight=0.5):
+    """
+    Recover accuracy after pruning
+
+    Loss is distillation from the unpruned teacher (KL at DISTILL_TEMPERATURE)
+    plus cross-entropy on clips with a known label.
+
+    Args:
+        model: Pruned model (trained in place)
+        teacher: Unpruned float model
+        batches: List of numpy inputs (N, 1, 128, 431)
+        targets: Matching list of int arrays (-1 = unlabelled), or None
+        epochs: Passes over the batches
+        lr: AdamW learning rate
+        distill_weight: Weight of the distillation term (1 - weight for CE)
+
+    Returns:
+        Mean loss of the last epoch
+    """
+    optimizer = torch.optim.AdamW(model.parameters(), lr=lr, weight_decay=1e-4)
+    temperature = DISTILL_TEMPERATURE
+    teacher.eval()
+    last_loss = 0.0
+
+    for epoch in range(epochs):
+        model.train()
+        losses = []
+        for i, batch in enumerate(batches):
+            inputs = torch.from_numpy(batch)
+            with torch.no_grad():
+                teacher_logits = teacher(inputs)
+            logits = model(inputs)
+
+            loss = F.kl_div(
+                F.log_softmax(logits / temperature, dim=1),
+                F.softmax(teacher_logits / temperature, dim=1),
+                reduction='batchmean'
+            ) * temperature ** 2
+
+            if targets is not None:
+                labels = torch.as_tensor(targets[i], dtype=torch.long)
+                labelled = labels >= 0
+                if labelled.any():
+                    ce = F.cross_entropy(logits[labelled], labels[labelled])
+                    loss = distill_weight * loss + (1 - distill_weight) * ce
+
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+            losses.append(loss.item())
+
+        last_loss = float(np.mean(losses)) if losses else 0.0
+        print(f"[INFO] Fine-tune epoch {epoch + 1}/{epochs}: loss {last_loss:.4f}")
+
+    model.eval()
+    return last_loss
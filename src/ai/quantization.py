@@ -0,0 +1,159 @@
+"""
+Quantization
+INT8 versions of the classifier for CPU-only deployment
+
+Schemes:
+    dynamic_int8 - PyTorch dynamic quantization of nn.Linear. The ConvNeXt
+                   MLPs are Linear layers and carry most of the FLOPs.
+                   Weights are stored as int8, activations are quantized on
+                   the fly. Saved as a .pth with 'quantization' metadata, so
+                   SoundClassifier loads it like any other checkpoint.
+    static_int8  - ONNX Runtime static QDQ quantization. Activation ranges
+                   are calibrated on a folder of local clips. Served with the
+                   'onnxruntime' backend.
+"""
+import copy
+import os
+
+import torch
+import torch.nn as nn
+
+from src.ai.audio_config import CLIP_SECONDS
+from src.ai.audio_processor import load_and_preprocess_batch
+
+
+QUANTIZATION_SCHEMES = ('dynamic_int8', 'static_int8')
+
+# Ops quantized by the static scheme. LayerNorm / GELU stay in float:
+# wrapping them in Q/DQ pairs costs more than it saves.
+STATIC_OP_TYPES = ['Conv', 'MatMul', 'Gemm']
+
+
+def quantize_dynamic(model):
+    """
+    Dynamically quantize the Linear layers to int8
+
+    Args:
+        model: Float torch.nn.Module (left untouched)
+
+    Returns:
+        Quantized copy (CPU, eval mode)
+    """
+    model = copy.deepcopy(model).cpu().eval()
+    return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
+
+def apply_quantization(model, info):
+    """
+    Rebuild the quantized structure recorded in a checkpoint
+
+    Args:
+        model: Float model from create_model()
+        info: checkpoint['quantization'] dict
+
+    Returns:
+        Model ready for load_state_dict() of the quantized weights
+    """
+    scheme = info.get('scheme')
+    if scheme != 'dynamic_int8':
+        raise ValueError(f"Unsupported quantization scheme in checkpoint: {scheme}")
+    return quantize_dynamic(model)
+
+
+def save_quantized_checkpoint(model, path, source_path=None):
+    """
+    Save a dynamically quantized model with its metadata
+
+    Args:
+        model: Model returned by quantize_dynamic()
+        path: Output .pth path
+        source_path: Float checkpoint it was derived from
+    """
+    torch.save({
+        'model_state_dict': model.state_dict(),
+        'quantization': {
+            'scheme': 'dynamic_int8',
+            'modules': ['Linear'],
+            'dtype': 'qint8',
+            'source': os.path.basename(source_path) if source_path else None,
+            'torch_version': str(torch.__version__),
+        },
+    }, path)
+
+
+def load_calibration_batches(paths, batch_size=8, max_clips=None):
+    """
+    Preprocess clips into model-input batches
+
+    Args:
+        paths: Audio file paths
+        batch_size: Clips per batch
+        max_clips: Use at most this many clips
+
+    Returns:
+        List of numpy arrays (N, 1, 128, 431)
+    """
+    paths = list(paths)[:max_clips] if max_clips else list(paths)
+    batches = []
+    for start in range(0, len(paths), batch_size):
+        batch, _ = load_and_preprocess_batch(paths[start:start + batch_size], max_seconds=CLIP_SECONDS)
+        batches.append(batch)
+    return batches
+
+
+class _CalibrationReader:
+    """Feeds calibration batches to onnxruntime.quantization (CalibrationDataReader protocol)"""
+
+    def __init__(self, input_name, batches):
+        self.input_name = input_name
+        self.batches = batches
+        self._iter = iter(batches)
+
+    def get_next(self):
+        batch = next(self._iter, None)
+        return None if batch is None else {self.input_name: batch}
+
+    def rewind(self):
+        self._iter = iter(self.batches)
+
+
+def quantize_onnx_static(onnx_path, output_path, calibration_batches, per_channel=True):
+    """
+    Statically quantize an ONNX model (QDQ format, int8 weights and activations)
+
+    Args:
+        onnx_path: Float .onnx model
+        output_path: Output .onnx path
+        calibration_batches: List of numpy inputs used to collect activation ranges
+        per_channel: Per-output-channel weight scales (more accurate for convs)
+    """
+    import onnxruntime as ort
+    from onnxruntime.quantization import quantize_static, QuantFormat, QuantType, CalibrationMethod
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    input_name = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider']).get_inputs()[0].name
+
+    # Shape inference + graph cleanup makes the quantizer see every tensor
+    prepared_path = f"{output_path}.prep.onnx"
+    try:
+        quant_pre_process(onnx_path, prepared_path)
+        source_path = prepared_path
+    except Exception as e:
+        print(f"[WARNING] Quantization pre-processing skipped: {e}")
+        source_path = onnx_path
+
+    try:
+        quantize_static(
+            source_path,
+            output_path,
+            _CalibrationReader(input_name, calibration_batches),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=per_channel,
+            op_types_to_quantize=STATIC_OP_TYPES,
+            calibrate_method=CalibrationMethod.MinMax,
+        )
+    finally:
+        if os.path.exists(prepared_path):
+            os.remove(prepared_path)
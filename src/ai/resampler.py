@@ -0,0 +1,90 @@
+"""
+Resampler Registry
+Reuses torchaudio Resample kernels keyed by (orig_sr, target_sr)
+"""
+import threading
+from collections import OrderedDict
+
+import torch
+import torchaudio.transforms as T
+
+from src.ai.feature_extractor import SR
+
+
+# Rates our recording devices deliver most often
+COMMON_DEVICE_RATES = (48000, 22050, 16000)
+
+# Number of rate pairs kept (least recently used pair is dropped first)
+RESAMPLER_CACHE_SIZE = 8
+
+
+_resamplers = OrderedDict()
+_resamplers_lock = threading.Lock()
+
+
+def get_resampler(orig_sr, target_sr=SR):
+    """
+    Get a cached Resample transform from the LRU cache
+
+    T.Resample computes its polyphase sinc kernel in __init__, so keeping one
+    instance per rate pair makes every later call a single strided conv1d.
+
+    Args:
+        orig_sr: Sample rate of the input waveform
+        target_sr: Sample rate to convert to
+
+    Returns:
+        torchaudio.transforms.Resample instance
+    """
+    key = (int(orig_sr), int(target_sr))
+
+    with _resamplers_lock:
+        resampler = _resamplers.get(key)
+        if resampler is not None:
+            _resamplers.move_to_end(key)
+            return resampler
+
+        resampler = T.Resample(key[0], key[1])
+        _resamplers[key] = resampler
+        if len(_resamplers) > RESAMPLER_CACHE_SIZE:
+            _resamplers.popitem(last=False)
+
+    return resampler
+
+
+def resample(waveform, orig_sr, target_sr=SR):
+    """
+    Resample a waveform (EXACTLY like Kaggle T.Resample(sr, SR)(waveform))
+
+    Args:
+        waveform: Waveform tensor (..., samples)
+        orig_sr: Sample rate of the input waveform
+        target_sr: Sample rate to convert to
+
+    Returns:
+        Resampled waveform tensor
+    """
+    if int(orig_sr) == int(target_sr):
+        return waveform
+
+    with torch.no_grad():
+        return get_resampler(orig_sr, target_sr)(waveform)
+
+
+def warmup_resamplers(rates=COMMON_DEVICE_RATES, target_sr=SR):
+    """
+    Precompute kernels for the common device rates
+
+    Args:
+        rates: Source sample rates to prepare
+        target_sr: Sample rate to convert to
+    """
+    for rate in rates:
+        if int(rate) != int(target_sr):
+            get_resampler(rate, target_sr)
+
+
+def clear_resampler_cache():
+    """Drop all cached kernels"""
+    with _resamplers_lock:
+        _resamplers.clear()
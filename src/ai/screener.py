@@ -0,0 +1,190 @@
+"""
+Cascade Screener
+Cheap first stage that decides whether a window is worth a ConvNeXt pass
+
+A logistic model on pooled statistics of the dB mel-spectrogram (about
+100 features, one dot product). It is distilled from the main model: a
+window is "interesting" if the full model is confident about it or its
+top class is an alert sound. The decision threshold is set for high
+recall, so the screener only drops windows the full model would not have
+reported anyway.
+
+Torch-free (numpy only).
+"""
+import os
+
+import numpy as np
+
+
+SCREENER_PATH = "models/screener.npz"
+
+# Mel bands are averaged in groups of this size before pooling
+BAND_GROUP = 4
+
+DEFAULT_RECALL = 0.98
+
+
+def pooled_mel_features(spec_db):
+    """
+    Pooled statistics of a dB mel-spectrogram
+
+    Args:
+        spec_db: (n_mels, frames) dB values (before z-scoring, so loudness is kept)
+
+    Returns:
+        float32 feature vector: per band-group mean / std / max over time,
+        plus global mean / std / max and the std of frame energy
+    """
+    spec = np.asarray(spec_db, dtype=np.float32)
+    spec = spec.reshape(spec.shape[-2], spec.shape[-1])
+    n_mels, frames = spec.shape
+
+    bands = spec[:n_mels - n_mels % BAND_GROUP].reshape(-1, BAND_GROUP, frames).mean(axis=1)
+    frame_energy = spec.mean(axis=0)
+
+    return np.concatenate([
+        bands.mean(axis=1),
+        bands.std(axis=1),
+        bands.max(axis=1),
+        [spec.mean(), spec.std(), spec.max(), frame_energy.std()],
+    ]).astype(np.float32)
+
+
+def distill_labels(probabilities, confidence_threshold, classes, alert_classes):
+    """
+    Targets for the screener from the full model's output
+
+    Args:
+        probabilities: (N, num_classes) full-model probabilities
+        confidence_threshold: Percent confidence the live view reports at
+        classes: Class names (index -> label)
+        alert_classes: Labels that must never be screened out
+
+    Returns:
+        bool array (N,) - True if the full model would report the window
+    """
+    probabilities = np.asarray(probabilities)
+    top = probabilities.argmax(axis=1)
+    confident = probabilities.max(axis=1) * 100 >= confidence_threshold
+    alert = np.isin(np.asarray(classes)[top], list(alert_classes))
+    return confident | alert
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -30, 30)))
+
+
+class Screener:
+    """Standardize -> linear -> sigmoid -> threshold"""
+
+    def __init__(self, mean, scale, weights, bias, threshold, info=None):
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.scale = np.asarray(scale, dtype=np.float32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = float(bias)
+        self.threshold = float(threshold)
+        self.info = dict(info or {})
+
+    def score(self, spec_db):
+        """Probability that the window is interesting"""
+        return self.score_features(pooled_mel_features(spec_db))
+
+    def score_features(self, features):
+        """score() for an already pooled feature vector (float32, as at run time)"""
+        features = (np.asarray(features, dtype=np.float32) - self.mean) / self.scale
+        return float(_sigmoid(features @ self.weights + self.bias))
+
+    def is_interesting(self, spec_db):
+        """True if the full model should look at this window"""
+        return self.score(spec_db) >= self.threshold
+
+    def covers(self, confidence_threshold):
+        """
+        True if the screener was trained for this reporting threshold or a stricter one
+
+        Windows are labelled at info['confidence_threshold']; with a lower
+        threshold the full model reports windows the screener learned to drop.
+        """
+        trained = self.info.get('confidence_threshold')
+        return trained is not None and float(confidence_threshold) >= float(trained)
+
+    def save(self, path=SCREENER_PATH):
+        """Write to .npz"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        np.savez(
+            path,
+            mean=self.mean, scale=self.scale, weights=self.weights,
+            bias=np.float64(self.bias), threshold=np.float64(self.threshold),
+            **{f'info_{key}': np.asarray(value) for key, value in self.info.items()}
+        )
+
+    @classmethod
+    def load(cls, path=SCREENER_PATH):
+        """Read from .npz"""
+        with np.load(path) as data:
+            info = {key[5:]: data[key].item() for key in data.files if key.startswith('info_')}
+            return cls(data['mean'], data['scale'], data['weights'],
+                       data['bias'], data['threshold'], info)
+
+
+def fit_screener(features, labels, recall_target=DEFAULT_RECALL, epochs=500, learning_rate=0.5, l2=1e-3):
+    """
+    Train a class-balanced logistic screener with full-batch gradient descent
+
+    Args:
+        features: (N, F) pooled_mel_features rows
+        labels: (N,) bool targets from distill_labels()
+        recall_target: Fraction of interesting windows that must pass
+        epochs: Gradient steps
+        learning_rate: Step size
+        l2: Weight decay
+
+    Returns:
+        Screener
+    """
+    x = np.asarray(features, dtype=np.float64)
+    y = np.asarray(labels, dtype=np.float64)
+
+    mean = x.mean(axis=0)
+    scale = x.std(axis=0) + 1e-6
+    x = (x - mean) / scale
+
+    # Balance classes so a rare "interesting" class is not ignored
+    positives = max(y.sum(), 1.0)
+    negatives = max(len(y) - y.sum(), 1.0)
+    sample_weight = np.where(y > 0, len(y) / (2 * positives), len(y) / (2 * negatives))
+
+    weights = np.zeros(x.shape[1])
+    bias = 0.0
+    for _ in range(epochs):
+        error = (_sigmoid(x @ weights + bias) - y) * sample_weight
+        weights -= learning_rate * (x.T @ error / len(y) + l2 * weights)
+        bias -= learning_rate * error.mean()
+
+    screener = Screener(mean, scale, weights, bias, threshold=1.0)
+
+    # Highest threshold that still keeps recall_target of the positives. Scored
+    # in float32 like at run time, so the boundary window is not lost to rounding.
+    positive_scores = np.sort([screener.score_features(f) for f in np.asarray(features)[y > 0]])
+    if len(positive_scores):
+        screener.threshold = float(positive_scores[int(np.floor((1 - recall_target) * len(positive_scores)))])
+
+    return screener
+
+
+def evaluate_screener(screener, features, labels):
+    """
+    Recall on interesting windows and fraction forwarded to the full model
+
+    Returns:
+        dict with 'recall', 'pass_rate', 'precision'
+    """
+    scores = np.array([screener.score_features(f) for f in np.asarray(features, dtype=np.float32)])
+    passed = scores >= screener.threshold
+    labels = np.asarray(labels, dtype=bool)
+
+    return {
+        'recall': float(passed[labels].mean()) if labels.any() else 1.0,
+        'pass_rate': float(passed.mean()) if len(passed) else 0.0,
+        'precision': float(labels[passed].mean()) if passed.any() else 0.0,
+    }
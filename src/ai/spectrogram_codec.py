@@ -0,0 +1,110 @@
+"""
+Spectrogram Codec
+Compact float16 / int8 storage for cached mel-spectrograms
+
+Spectrograms are stored as dB values before z-scoring. The model input
+is rebuilt on decode with the usual z-score + pad/crop, so one compact
+array replaces both the display spectrogram and the model input.
+
+Modes:
+    float32 - lossless (reference)
+    float16 - 2x smaller, < 0.05 dB error over the 80 dB range
+    int8    - 4x smaller, per-clip affine quantization (step = range / 255)
+"""
+import numpy as np
+
+from src.ai.audio_config import FIXED_WIDTH
+from src.ai.numpy_frontend import normalize_spectrogram
+
+
+CODEC_MODES = ('float32', 'float16', 'int8')
+
+
+class CompactSpectrogram:
+    """Encoded spectrogram plus the parameters needed to decode it"""
+
+    def __init__(self, mode, data, scale=1.0, offset=0.0):
+        self.mode = mode
+        self.data = data
+        self.scale = float(scale)
+        self.offset = float(offset)
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def to_arrays(self, prefix='spec'):
+        """Flatten into named arrays (for np.savez)"""
+        return {
+            f'{prefix}_data': self.data,
+            f'{prefix}_meta': np.array([self.scale, self.offset], dtype=np.float64),
+            f'{prefix}_mode': np.array(self.mode),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix='spec'):
+        """Rebuild from arrays written by to_arrays()"""
+        scale, offset = arrays[f'{prefix}_meta']
+        return cls(str(arrays[f'{prefix}_mode']), arrays[f'{prefix}_data'], scale, offset)
+
+
+def encode_spectrogram(spec_db, mode='float16'):
+    """
+    Encode a dB mel-spectrogram
+
+    Args:
+        spec_db: Mel-spectrogram in dB (n_mels, frames), numpy array or tensor
+        mode: 'float32', 'float16' or 'int8'
+
+    Returns:
+        CompactSpectrogram
+    """
+    if mode not in CODEC_MODES:
+        raise ValueError(f"Unknown codec mode '{mode}', expected one of {CODEC_MODES}")
+
+    spec = np.asarray(spec_db, dtype=np.float32)
+
+    if mode == 'float32':
+        return CompactSpectrogram(mode, spec.copy())
+    if mode == 'float16':
+        return CompactSpectrogram(mode, spec.astype(np.float16))
+
+    # int8: map [min, max] onto [-128, 127]
+    low = float(spec.min()) if spec.size else 0.0
+    high = float(spec.max()) if spec.size else 0.0
+    scale = (high - low) / 255.0 or 1.0
+    quantized = np.round((spec - low) / scale) - 128
+    return CompactSpectrogram(mode, np.clip(quantized, -128, 127).astype(np.int8), scale, low)
+
+
+def decode_spectrogram(compact):
+    """
+    Decode back to a float32 dB mel-spectrogram
+
+    Args:
+        compact: CompactSpectrogram
+
+    Returns:
+        numpy array (n_mels, frames) float32
+    """
+    if compact.mode == 'int8':
+        return ((compact.data.astype(np.float32) + 128.0) * compact.scale + compact.offset).astype(np.float32)
+    return compact.data.astype(np.float32)
+
+
+def decode_model_input(compact, fixed_width=FIXED_WIDTH):
+    """
+    Decode and rebuild the model input (z-score + pad/crop)
+
+    Args:
+        compact: CompactSpectrogram of dB values
+        fixed_width: Number of time frames fed to the model
+
+    Returns:
+        numpy array (1, 1, n_mels, fixed_width) float32
+    """
+    return normalize_spectrogram(decode_spectrogram(compact), fixed_width)
@@ -0,0 +1,156 @@
+"""
+Streaming Mel-Spectrogram Extractor
+Computes mel frames only for newly arrived audio and keeps a rolling window
+"""
+import threading
+
+import numpy as np
+import torch
+
+from src.ai.feature_extractor import (
+    SR, N_MELS, N_FFT, HOP_LENGTH, FIXED_WIDTH,
+    get_feature_extractor, normalize_spectrogram
+)
+
+
+class StreamingMelExtractor:
+    """
+    Incremental STFT/mel front end for live audio
+
+    Samples are pushed as they arrive. Every time another hop of audio is
+    available, only the new STFT frames are computed and appended to a rolling
+    (n_mels, num_frames) mel power matrix, so a model-ready spectrogram of the
+    latest window can be produced at any moment.
+
+    Frames use the same window, filterbank and dB conversion as the file
+    pipeline. The only difference from running the Kaggle chain on the raw
+    window is at the window edges, where streaming frames see real audio
+    instead of reflect padding.
+    """
+
+    def __init__(self, sample_rate=SR, n_fft=N_FFT, hop_length=HOP_LENGTH, n_mels=N_MELS,
+                 num_frames=FIXED_WIDTH, window_samples=None):
+        """
+        Initialize the streaming extractor
+
+        Args:
+            sample_rate: Sample rate of the incoming audio
+            n_fft: FFT size
+            hop_length: Hop between STFT frames
+            n_mels: Number of mel bands
+            num_frames: Number of frames kept in the rolling window (model width)
+            window_samples: Number of raw samples kept for display (default: 5 s)
+        """
+        self.sample_rate = sample_rate
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.n_mels = n_mels
+        self.num_frames = num_frames
+        self.window_samples = window_samples or int(sample_rate * 5.0)
+
+        self.extractor = get_feature_extractor(sample_rate, n_fft, hop_length, n_mels, 'cpu')
+        self._lock = threading.Lock()
+
+        self.reset()
+
+    def reset(self):
+        """Clear all buffered audio and frames"""
+        with self._lock:
+            # Half a window of leading silence centres frame t on sample t * hop,
+            # like torch.stft(center=True)
+            self._pending = torch.zeros(self.n_fft // 2)
+            self._power = torch.zeros(self.n_mels, self.num_frames)
+            self._filled = 0
+
+            self._audio = np.zeros(self.window_samples, dtype=np.float32)
+            self._audio_pos = 0
+            self.total_samples = 0
+
+    def push(self, samples):
+        """
+        Add new audio samples and compute the frames they complete
+
+        Args:
+            samples: Mono audio chunk (numpy array or tensor)
+
+        Returns:
+            Number of new mel frames computed
+        """
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+
+        with self._lock:
+            self._append_audio(samples)
+            self.total_samples += len(samples)
+
+            self._pending = torch.cat((self._pending, torch.from_numpy(samples)))
+            if len(self._pending) < self.n_fft:
+                return 0
+
+            new_frames = 1 + (len(self._pending) - self.n_fft) // self.hop_length
+            chunk = self._pending[:(new_frames - 1) * self.hop_length + self.n_fft]
+
+            with torch.no_grad():
+                power = self.extractor.mel_spec_uncentered(chunk.unsqueeze(0)).squeeze(0)
+
+            self._pending = self._pending[new_frames * self.hop_length:].clone()
+
+            if new_frames >= self.num_frames:
+                self._power = power[:, -self.num_frames:].clone()
+            else:
+                self._power = torch.cat((self._power[:, new_frames:], power), dim=1)
+            self._filled = min(self.num_frames, self._filled + new_frames)
+
+            return new_frames
+
+    def _append_audio(self, samples):
+        """Write samples into the raw audio ring buffer"""
+        if len(samples) >= self.window_samples:
+            self._audio[:] = samples[-self.window_samples:]
+            self._audio_pos = 0
+            return
+
+        end = self._audio_pos + len(samples)
+        if end <= self.window_samples:
+            self._audio[self._audio_pos:end] = samples
+        else:
+            split = self.window_samples - self._audio_pos
+            self._audio[self._audio_pos:] = samples[:split]
+            self._audio[:end - self.window_samples] = samples[split:]
+        self._audio_pos = end % self.window_samples
+
+    @property
+    def is_ready(self):
+        """True once a full window of frames is available"""
+        return self._filled >= self.num_frames
+
+    def get_waveform(self):
+        """
+        Get the latest raw audio window (oldest sample first)
+
+        Returns:
+            numpy array (window_samples,)
+        """
+        with self._lock:
+            return np.concatenate((self._audio[self._audio_pos:], self._audio[:self._audio_pos]))
+
+    def get_mel_db(self):
+        """
+        Get the rolling mel-spectrogram in dB
+
+        Returns:
+            numpy array (n_mels, frames) with up to num_frames frames
+        """
+        with self._lock:
+            power = self._power[:, self.num_frames - self._filled:]
+
+        with torch.no_grad():
+            return self.extractor.db_trans(power).numpy()
+
+    def get_model_input(self):
+        """
+        Get the rolling window ready for inference
+
+        Returns:
+            numpy array (1, 1, n_mels, num_frames) float32
+        """
+        return normalize_spectrogram(self.get_mel_db(), self.num_frames)
@@ -0,0 +1,209 @@
+"""
+Thread Tuning
+Benchmarks PyTorch intra-/inter-op thread counts and applies the best per host
+
+torch.set_num_interop_threads() only works before the first parallel op of
+a process, so every inter-op candidate is measured in a fresh child process
+(python -m src.ai.thread_tuning --child ...). Intra-op counts are swept
+inside each child. The batch-1 winner is chosen by p90 latency (live
+jitter), the batch-N winner by time per sample. Both are kept in a JSON
+profile keyed by host, and the classifier applies the batch-1 entry when it
+loads.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+THREAD_PROFILE_PATH = "cache/thread_profile.json"
+
+# Inter-op pools larger than this never helped a single ConvNeXt forward
+MAX_INTER_OP_THREADS = 4
+
+PROFILE_TARGETS = ('batch_1', 'batch_n')
+
+
+def host_key():
+    """Identifies the machine a profile was tuned on"""
+    return f"{platform.node()}|{platform.machine()}|{os.cpu_count()}"
+
+
+def candidate_threads(max_threads=None):
+    """Powers of two up to max_threads, plus max_threads itself"""
+    max_threads = max_threads or os.cpu_count() or 1
+    counts = {max_threads}
+    count = 1
+    while count < max_threads:
+        counts.add(count)
+        count *= 2
+    return sorted(counts)
+
+
+def _time_runs(model, batch, repeats):
+    """Median and p90 forward time in ms (after two warmup runs)"""
+    import torch
+
+    times = []
+    with torch.no_grad():
+        for i in range(repeats + 2):
+            start = time.perf_counter()
+            model(batch)
+            if i >= 2:
+                times.append((time.perf_counter() - start) * 1000)
+    return float(np.median(times)), float(np.percentile(times, 90))
+
+
+def measure_child(model_path, inter_op, intra_candidates, batch_sizes, repeats):
+    """
+    Measure all intra-op counts for one inter-op count (runs in a fresh process)
+
+    Returns:
+        List of dicts with 'intra', 'inter', 'batch_size', 'median_ms', 'p90_ms'
+    """
+    import torch
+
+    # Must happen before anything runs in parallel
+    torch.set_num_interop_threads(inter_op)
+
+    from src.ai.audio_config import N_MELS, FIXED_WIDTH
+    from src.ai.checkpoint_io import resolve_checkpoint_path
+    from src.ai.model_handler import load_model
+
+    model = load_model(resolve_checkpoint_path(model_path))
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for intra in intra_candidates:
+        torch.set_num_threads(intra)
+        for batch_size in batch_sizes:
+            batch = torch.from_numpy(
+                rng.standard_normal((batch_size, 1, N_MELS, FIXED_WIDTH)).astype(np.float32)
+            )
+            median_ms, p90_ms = _time_runs(model, batch, repeats)
+            rows.append({
+                'intra': intra, 'inter': inter_op, 'batch_size': batch_size,
+                'median_ms': median_ms, 'p90_ms': p90_ms,
+            })
+    return rows
+
+
+def tune_threads(model_path="models/best_convnext_tiny.pth", batch_size=8, repeats=10,
+                 max_threads=None, profile_path=THREAD_PROFILE_PATH):
+    """
+    Benchmark thread settings on this machine and save the winners
+
+    Args:
+        model_path: Checkpoint to benchmark
+        batch_size: N for the batch-N measurement
+        repeats: Timed forwards per configuration
+        max_threads: Largest thread count tried (default: CPU count)
+        profile_path: JSON file holding the per-host profiles
+
+    Returns:
+        (profile dict for this host, list of all measured rows)
+    """
+    intra_candidates = candidate_threads(max_threads)
+    inter_candidates = [n for n in intra_candidates if n <= MAX_INTER_OP_THREADS]
+    batch_sizes = sorted({1, batch_size})
+
+    rows = []
+    for inter in inter_candidates:
+        print(f"[INFO] Measuring inter-op={inter}, intra-op={intra_candidates}...")
+        output = subprocess.run(
+            [sys.executable, '-m', 'src.ai.thread_tuning', '--child', model_path, str(inter),
+             ','.join(map(str, intra_candidates)), ','.join(map(str, batch_sizes)), str(repeats)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        rows.extend(json.loads(output.strip().splitlines()[-1]))
+
+    single = [row for row in rows if row['batch_size'] == 1]
+    batched = [row for row in rows if row['batch_size'] == batch_size]
+    best_single = min(single, key=lambda row: row['p90_ms'])
+    best_batched = min(batched, key=lambda row: row['median_ms'])
+
+    profile = {
+        'batch_1': {key: best_single[key] for key in ('intra', 'inter', 'median_ms', 'p90_ms')},
+        'batch_n': {key: best_batched[key] for key in ('intra', 'inter', 'median_ms', 'p90_ms')},
+        'batch_size': batch_size,
+        'tuned_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    save_thread_profile(profile, profile_path)
+    return profile, rows
+
+
+def _read_profiles(profile_path):
+    if not os.path.exists(profile_path):
+        return {}
+    try:
+        with open(profile_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Could not read thread profile {profile_path}: {e}")
+        return {}
+
+
+def save_thread_profile(profile, profile_path=THREAD_PROFILE_PATH):
+    """Store the profile for this host (profiles of other hosts are kept)"""
+    profiles = _read_profiles(profile_path)
+    profiles[host_key()] = profile
+
+    os.makedirs(os.path.dirname(profile_path) or '.', exist_ok=True)
+    with open(profile_path, 'w', encoding='utf-8') as f:
+        json.dump(profiles, f, indent=2)
+
+
+def load_thread_profile(profile_path=THREAD_PROFILE_PATH):
+    """Tuned profile for this host, or None"""
+    return _read_profiles(profile_path).get(host_key())
+
+
+def apply_thread_settings(intra_op_threads=0, inter_op_threads=0, target='batch_1',
+                          profile_path=THREAD_PROFILE_PATH):
+    """
+    Set PyTorch thread counts from explicit values or the tuned profile
+
+    Args:
+        intra_op_threads: Override (0 = tuned profile, else PyTorch default)
+        inter_op_threads: Override (0 = tuned profile, else PyTorch default)
+        target: Profile entry to use ('batch_1' or 'batch_n')
+        profile_path: JSON file holding the per-host profiles
+
+    Returns:
+        (intra, inter) now in effect
+    """
+    import torch
+
+    tuned = (load_thread_profile(profile_path) or {}).get(target, {})
+    intra = intra_op_threads or tuned.get('intra', 0)
+    inter = inter_op_threads or tuned.get('inter', 0)
+    source = "override" if intra_op_threads or inter_op_threads else ("tuned profile" if tuned else "default")
+
+    if inter and inter != torch.get_num_interop_threads():
+        try:
+            torch.set_num_interop_threads(inter)
+        except RuntimeError as e:
+            # Already fixed for this process (parallel work has started)
+            print(f"[WARNING] Could not set inter-op threads to {inter}: {e}")
+    if intra:
+        torch.set_num_threads(intra)
+
+    intra, inter = torch.get_num_threads(), torch.get_num_interop_threads()
+    print(f"[INFO] PyTorch threads ({source}): intra-op={intra}, inter-op={inter}")
+    return intra, inter
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        _, _, path, inter, intra_list, batch_list, repeats = sys.argv
+        result = measure_child(
+            path, int(inter),
+            [int(n) for n in intra_list.split(',')],
+            [int(n) for n in batch_list.split(',')],
+            int(repeats)
+        )
+        print(json.dumps(result))
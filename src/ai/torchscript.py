@@ -0,0 +1,88 @@
+"""
+TorchScript Compilation
+Traced + frozen model with an on-disk cache
+
+The frozen graph is saved under cache/torchscript, keyed by checkpoint hash
+and torch version, so later launches skip tracing. optimize_for_inference
+(conv/bn folding, oneDNN layouts) is applied after loading because its
+output cannot be serialized.
+"""
+import os
+import re
+import uuid
+
+import torch
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+
+
+TORCHSCRIPT_CACHE_DIR = "cache/torchscript"
+
+
+def compiled_model_path(checkpoint_hash, cache_dir=TORCHSCRIPT_CACHE_DIR):
+    """
+    Cache file for a checkpoint under the running torch version
+
+    Args:
+        checkpoint_hash: SHA-256 of the checkpoint
+        cache_dir: Cache directory
+
+    Returns:
+        Path to the .pt file
+    """
+    torch_version = re.sub(r'[^0-9A-Za-z.]+', '_', str(torch.__version__))
+    return os.path.join(cache_dir, f"{checkpoint_hash[:16]}_torch{torch_version}.pt")
+
+
+def trace_and_freeze(model):
+    """
+    Trace with a (1, 1, 128, 431) example and freeze parameters into the graph
+
+    Args:
+        model: torch.nn.Module in eval mode (CPU)
+
+    Returns:
+        Frozen torch.jit.ScriptModule
+    """
+    example = torch.randn(1, 1, N_MELS, FIXED_WIDTH)
+    with torch.no_grad():
+        traced = torch.jit.trace(model.eval(), example)
+    return torch.jit.freeze(traced.eval())
+
+
+def load_or_compile(model, checkpoint_hash, cache_dir=TORCHSCRIPT_CACHE_DIR):
+    """
+    Load the cached frozen graph or build and cache it
+
+    Args:
+        model: Eager model the graph is traced from (used on cache miss)
+        checkpoint_hash: SHA-256 of the checkpoint
+        cache_dir: Cache directory
+
+    Returns:
+        (optimized torch.jit.ScriptModule, True if loaded from cache)
+    """
+    path = compiled_model_path(checkpoint_hash, cache_dir)
+    frozen = None
+    from_cache = False
+
+    if os.path.exists(path):
+        try:
+            frozen = torch.jit.load(path, map_location='cpu')
+            from_cache = True
+        except Exception as e:
+            print(f"[WARNING] Ignoring unreadable TorchScript cache {path}: {e}")
+
+    if frozen is None:
+        frozen = trace_and_freeze(model)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            torch.jit.save(frozen, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] TorchScript cache write failed: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return torch.jit.optimize_for_inference(frozen), from_cache
@@ -9,8 +9,11 @@ import base64
 
 from src.ai.audio_processor import load_and_preprocess_audio, mel_spectrogram_to_image
 from src.ai.model_handler import SoundClassifier
+from src.ai.long_recording import iter_window_detections
 from src.utils.state import app_state
 from src.utils.performance_metrics import performance_metrics
+from src.utils.feature_cache import feature_cache
+from src.ai.audio_config import PREPROCESSING_PARAMS, CLIP_SECONDS
 from src.ui.emergency_alert import EmergencyAlertOverlay, is_emergency_sound
 
 
@@ -27,6 +30,8 @@ class FileAnalysisView:
         self.spectrogram_image = None
         self.result_container = None
         self.analyze_button = None
+        self.timeline_button = None
+        self.timeline_container = None
         self.progress_ring = None
         self.play_button = None
         self.audio_player = None
@@ -75,6 +80,18 @@ class FileAnalysisView:
             )
         )
         
+        # Full-recording timeline button
+        self.timeline_button = ft.ElevatedButton(
+            "📈 Full Recording Timeline",
+            icon=ft.Icons.TIMELINE,
+            disabled=True,
+            on_click=self.analyze_timeline,
+            style=ft.ButtonStyle(
+                bgcolor="#F59E0B",
+                color="white"
+            )
+        )
+        
         # Play audio button
         self.play_button = ft.ElevatedButton(
             "🔊 Play Audio",
@@ -104,6 +121,15 @@ class FileAnalysisView:
             bgcolor="#1E293B"
         )
         
+        # Detection timeline container
+        self.timeline_container = ft.Container(
+            visible=False,
+            padding=20,
+            border=ft.border.all(1, "#334155"),
+            border_radius=10,
+            bgcolor="#1E293B"
+        )
+        
         # Layout
         return ft.Container(
             content=ft.Column([
@@ -120,7 +146,7 @@ class FileAnalysisView:
                     content=ft.Column([
                         ft.Text("Upload Audio File", size=18, weight=ft.FontWeight.BOLD),
                         ft.Row([upload_button, self.selected_file_text], spacing=15),
-                        ft.Row([self.analyze_button, self.play_button, self.progress_ring], spacing=10),
+                        ft.Row([self.analyze_button, self.timeline_button, self.play_button, self.progress_ring], spacing=10),
                     ], spacing=15),
                     padding=20,
                     border=ft.border.all(1, "#334155"),
@@ -147,6 +173,11 @@ class FileAnalysisView:
                 # Results section
                 self.result_container,
                 
+                ft.Container(height=20),
+                
+                # Timeline section (long recordings)
+                self.timeline_container,
+                
             ], scroll=ft.ScrollMode.AUTO, spacing=0),
             padding=20,
             expand=True
@@ -159,6 +190,7 @@ class FileAnalysisView:
             self.current_file_path = file.path
             self.selected_file_text.value = f"Selected: {file.name}"
             self.analyze_button.disabled = False
+            self.timeline_button.disabled = False
             self.play_button.disabled = False
             
             # Create audio player with the selected file
@@ -191,6 +223,11 @@ class FileAnalysisView:
     def _run_analysis(self):
         """Run analysis in background thread"""
         try:
+            # Requests made during startup wait for the background model load
+            if not self.classifier.is_ready:
+                print("[INFO] Waiting for the model to finish loading...")
+                self.classifier.wait_until_ready()
+            
             # Start measurement
             performance_metrics.start_measurement()
             
@@ -198,10 +235,29 @@ class FileAnalysisView:
             import torch
             device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
             
-            preprocessed, spec_for_display = load_and_preprocess_audio(
-                self.current_file_path,
-                device=device
-            )
+            # The model only sees one 5 s clip: decode just that region
+            max_seconds = CLIP_SECONDS if app_state.get_setting('bounded_decode') else None
+            
+            # Repeated files are served from the content-addressed cache
+            cache_key = None
+            cached = None
+            if not self.classifier.use_mock and app_state.get_setting('enable_feature_cache'):
+                cache_key = feature_cache.make_key(
+                    self.current_file_path,
+                    dict(PREPROCESSING_PARAMS, max_seconds=max_seconds),
+                    self.classifier.model_key
+                )
+                cached = feature_cache.get(cache_key)
+            
+            if cached is not None:
+                preprocessed = cached['preprocessed']
+                spec_for_display = cached['spec_for_display']
+            else:
+                preprocessed, spec_for_display = load_and_preprocess_audio(
+                    self.current_file_path,
+                    device=device,
+                    max_seconds=max_seconds
+                )
             
             if preprocessed is None:
                 self._show_error("Failed to load audio file")
@@ -214,11 +270,22 @@ class FileAnalysisView:
             self.spectrogram_image.src_base64 = self._image_to_base64(spec_img)
             self.spectrogram_image.visible = True
             
-            # Run prediction
-            result = self.classifier.predict(preprocessed)
-            
-            # Get top-5 predictions
-            top_predictions = self.classifier.get_top_k_predictions(preprocessed, k=5)
+            if cached is not None:
+                result = self.classifier.result_from_probs(cached['probabilities'])
+                top_predictions = self.classifier.top_k_from_probs(cached['probabilities'], k=5)
+            else:
+                # Run prediction (one forward pass gives top-1 and top-5)
+                classification = self.classifier.classify(preprocessed, k=5)
+                result = classification.to_dict()
+                top_predictions = classification.top_k
+                
+                if cache_key is not None and result['all_probs'] is not None:
+                    feature_cache.put(
+                        cache_key,
+                        preprocessed,
+                        spec_for_display,
+                        result['all_probs']
+                    )
             
             # End measurement
             performance_metrics.end_measurement()
@@ -252,6 +319,115 @@ class FileAnalysisView:
             self.analyze_button.disabled = False
             self.page.update()
     
+    def analyze_timeline(self, e):
+        """Classify the whole recording with sliding windows"""
+        if not self.current_file_path:
+            return
+        
+        self.analyze_button.disabled = True
+        self.timeline_button.disabled = True
+        self.progress_ring.visible = True
+        self.page.update()
+        
+        threading.Thread(target=self._run_timeline, daemon=True).start()
+    
+    def _run_timeline(self):
+        """Stream window detections into the timeline view (background thread)"""
+        try:
+            hop_seconds = app_state.get_setting('timeline_hop_seconds')
+            batch_size = max(1, int(app_state.get_setting('max_batch_size')))
+            threshold = app_state.get_setting('confidence_threshold')
+            
+            progress_text = ft.Text("Analyzing...", size=12, color="#94A3B8", italic=True)
+            rows = ft.Column([], spacing=6)
+            self.timeline_container.content = ft.Column([
+                ft.Text("📈 Detection Timeline", size=18, weight=ft.FontWeight.BOLD),
+                progress_text,
+                rows
+            ], spacing=10)
+            self.timeline_container.visible = True
+            self.page.update()
+            
+            # Requests made during startup wait for the background model load
+            if not self.classifier.is_ready:
+                progress_text.value = "Waiting for the model to finish loading..."
+                self.page.update()
+                self.classifier.wait_until_ready()
+                progress_text.value = "Analyzing..."
+                self.page.update()
+            
+            detections = 0
+            for window in iter_window_detections(self.current_file_path, self.classifier,
+                                                 hop_seconds=hop_seconds, batch_size=batch_size):
+                if window['confidence'] >= threshold:
+                    detections += 1
+                    rows.controls.append(self._timeline_row(window))
+                
+                progress_text.value = (
+                    f"Analyzed {window['index'] + 1}/{window['total']} windows "
+                    f"({hop_seconds:.1f}s hop) - {detections} detections ≥ {threshold:.0f}%"
+                )
+                
+                # Refresh once per batch instead of once per window
+                if (window['index'] + 1) % batch_size == 0 or window['index'] + 1 == window['total']:
+                    self.page.update()
+            
+            if detections == 0:
+                rows.controls.append(
+                    ft.Text("No detections above the confidence threshold", size=14, color="#94A3B8")
+                )
+            
+        except Exception as ex:
+            self._show_error(f"Timeline error: {str(ex)}")
+        
+        finally:
+            self.progress_ring.visible = False
+            self.analyze_button.disabled = False
+            self.timeline_button.disabled = False
+            self.page.update()
+    
+    def _timeline_row(self, window):
+        """Build one timeline row"""
+        color = "#EF4444" if window['is_alert'] else "#00D9FF"
+        return ft.Container(
+            content=ft.Row([
+                ft.Text(
+                    f"{self._format_time(window['start'])} - {self._format_time(window['end'])}",
+                    size=13,
+                    color="#94A3B8",
+                    width=120
+                ),
+                ft.Text(window['icon'], size=18),
+                ft.Text(
+                    window['label'].replace('_', ' ').title(),
+                    size=14,
+                    weight=ft.FontWeight.BOLD,
+                    color=color,
+                    width=180
+                ),
+                ft.ProgressBar(
+                    value=window['confidence'] / 100,
+                    color=color,
+                    bgcolor="#334155",
+                    width=200
+                ),
+                ft.Text(f"{window['confidence']:.1f}%", size=13, color="#F1F5F9"),
+            ], spacing=12),
+            padding=8,
+            border_radius=6,
+            bgcolor="#0F172A"
+        )
+    
+    @staticmethod
+    def _format_time(seconds):
+        """Format seconds as H:MM:SS or M:SS"""
+        seconds = int(seconds)
+        hours, rem = divmod(seconds, 3600)
+        minutes, secs = divmod(rem, 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{secs:02d}"
+        return f"{minutes}:{secs:02d}"
+    
     def _display_results(self, main_result, top_predictions):
         """Display analysis results"""
         # Main prediction
@@ -11,6 +11,9 @@ from src.ui.settings import SettingsView
 from src.ui.technical_stats import TechnicalStatsView
 from src.ui.sound_library import SoundLibraryView
 from src.ai.model_handler import SoundClassifier
+from src.ai.inference_engine import InferenceEngine
+from src.ai.model_loader import ModelLoader
+from src.ai.resampler import warmup_resamplers
 from src.utils.state import app_state
 import psutil
 
@@ -21,9 +24,21 @@ class MainLayout:
     def __init__(self, page: ft.Page):
         self.page = page
         
-        # Initialize classifier
-        self.classifier = SoundClassifier(model_path="models/best_convnext_tiny.pth", use_mock=False)
-        app_state.set_model_loaded(not self.classifier.use_mock)
+        # Load the classifier in the background so the window shows immediately
+        self.classifier = None
+        self.model_loader = ModelLoader(
+            self._create_classifier,
+            warmup=app_state.get_setting('warmup_on_load'),
+            fallback=self._create_mock_classifier,
+        )
+        self.model_loader.add_listener(self._on_model_state)
+        
+        # Concurrent views share one micro-batching queue (requests wait until the model is ready)
+        self.inference_engine = InferenceEngine(
+            self.model_loader.future,
+            max_batch_size=app_state.get_setting('max_batch_size'),
+            max_wait_ms=app_state.get_setting('max_batch_wait_ms'),
+        )
         
         # Current view
         self.current_view_index = 0
@@ -34,8 +49,61 @@ class MainLayout:
         self.status_bar = None
         
         # View instances
-        self.file_analysis_view = FileAnalysisView(page, self.classifier)
-        self.live_monitor_view = LiveMonitorView(page, self.classifier)
+        self.file_analysis_view = FileAnalysisView(page, self.inference_engine)
+        self.live_monitor_view = LiveMonitorView(page, self.inference_engine)
+        self.model_status_text = None
+        
+        self.model_loader.start()
+    
+    def _create_classifier(self):
+        """Build the classifier (runs on the model loader thread)"""
+        classifier = SoundClassifier(
+            model_path="models/best_convnext_tiny.pth",
+            use_mock=False,
+            backend=app_state.get_setting('inference_backend'),
+            onnx_path=app_state.get_setting('onnx_model_path'),
+            intra_op_threads=app_state.get_setting('intra_op_threads'),
+            inter_op_threads=app_state.get_setting('inter_op_threads'),
+            precision=app_state.get_setting('inference_precision'),
+            bf16_min_agreement=app_state.get_setting('bf16_min_agreement'),
+            bf16_reference=app_state.get_setting('bf16_reference_store'),
+        )
+        
+        # Precompute resampling kernels for 48k / 22.05k / 16k recordings
+        warmup_resamplers()
+        
+        self.classifier = classifier
+        return classifier
+    
+    def _create_mock_classifier(self):
+        """Mock classifier served when loading fails (like a failed load in the constructor)"""
+        self.classifier = SoundClassifier(use_mock=True)
+        return self.classifier
+    
+    def _model_status(self):
+        """Status bar text and color for the current load state"""
+        if self.model_loader.state == 'failed':
+            return "Status: ❌ Model failed to load (mock mode)", "#EF4444"
+        if not self.model_loader.is_ready:
+            return f"Status: ⏳ {self.model_loader.label}...", "#00D9FF"
+        if app_state.model_info['loaded']:
+            return "Status: ✅ Ready", "#10B981"
+        return "Status: ⚠️ Mock Mode", "#F59E0B"
+    
+    def _on_model_state(self, state):
+        """Model loader progress (called from the loader thread)"""
+        if state == 'ready':
+            app_state.set_model_loaded(not self.classifier.use_mock)
+        elif state == 'failed':
+            app_state.set_model_loaded(False)
+        
+        if self.model_status_text is None:
+            return
+        self.model_status_text.value, self.model_status_text.color = self._model_status()
+        try:
+            self.page.update()
+        except Exception:
+            pass
     
     def build(self):
         # Sidebar navigation
@@ -139,6 +207,10 @@ class MainLayout:
         # Microphone status (placeholder)
         mic_status = "🎤 Ready"
         
+        # Model load state (updated by the background loader)
+        status, color = self._model_status()
+        self.model_status_text = ft.Text(status, size=12, color=color)
+        
         # Model version
         model_version = f"Model: {app_state.model_info['name']} {app_state.model_info['version']}"
         
@@ -150,11 +222,7 @@ class MainLayout:
                 ft.VerticalDivider(width=1, color="#334155"),
                 ft.Text(model_version, size=12, color="#8B5CF6"),
                 ft.VerticalDivider(width=1, color="#334155"),
-                ft.Text(
-                    "Status: " + ("✅ Ready" if app_state.model_info['loaded'] else "⚠️ Mock Mode"),
-                    size=12,
-                    color="#10B981" if app_state.model_info['loaded'] else "#F59E0B"
-                ),
+                self.model_status_text,
             ], spacing=10),
             padding=10,
             bgcolor="#1E293B",
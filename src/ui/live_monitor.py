@@ -6,12 +6,18 @@ import numpy as np
 import sounddevice as sd
 import threading
 import queue
+import os
 import time
 from io import BytesIO
 import base64
 
-from src.ai.audio_processor import generate_mel_spectrogram, preprocess_for_model, waveform_to_image
+from src.ai.audio_processor import waveform_to_image
+from src.ai.activity_gate import ActivityGate
+from src.ai.streaming_mel import StreamingMelExtractor
+from src.ai.feature_extractor import normalize_spectrogram
 from src.ai.model_handler import SoundClassifier
+from src.ai.screener import Screener
+from src.utils.performance_metrics import performance_metrics
 from src.utils.state import app_state
 from src.ui.emergency_alert import EmergencyAlertOverlay, is_emergency_sound
 
@@ -27,6 +33,7 @@ class LiveMonitorView:
         self.sample_rate = 44100  # Match training sample rate
         self.duration = 5.0  # Match training duration (ESC-50 uses 5 second clips)
         self.buffer_size = int(self.sample_rate * self.duration)
+        self.window_hop = self.duration  # Seconds between predictions (< duration = overlapping windows)
         
         # Recording state
         self.is_recording = False
@@ -47,6 +54,10 @@ class LiveMonitorView:
         # Prediction thread
         self.prediction_thread = None
         self.should_stop = False
+        
+        # Cascade mode: cheap screener in front of the full model (None = off)
+        self.screener = None
+        self._screener_bypassed = False
     
     def build(self):
         # Control buttons
@@ -188,6 +199,8 @@ class LiveMonitorView:
             self.status_text.color = "#EF4444"
             self.page.update()
             
+            self.screener = self._load_screener()
+            
             # Start audio stream
             self.stream = sd.InputStream(
                 samplerate=self.sample_rate,
@@ -267,36 +280,64 @@ class LiveMonitorView:
     
     def _prediction_loop(self):
         """Background thread for continuous prediction"""
-        audio_buffer = []
+        streamer = StreamingMelExtractor(self.sample_rate, window_samples=self.buffer_size)
+        hop_samples = int(self.sample_rate * self.window_hop)
+        samples_since_prediction = 0
+        gate = ActivityGate(app_state.get_setting('activity_gate_db'))
         
         while not self.should_stop:
             try:
-                # Collect audio chunks
-                while len(audio_buffer) < self.buffer_size:
-                    if self.should_stop:
-                        return
-                    
-                    try:
-                        chunk = self.audio_queue.get(timeout=0.1)
-                        audio_buffer.extend(chunk.flatten())
-                    except queue.Empty:
-                        continue
+                # Feed new audio into the incremental mel front end
+                try:
+                    chunk = self.audio_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                
+                chunk = chunk.flatten()
+                streamer.push(chunk)
+                samples_since_prediction += len(chunk)
                 
-                # Get buffer for analysis
-                audio_data = np.array(audio_buffer[:self.buffer_size], dtype=np.float32)
-                audio_buffer = audio_buffer[self.buffer_size:]
+                # Wait for a full window of frames (431, like FeatureExtractor) and the next hop
+                if not streamer.is_ready or samples_since_prediction < hop_samples:
+                    continue
+                samples_since_prediction = 0
                 
                 # Update waveform
-                self._update_waveform(audio_data)
+                waveform = streamer.get_waveform()
+                self._update_waveform(waveform)
+                
+                # Model still loading in the background: skip this window
+                if not self.classifier.is_ready:
+                    continue
+                
+                # Activity gate: silence / steady background never reaches the model
+                if app_state.get_setting('activity_gate_enabled'):
+                    gate.gate_db = app_state.get_setting('activity_gate_db')
+                    level = gate.check(waveform)
+                    if not level['active']:
+                        performance_metrics.record_silent()
+                        print(f"[INFO] Window silent: {level['rms_db']:.1f} dBFS "
+                              f"(gate {level['threshold_db']:.1f} dBFS), skipped")
+                        continue
+                
+                # Rolling 128x431 spectrogram, already up to date
+                spec_db = streamer.get_mel_db()
                 
-                # Generate spectrogram
-                mel_spec = generate_mel_spectrogram(audio_data, self.sample_rate)
+                # Cascade: skip the full model when the screener sees nothing of interest
+                if self._screener_usable():
+                    start = time.perf_counter()
+                    interesting = self.screener.is_interesting(spec_db)
+                    performance_metrics.record_stage('screener', (time.perf_counter() - start) * 1000)
+                    if not interesting:
+                        performance_metrics.record_screened_out()
+                        continue
                 
-                # Preprocess
-                preprocessed = preprocess_for_model(mel_spec)
+                preprocessed = normalize_spectrogram(spec_db, streamer.num_frames)
                 
                 # Predict
+                start = time.perf_counter()
                 result = self.classifier.predict(preprocessed)
+                performance_metrics.record_stage('full_model', (time.perf_counter() - start) * 1000)
                 
                 # Always update prediction display
                 self._update_prediction(result)
@@ -330,6 +371,52 @@ class LiveMonitorView:
                 print(f"Prediction error: {ex}")
                 time.sleep(0.5)
     
+    def _load_screener(self):
+        """Screener for cascade mode, or None if disabled/unavailable"""
+        if not app_state.get_setting('cascade_enabled'):
+            return None
+        
+        path = app_state.get_setting('screener_path')
+        if not os.path.exists(path):
+            print(f"[WARNING] Cascade enabled but no screener at {path} (run train_screener.py)")
+            return None
+        
+        try:
+            screener = Screener.load(path)
+            print(f"[INFO] Cascade mode: screener loaded from {path}")
+        except Exception as e:
+            print(f"[WARNING] Could not load screener, cascade disabled: {e}")
+            return None
+        
+        self._screener_bypassed = False
+        self.screener = screener
+        self._screener_usable()
+        return screener
+    
+    def _screener_usable(self):
+        """
+        Whether the cascade may skip windows at the current confidence setting
+        
+        The screener is bypassed (with a warning on each change) while the
+        slider is below the threshold it was trained at.
+        """
+        if self.screener is None:
+            return False
+        
+        threshold = app_state.get_setting('confidence_threshold')
+        usable = self.screener.covers(threshold)
+        if usable == self._screener_bypassed:
+            self._screener_bypassed = not usable
+            if usable:
+                print(f"[INFO] Cascade screener active again at {threshold:.0f}% confidence")
+            else:
+                trained = self.screener.info.get('confidence_threshold')
+                trained = f"{float(trained):.0f}%" if trained is not None else "an unknown threshold"
+                print(f"[WARNING] Confidence threshold {threshold:.0f}% is below the {trained} the screener "
+                      f"was trained at, running the full model on every window (retrain with "
+                      f"train_screener.py --threshold {threshold:.0f})")
+        return usable
+    
     def _update_waveform(self, audio_data):
         """Update waveform display"""
         try:
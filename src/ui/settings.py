@@ -1,7 +1,10 @@
 """
 Settings View - Application settings and preferences
 """
+import os
+
 import flet as ft
+from src.ai.thread_tuning import candidate_threads, load_thread_profile
 from src.utils.state import app_state
 
 
@@ -57,6 +60,100 @@ def SettingsView(page: ft.Page):
         active_color="#10B981"
     )
     
+    # Activity gate (Live Monitor)
+    current_gate_db = app_state.get_setting('activity_gate_db')
+    
+    gate_text = ft.Text(
+        f"{current_gate_db:.0f} dBFS",
+        size=20,
+        weight=ft.FontWeight.BOLD,
+        color="#00D9FF"
+    )
+    
+    def on_gate_enabled_change(e):
+        """Handle activity gate switch change"""
+        app_state.update_setting('activity_gate_enabled', e.control.value)
+        page.update()
+    
+    def on_gate_db_change(e):
+        """Handle activity gate slider change"""
+        value = e.control.value
+        app_state.update_setting('activity_gate_db', value)
+        gate_text.value = f"{value:.0f} dBFS"
+        page.update()
+    
+    gate_switch = ft.Switch(
+        value=app_state.get_setting('activity_gate_enabled'),
+        on_change=on_gate_enabled_change,
+        active_color="#10B981"
+    )
+    
+    gate_slider = ft.Slider(
+        min=-80,
+        max=-20,
+        value=current_gate_db,
+        divisions=12,
+        label="{value} dBFS",
+        on_change=on_gate_db_change,
+        active_color="#00D9FF"
+    )
+    
+    # Inference threads (0 = tuned profile from tune_threads.py)
+    thread_options = [ft.dropdown.Option("0", "Auto")] + [
+        ft.dropdown.Option(str(n)) for n in candidate_threads(os.cpu_count())
+    ]
+    
+    def on_threads_change(key):
+        """Handle thread override dropdown change"""
+        def handler(e):
+            app_state.update_setting(key, int(e.control.value))
+            page.snack_bar = ft.SnackBar(
+                content=ft.Text("Thread settings apply the next time the model loads"),
+                bgcolor="#10B981"
+            )
+            page.snack_bar.open = True
+            page.update()
+        return handler
+    
+    intra_dropdown = ft.Dropdown(
+        label="Intra-op threads",
+        value=str(app_state.get_setting('intra_op_threads')),
+        options=thread_options,
+        on_change=on_threads_change('intra_op_threads'),
+        width=180
+    )
+    
+    inter_dropdown = ft.Dropdown(
+        label="Inter-op threads",
+        value=str(app_state.get_setting('inter_op_threads')),
+        options=thread_options,
+        on_change=on_threads_change('inter_op_threads'),
+        width=180
+    )
+    
+    def on_bf16_change(e):
+        """Handle bf16 precision switch change"""
+        app_state.update_setting('inference_precision', 'bf16' if e.control.value else 'fp32')
+        page.snack_bar = ft.SnackBar(
+            content=ft.Text("Precision applies the next time the model loads"),
+            bgcolor="#10B981"
+        )
+        page.snack_bar.open = True
+        page.update()
+    
+    bf16_switch = ft.Switch(
+        value=app_state.get_setting('inference_precision') == 'bf16',
+        on_change=on_bf16_change,
+        active_color="#10B981"
+    )
+    
+    tuned = (load_thread_profile() or {}).get('batch_1')
+    tuned_text = (
+        f"Tuned for this machine: intra-op {tuned['intra']}, inter-op {tuned['inter']} "
+        f"(p90 {tuned['p90_ms']:.0f} ms)"
+        if tuned else "Not tuned yet - run tune_threads.py"
+    )
+    
     # Layout
     return ft.Container(
         content=ft.Column([
@@ -89,6 +186,28 @@ def SettingsView(page: ft.Page):
                     ),
                     threshold_slider,
                     
+                    ft.Container(height=10),
+                    
+                    # Activity gate
+                    ft.Row([
+                        ft.Icon(ft.Icons.VOLUME_OFF, color="#00D9FF"),
+                        ft.Column([
+                            ft.Text("Activity Gate (Live Monitor)", size=16),
+                            ft.Text(
+                                "Bỏ qua cửa sổ im lặng hoặc chỉ có tiếng ồn nền, không chạy model",
+                                size=12,
+                                color="#94A3B8",
+                                italic=True
+                            ),
+                        ], spacing=2, expand=True),
+                        gate_switch,
+                    ], spacing=10, alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                    ft.Row([
+                        ft.Text("Gate Level", size=14, color="#94A3B8"),
+                        gate_text,
+                    ], spacing=10),
+                    gate_slider,
+                    
                 ], spacing=10),
                 padding=20,
                 border=ft.border.all(1, "#334155"),
@@ -129,6 +248,47 @@ def SettingsView(page: ft.Page):
             
             ft.Container(height=20),
             
+            # Performance Settings
+            ft.Container(
+                content=ft.Column([
+                    ft.Text("Performance Settings", size=20, weight=ft.FontWeight.BOLD),
+                    
+                    ft.Container(height=10),
+                    
+                    ft.Row([
+                        ft.Icon(ft.Icons.MEMORY, color="#00D9FF"),
+                        ft.Column([
+                            ft.Text("Inference Threads", size=16),
+                            ft.Text(tuned_text, size=12, color="#94A3B8", italic=True),
+                        ], spacing=2, expand=True),
+                    ], spacing=10),
+                    ft.Row([intra_dropdown, inter_dropdown], spacing=15),
+                    
+                    ft.Container(height=10),
+                    
+                    ft.Row([
+                        ft.Icon(ft.Icons.SPEED, color="#00D9FF"),
+                        ft.Column([
+                            ft.Text("bfloat16 Inference (CPU)", size=16),
+                            ft.Text(
+                                "Nhanh hơn trên CPU hỗ trợ bf16; tự động quay về fp32 nếu sai lệch so với fp32",
+                                size=12,
+                                color="#94A3B8",
+                                italic=True
+                            ),
+                        ], spacing=2, expand=True),
+                        bf16_switch,
+                    ], spacing=10, alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                    
+                ], spacing=10),
+                padding=20,
+                border=ft.border.all(1, "#334155"),
+                border_radius=10,
+                bgcolor="#1E293B"
+            ),
+            
+            ft.Container(height=20),
+            
             # Model Info
             ft.Container(
                 content=ft.Column([
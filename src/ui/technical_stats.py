@@ -18,6 +18,12 @@ class TechnicalStatsView:
         self.postprocessing_text = ft.Text("0.00 ms", size=18, weight=ft.FontWeight.BOLD, color="#F59E0B")
         self.total_latency_text = ft.Text("0.00 ms", size=18, weight=ft.FontWeight.BOLD, color="#8B5CF6")
         self.fps_text = ft.Text("0.00 FPS", size=18, weight=ft.FontWeight.BOLD, color="#EC4899")
+        
+        # Cascade mode
+        self.screener_calls_text = ft.Text("0", size=18, weight=ft.FontWeight.BOLD, color="#00D9FF")
+        self.full_model_calls_text = ft.Text("0", size=18, weight=ft.FontWeight.BOLD, color="#10B981")
+        self.cascade_saved_text = ft.Text("0.0%", size=18, weight=ft.FontWeight.BOLD, color="#F59E0B")
+        self.silent_windows_text = ft.Text("0", size=18, weight=ft.FontWeight.BOLD, color="#94A3B8")
     
     def build(self):
         """Build the technical stats view"""
@@ -50,6 +56,9 @@ class TechnicalStatsView:
         # == SECTION 2: Model Metadata ==
         model_metadata_section = self._create_model_metadata_section(metadata)
         
+        # == SECTION 3: Cascade ==
+        cascade_section = self._create_cascade_section()
+        
         # Refresh button
         refresh_button = ft.Container(
             content=ft.ElevatedButton(
@@ -73,6 +82,8 @@ class TechnicalStatsView:
                 ft.Container(height=20),
                 model_metadata_section,
                 ft.Container(height=20),
+                cascade_section,
+                ft.Container(height=20),
                 refresh_button,
             ], scroll=ft.ScrollMode.AUTO, spacing=0),
             padding=20,
@@ -203,7 +214,69 @@ class TechnicalStatsView:
                 
                 ft.Container(height=10),
                 
-                self._create_info_row("Number of Classes", str(metadata['num_classes']), "🏷️"),
+                ft.Row([
+                    self._create_info_row("Number of Classes", str(metadata['num_classes']), "🏷️"),
+                    self._create_info_row("Inference Backend", metadata['backend'], "🏎️"),
+                ], spacing=20, wrap=True),
+                
+                ft.Container(height=10),
+                
+                self._create_info_row("Backend Selection", metadata['backend_reason'], "🧪", width=620),
+                
+                ft.Container(height=10),
+                
+                self._create_info_row("Precision", self._precision_summary(metadata), "🔢", width=620),
+            ], spacing=5),
+            padding=20,
+            border=ft.border.all(1, "#334155"),
+            border_radius=10,
+            bgcolor="#1E293B"
+        )
+    
+    def _create_cascade_section(self):
+        """Create live window skipping (activity gate, cascade) statistics section"""
+        self._update_cascade_texts()
+        
+        return ft.Container(
+            content=ft.Column([
+                ft.Text(
+                    "🪜 Activity Gate & Cascade",
+                    size=24,
+                    weight=ft.FontWeight.BOLD,
+                    color="#F1F5F9"
+                ),
+                ft.Container(height=10),
+                
+                ft.Row([
+                    self._create_metric_card(
+                        "Screener Calls",
+                        self.screener_calls_text,
+                        "🔍",
+                        "#00D9FF",
+                        "Cửa sổ được model sàng lọc nhẹ kiểm tra"
+                    ),
+                    self._create_metric_card(
+                        "Full Model Calls",
+                        self.full_model_calls_text,
+                        "🧠",
+                        "#10B981",
+                        "Cửa sổ được chuyển tiếp đến ConvNeXt"
+                    ),
+                    self._create_metric_card(
+                        "Compute Saved",
+                        self.cascade_saved_text,
+                        "💡",
+                        "#F59E0B",
+                        "Thời gian CPU tiết kiệm nhờ bỏ qua cửa sổ không quan trọng"
+                    ),
+                    self._create_metric_card(
+                        "Silent Windows",
+                        self.silent_windows_text,
+                        "🔇",
+                        "#94A3B8",
+                        "Cửa sổ im lặng bị bỏ qua bởi activity gate"
+                    ),
+                ], spacing=15, wrap=True),
             ], spacing=5),
             padding=20,
             border=ft.border.all(1, "#334155"),
@@ -211,7 +284,25 @@ class TechnicalStatsView:
             bgcolor="#1E293B"
         )
     
-    def _create_info_row(self, label: str, value: str, icon: str):
+    def _update_cascade_texts(self):
+        """Copy activity gate / cascade counters into the text controls"""
+        stats = performance_metrics.get_cascade_stats()
+        gate_stats = performance_metrics.get_gate_stats()
+        
+        self.screener_calls_text.value = f"{stats['screener_calls']} ({stats['avg_screener_ms']:.2f} ms)"
+        self.full_model_calls_text.value = f"{stats['full_model_calls']} ({stats['avg_full_model_ms']:.1f} ms)"
+        self.cascade_saved_text.value = f"{stats['saved_percent']:.1f}% ({stats['saved_ms'] / 1000:.1f} s)"
+        self.silent_windows_text.value = f"{gate_stats['silent_windows']} ({gate_stats['saved_ms'] / 1000:.1f} s)"
+    
+    def _precision_summary(self, metadata: dict):
+        """Precision in use plus the measured bf16 gain"""
+        gain = performance_metrics.get_precision_gain()
+        summary = f"{metadata['precision']} - {metadata['precision_reason']}"
+        if gain:
+            summary += f" (bf16 {gain['bf16_ms']:.1f} ms vs fp32 {gain['fp32_ms']:.1f} ms, {gain['speedup']:.2f}x)"
+        return summary
+    
+    def _create_info_row(self, label: str, value: str, icon: str, width: int = 300):
         """Create an information row"""
         return ft.Container(
             content=ft.Row([
@@ -226,7 +317,7 @@ class TechnicalStatsView:
             border_radius=8,
             bgcolor="#0F172A",
             border=ft.border.all(1, "#334155"),
-            width=300,
+            width=width,
         )
     
     def refresh_metrics(self, e):
@@ -239,6 +330,7 @@ class TechnicalStatsView:
         self.postprocessing_text.value = f"{metrics['postprocessing_time']:.2f} ms"
         self.total_latency_text.value = f"{metrics['total_latency']:.2f} ms"
         self.fps_text.value = f"{metrics['real_time_fps']:.2f} FPS"
+        self._update_cascade_texts()
         
         self.page.update()
         
@@ -259,3 +351,4 @@ class TechnicalStatsView:
         self.postprocessing_text.value = f"{metrics['postprocessing_time']:.2f} ms"
         self.total_latency_text.value = f"{metrics['total_latency']:.2f} ms"
         self.fps_text.value = f"{metrics['real_time_fps']:.2f} FPS"
+        self._update_cascade_texts()
@@ -0,0 +1,199 @@
+"""
+Feature Cache
+On-disk, content-addressed cache for preprocessed features and predictions
+"""
+import hashlib
+import os
+import threading
+import uuid
+
+import numpy as np
+
+from src.utils.hashing import hash_file, hash_params
+from src.ai.spectrogram_codec import (
+    CompactSpectrogram, encode_spectrogram, decode_spectrogram, decode_model_input
+)
+
+
+class FeatureCache:
+    """
+    Cache keyed by (audio content hash, preprocessing params, model checkpoint hash)
+
+    Each entry is one .npz file holding the preprocessed model input, the
+    display spectrogram and the probability vector. Entries are evicted
+    least-recently-used first once the directory exceeds max_size_mb.
+
+    With storage='float16' or 'int8' only the compact dB spectrogram is
+    written and the model input is rebuilt from it on lookup.
+    """
+
+    def __init__(self, cache_dir: str = "cache/features", max_size_mb: float = 512, storage: str = 'float16'):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory for cache entries
+            max_size_mb: Size budget before LRU eviction kicks in
+            storage: 'float32' (exact), 'float16' or 'int8' (see spectrogram_codec)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.storage = storage
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+        # Counters (for Tech Stats / debugging)
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, file_path: str, params: dict, model_hash: str) -> str:
+        """
+        Build the cache key for an audio file
+
+        Args:
+            file_path: Path to audio file
+            params: Preprocessing parameters
+            model_hash: Hash of the model checkpoint
+
+        Returns:
+            Hex key string
+        """
+        parts = f"{hash_file(file_path)}:{hash_params(params)}:{model_hash}"
+        return hashlib.sha256(parts.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def get(self, key: str):
+        """
+        Look up an entry
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            dict with 'preprocessed', 'spec_for_display', 'probabilities', or None
+        """
+        path = self._entry_path(key)
+        try:
+            with np.load(path) as data:
+                if 'spec_data' in data:
+                    compact = CompactSpectrogram.from_arrays(data)
+                    entry = {
+                        'preprocessed': decode_model_input(compact),
+                        'spec_for_display': decode_spectrogram(compact),
+                        'probabilities': data['probabilities'],
+                    }
+                else:
+                    entry = {
+                        'preprocessed': data['preprocessed'],
+                        'spec_for_display': data['spec_for_display'],
+                        'probabilities': data['probabilities'],
+                    }
+            # Touch for LRU ordering
+            os.utime(path, None)
+        except (OSError, KeyError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, preprocessed, spec_for_display, probabilities):
+        """
+        Store an entry
+
+        Args:
+            key: Key from make_key()
+            preprocessed: Model input (1, 1, 128, 431)
+            spec_for_display: Mel-spectrogram in dB
+            probabilities: Probability vector
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+        # Size of the entry being replaced (0 for a new key)
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+
+        try:
+            probabilities = np.asarray(probabilities, dtype=np.float32)
+            with open(tmp_path, 'wb') as f:
+                if self.storage == 'float32':
+                    np.savez(
+                        f,
+                        preprocessed=np.asarray(preprocessed, dtype=np.float32),
+                        spec_for_display=np.asarray(spec_for_display, dtype=np.float32),
+                        probabilities=probabilities,
+                    )
+                else:
+                    compact = encode_spectrogram(spec_for_display, self.storage)
+                    np.savez(f, probabilities=probabilities, **compact.to_arrays())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] Feature cache write failed: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += os.path.getsize(path) - old_size
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _list_entries(self):
+        """List (mtime, size, path) for all entries"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.npz'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._list_entries())
+
+    def _evict(self):
+        """Remove least recently used entries until under budget"""
+        entries = sorted(self._list_entries())
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+        self._total_bytes = total
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            for _, _, path in self._list_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes = 0
+
+
+# Global instance
+feature_cache = FeatureCache()
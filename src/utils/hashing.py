@@ -0,0 +1,67 @@
+"""
+Hashing Helpers
+Content hashes for audio files, checkpoints and parameter sets
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+# Number of file hashes kept (least recently used file is dropped first)
+FILE_HASH_MEMO_SIZE = 1024
+
+_file_hash_memo = OrderedDict()
+_file_hash_lock = threading.Lock()
+
+
+def hash_file(file_path, chunk_size=1024 * 1024):
+    """
+    SHA-256 of a file's content
+
+    Results are memoized on (path, size, mtime) in a small LRU, so asking
+    again for an unchanged file does not re-read it.
+
+    Args:
+        file_path: Path to file
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest string
+    """
+    stat = os.stat(file_path)
+    memo_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+    with _file_hash_lock:
+        digest = _file_hash_memo.get(memo_key)
+        if digest is not None:
+            _file_hash_memo.move_to_end(memo_key)
+            return digest
+
+    sha = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            sha.update(block)
+    digest = sha.hexdigest()
+
+    with _file_hash_lock:
+        _file_hash_memo[memo_key] = digest
+        if len(_file_hash_memo) > FILE_HASH_MEMO_SIZE:
+            _file_hash_memo.popitem(last=False)
+
+    return digest
+
+
+def hash_params(params):
+    """
+    Stable SHA-256 of a JSON-serializable parameter dict
+
+    Args:
+        params: Dictionary of parameters
+
+    Returns:
+        Hex digest string
+    """
+    payload = json.dumps(params, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
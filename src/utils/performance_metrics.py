@@ -7,6 +7,10 @@ from typing import Dict, Optional
 from collections import deque
 
 
+# Stages of the live cascade (cheap screener, then ConvNeXt)
+CASCADE_STAGES = ('screener', 'full_model')
+
+
 class PerformanceMetrics:
     """Track timing metrics for audio processing and inference"""
     
@@ -37,8 +41,23 @@ class PerformanceMetrics:
             'optimizer': 'AdamW (Weight Decay: 1e-4)',
             'dataset': 'ESC-50',
             'num_classes': 50,
+            'backend': 'pytorch',
+            'backend_reason': 'default',
+            'precision': 'fp32',
+            'precision_reason': 'default',
         }
         
+        # Startup fp32 vs bf16 comparison (empty until bf16 was requested)
+        self.precision_check: Dict[str, float] = {}
+        
+        # Cascade mode: calls and time per stage, windows the screener dropped
+        self.stage_calls: Dict[str, int] = {stage: 0 for stage in CASCADE_STAGES}
+        self.stage_time: Dict[str, float] = {stage: 0.0 for stage in CASCADE_STAGES}
+        self.windows_screened_out: int = 0
+        
+        # Activity gate: live windows skipped as silent
+        self.windows_silent: int = 0
+        
         # Timing context
         self._start_time: Optional[float] = None
         self._phase_times: Dict[str, float] = {}
@@ -124,6 +143,94 @@ class PerformanceMetrics:
         """Update model format (.pth or .onnx)"""
         self.model_metadata['model_format'] = format_type
     
+    def update_parameter_count(self, count: int):
+        """Update the parameter count of the loaded model (e.g. after pruning)"""
+        self.model_metadata['parameters'] = f"{count / 1e6:.1f}M"
+    
+    def update_backend(self, backend: str, reason: str):
+        """Update the inference backend in use and why it was chosen"""
+        self.model_metadata['backend'] = backend
+        self.model_metadata['backend_reason'] = reason
+    
+    def update_precision(self, precision: str, reason: str, check: Optional[Dict] = None):
+        """
+        Update the numeric precision in use and the fp32 vs bf16 measurement
+        
+        Args:
+            precision: 'fp32' or 'bf16'
+            reason: Why this precision is active
+            check: Result of the startup bf16 check (latencies, speedup, agreement)
+        """
+        self.model_metadata['precision'] = precision
+        self.model_metadata['precision_reason'] = reason
+        self.precision_check = dict(check or {})
+    
+    def get_precision_gain(self) -> Dict[str, float]:
+        """
+        Measured latency gain of bf16 over fp32 at startup
+        
+        Returns:
+            Dictionary with 'fp32_ms', 'bf16_ms', 'speedup' (empty if not measured)
+        """
+        return {key: self.precision_check[key] for key in ('fp32_ms', 'bf16_ms', 'speedup')
+                if key in self.precision_check}
+    
+    def record_stage(self, stage: str, duration_ms: float):
+        """Count one call of a cascade stage and its time in ms"""
+        self.stage_calls[stage] += 1
+        self.stage_time[stage] += duration_ms
+    
+    def record_screened_out(self):
+        """Count a window the screener kept away from the full model"""
+        self.windows_screened_out += 1
+    
+    def record_silent(self):
+        """Count a window the activity gate skipped as silent"""
+        self.windows_silent += 1
+    
+    def get_gate_stats(self) -> Dict[str, float]:
+        """
+        Silent-window count and the full-model time it avoided
+        
+        Returns:
+            Dictionary with 'silent_windows' and 'saved_ms'
+        """
+        full_calls = self.stage_calls['full_model']
+        avg_full = self.stage_time['full_model'] / full_calls if full_calls else 0.0
+        return {
+            'silent_windows': self.windows_silent,
+            'saved_ms': self.windows_silent * avg_full,
+        }
+    
+    def get_cascade_stats(self) -> Dict[str, float]:
+        """
+        Per-stage call counts and the measured compute saved by the screener
+        
+        Savings are the skipped windows times the average full-model time,
+        minus what the screener itself cost.
+        
+        Returns:
+            Dictionary with call counts, average stage times (ms), saved ms and percent
+        """
+        screener_calls = self.stage_calls['screener']
+        full_calls = self.stage_calls['full_model']
+        avg_full = self.stage_time['full_model'] / full_calls if full_calls else 0.0
+        avg_screener = self.stage_time['screener'] / screener_calls if screener_calls else 0.0
+        
+        without_cascade = (full_calls + self.windows_screened_out) * avg_full
+        with_cascade = self.stage_time['full_model'] + self.stage_time['screener']
+        saved = without_cascade - with_cascade
+        
+        return {
+            'screener_calls': screener_calls,
+            'full_model_calls': full_calls,
+            'screened_out': self.windows_screened_out,
+            'avg_screener_ms': avg_screener,
+            'avg_full_model_ms': avg_full,
+            'saved_ms': saved,
+            'saved_percent': saved / without_cascade * 100 if without_cascade else 0.0,
+        }
+    
     def reset(self):
         """Reset all metrics"""
         self.preprocessing_time = 0.0
@@ -131,6 +238,10 @@ class PerformanceMetrics:
         self.postprocessing_time = 0.0
         self.total_time = 0.0
         self.inference_history.clear()
+        self.stage_calls = {stage: 0 for stage in CASCADE_STAGES}
+        self.stage_time = {stage: 0.0 for stage in CASCADE_STAGES}
+        self.windows_screened_out = 0
+        self.windows_silent = 0
         self._start_time = None
         self._phase_times = {}
 
@@ -0,0 +1,166 @@
+"""
+Spectrogram Store
+Memory-mapped corpus of preprocessed 128x431 spectrograms for bulk evaluation
+
+Layout:
+    <name>.npy        float32 array (N, 1, 128, 431), standard .npy header
+    <name>.index.json (path, row, byte offset, original frames) per clip
+"""
+import json
+import os
+
+import numpy as np
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH, PREPROCESSING_PARAMS
+
+
+INDEX_VERSION = 1
+
+
+def _store_paths(store_path):
+    """Return (.npy path, .index.json path) for a store name"""
+    base = store_path[:-4] if store_path.endswith('.npy') else store_path
+    return f"{base}.npy", f"{base}.index.json"
+
+
+class SpectrogramStoreBuilder:
+    """Write preprocessed spectrograms into a preallocated memory-mapped array"""
+
+    def __init__(self, store_path: str, capacity: int, n_mels: int = N_MELS, fixed_width: int = FIXED_WIDTH):
+        """
+        Create the store files
+
+        Args:
+            store_path: Output path (with or without .npy)
+            capacity: Maximum number of clips
+            n_mels: Number of mel bands
+            fixed_width: Number of time frames per clip
+        """
+        self.data_path, self.index_path = _store_paths(store_path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.data_path)), exist_ok=True)
+
+        self.data = np.lib.format.open_memmap(
+            self.data_path, mode='w+', dtype=np.float32, shape=(capacity, 1, n_mels, fixed_width)
+        )
+        self.item_bytes = int(np.prod(self.data.shape[1:])) * self.data.itemsize
+        self.items = []
+
+    def add(self, path: str, preprocessed, original_frames: int):
+        """
+        Append one clip
+
+        Args:
+            path: Source audio path
+            preprocessed: Model input (1, 1, 128, 431) or (1, 128, 431)
+            original_frames: Frames in the spectrogram before pad/crop
+        """
+        row = len(self.items)
+        if row >= len(self.data):
+            raise IndexError(f"Store is full ({len(self.data)} clips)")
+
+        self.data[row] = np.asarray(preprocessed, dtype=np.float32).reshape(self.data.shape[1:])
+        self.items.append({
+            'path': path,
+            'row': row,
+            'offset': int(self.data.offset + row * self.item_bytes),
+            'original_frames': int(original_frames),
+        })
+
+    def close(self):
+        """Flush data and write the index file"""
+        self.data.flush()
+
+        index = {
+            'version': INDEX_VERSION,
+            'dtype': 'float32',
+            'shape': [len(self.items)] + list(self.data.shape[1:]),
+            'preprocessing': PREPROCESSING_PARAMS,
+            'items': self.items,
+        }
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=1)
+
+        del self.data
+
+
+def build_spectrogram_store(file_paths, store_path: str, batch_size: int = 32, device='cpu'):
+    """
+    Preprocess audio files into a spectrogram store
+
+    Args:
+        file_paths: List of audio file paths
+        store_path: Output path (with or without .npy)
+        batch_size: Files preprocessed per batch
+        device: torch device for the mel front end
+
+    Returns:
+        Number of clips written
+    """
+    from src.ai.audio_processor import load_and_preprocess_batch, load_and_preprocess_audio
+
+    file_paths = list(file_paths)
+    builder = SpectrogramStoreBuilder(store_path, capacity=len(file_paths))
+
+    for start in range(0, len(file_paths), batch_size):
+        paths = file_paths[start:start + batch_size]
+        try:
+            batch, specs = load_and_preprocess_batch(paths, device=device)
+            for path, preprocessed, spec in zip(paths, batch, specs):
+                builder.add(path, preprocessed, spec.shape[-1])
+        except Exception:
+            # Retry one by one so a single bad file does not drop the batch
+            for path in paths:
+                try:
+                    preprocessed, spec = load_and_preprocess_audio(path, device=device)
+                    builder.add(path, preprocessed, spec.shape[-1])
+                except Exception as e:
+                    print(f"[WARNING] Skipping {path}: {e}")
+
+        print(f"[INFO] Preprocessed {min(start + batch_size, len(file_paths))}/{len(file_paths)} files")
+
+    count = len(builder.items)
+    builder.close()
+    return count
+
+
+class SpectrogramStore:
+    """Read-only view over a spectrogram store"""
+
+    def __init__(self, store_path: str):
+        """
+        Open the store
+
+        Args:
+            store_path: Store path (with or without .npy)
+        """
+        self.data_path, self.index_path = _store_paths(store_path)
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            self.index = json.load(f)
+        self.items = self.index['items']
+
+        # Copy-on-write mapping: zero-copy reads, tensors can wrap it without warnings
+        self.data = np.load(self.data_path, mmap_mode='c')[:len(self.items)]
+
+    def __len__(self):
+        return len(self.items)
+
+    def get_batch(self, start: int, stop: int):
+        """
+        Slice a batch without copying
+
+        Returns:
+            numpy memmap view (stop - start, 1, 128, 431)
+        """
+        return self.data[start:stop]
+
+    def iter_batches(self, batch_size: int = 32):
+        """
+        Iterate over the store in batches
+
+        Yields:
+            (items, batch): index entries and the matching zero-copy view
+        """
+        for start in range(0, len(self.items), batch_size):
+            stop = min(start + batch_size, len(self.items))
+            yield self.items[start:stop], self.data[start:stop]
@@ -36,6 +36,23 @@ class AppState:
             'enable_visual_alerts': True,  # Flash screen for alert sounds
             'enable_sound_alerts': False,  # Play sound (future feature)
             'recording': False,  # Live monitor status
+            'enable_feature_cache': True,  # Reuse features/predictions for already analyzed files
+            'bounded_decode': False,  # File analysis decodes only the first 5 s clip (opt-in: changes z-score stats of longer files)
+            'timeline_hop_seconds': 2.5,  # Window hop for full-recording timeline
+            'inference_backend': 'pytorch',  # 'auto' (calibration profile from calibrate_backends.py), 'pytorch', 'channels_last', 'torchscript' or 'onnxruntime'
+            'inference_precision': 'fp32',  # 'fp32' or 'bf16' (CPU autocast, checked against fp32 on startup)
+            'bf16_min_agreement': 99.0,  # Top-1 agreement with fp32 (%) required to keep bf16
+            'bf16_reference_store': 'models/reference_spectrograms',  # Real clips for the bf16 check
+            'warmup_on_load': True,  # Background warmup inference right after the model loads
+            'onnx_model_path': 'models/model.onnx',
+            'intra_op_threads': 0,  # Threads inside an operator (0 = tuned profile / auto)
+            'inter_op_threads': 0,  # Threads across operators (0 = tuned profile / auto)
+            'max_batch_size': 8,  # Micro-batching: largest batch per forward pass
+            'max_batch_wait_ms': 5.0,  # Micro-batching: how long a request waits for company
+            'cascade_enabled': False,  # Live monitor: screen windows with a cheap model first
+            'screener_path': 'models/screener.npz',
+            'activity_gate_enabled': False,  # Live monitor: skip silent windows without running the model
+            'activity_gate_db': -50.0,  # Activity gate RMS threshold (dBFS)
         }
         
         # Current prediction (for live monitor)
@@ -0,0 +1,135 @@
+"""
+Test the live-monitor activity gate (levels, noise floor, transients)
+"""
+import numpy as np
+
+from src.ai.activity_gate import (
+    ActivityGate, DEFAULT_GATE_DB, FLOOR_HISTORY, FLOOR_MARGIN_DB, MAX_FLOOR_RISE_DB, level_db
+)
+
+
+SR = 44100
+WINDOW = SR * 5
+
+
+def noise(rms_db, seed=0):
+    """5 s of Gaussian noise at the given RMS level (dBFS)"""
+    rng = np.random.default_rng(seed)
+    samples = rng.standard_normal(WINDOW)
+    return (samples / np.sqrt(np.mean(samples ** 2)) * 10 ** (rms_db / 20)).astype(np.float32)
+
+
+def knock(background_db=-45.0, peak=0.5, seed=0):
+    """Steady background with one 20 ms click"""
+    samples = noise(background_db, seed)
+    t = np.arange(int(0.02 * SR)) / SR
+    click = peak * np.sin(2 * np.pi * 1500 * t) * np.exp(-t * 200)
+    samples[SR:SR + len(click)] += click.astype(np.float32)
+    return samples
+
+
+def test_level_db():
+    """RMS/peak in dBFS; full-scale sine is -3 dB RMS, silence is very low"""
+    t = np.arange(SR) / SR
+    rms_db, peak_db = level_db(np.sin(2 * np.pi * 440 * t))
+    assert abs(rms_db - (-3.01)) < 0.05
+    assert abs(peak_db) < 0.01
+
+    assert abs(level_db(noise(-40.0))[0] - (-40.0)) < 0.01
+    assert level_db(np.zeros(WINDOW))[0] < -150
+    assert level_db(np.zeros(0))[0] < -150
+
+
+def test_absolute_threshold():
+    """With no history the configured threshold decides"""
+    gate = ActivityGate(gate_db=-50.0)
+    assert not gate.check(np.zeros(WINDOW))['active']
+
+    gate = ActivityGate(gate_db=-50.0)
+    assert not gate.check(noise(-60.0))['active']
+
+    gate = ActivityGate(gate_db=-50.0)
+    result = gate.check(noise(-30.0))
+    assert result['active'] and result['threshold_db'] == -50.0
+
+
+def test_noise_floor_learns_steady_background():
+    """Steady hum above the absolute gate is learned and then closed out"""
+    gate = ActivityGate(gate_db=DEFAULT_GATE_DB)
+    results = [gate.check(noise(-40.0, seed=i)) for i in range(FLOOR_HISTORY)]
+
+    # Open at first (above -50 dBFS), closed once the floor is learned
+    assert results[0]['active']
+    assert not results[-1]['active']
+    assert abs(gate.noise_floor_db - (-40.0)) < 0.5
+    assert abs(gate.threshold_db - (-40.0 + FLOOR_MARGIN_DB)) < 0.5
+
+    # A sound clearly above the learned floor still opens the gate
+    assert gate.check(noise(-25.0, seed=99))['active']
+
+
+def test_floor_rise_is_capped():
+    """A long loud sound cannot raise the gate past MAX_FLOOR_RISE_DB"""
+    gate = ActivityGate(gate_db=-50.0)
+    for i in range(FLOOR_HISTORY):
+        gate.check(noise(-5.0, seed=i))
+
+    assert gate.threshold_db == -50.0 + MAX_FLOOR_RISE_DB
+    assert gate.check(noise(-20.0))['active']
+
+
+def test_transient_opens_gate():
+    """A short knock over quiet background passes on its peak, not its RMS"""
+    gate = ActivityGate(gate_db=-50.0)
+    for i in range(FLOOR_HISTORY):
+        gate.check(noise(-45.0, seed=i))
+
+    quiet = gate.check(noise(-45.0, seed=123))
+    assert not quiet['active']
+
+    result = gate.check(knock(-45.0))
+    assert result['rms_db'] < result['threshold_db']
+    assert result['active']
+
+
+def test_window_does_not_gate_itself():
+    """The floor used for a decision excludes the window being judged"""
+    gate = ActivityGate(gate_db=-50.0)
+    for i in range(10):
+        gate.check(noise(-48.0, seed=i))
+    before = gate.threshold_db
+
+    result = gate.check(noise(-20.0, seed=50))
+    assert result['threshold_db'] == before
+    assert result['active']
+
+
+def test_reset():
+    """reset() forgets the learned floor"""
+    gate = ActivityGate(gate_db=-50.0)
+    for i in range(FLOOR_HISTORY):
+        gate.check(noise(-40.0, seed=i))
+    gate.reset()
+    assert gate.noise_floor_db is None
+    assert gate.threshold_db == -50.0
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 ACTIVITY GATE TESTS")
+    print("="*60)
+
+    test_level_db()
+    test_absolute_threshold()
+    test_noise_floor_learns_steady_background()
+    test_floor_rise_is_capped()
+    test_transient_opens_gate()
+    test_window_does_not_gate_itself()
+    test_reset()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Test backend calibration (parity check on given clips, winner choice, profile)
+"""
+import os
+import tempfile
+
+import numpy as np
+import torch.nn as nn
+
+from src.ai import model_handler
+from src.ai.backends import TorchBackend
+from src.ai.model_handler import SoundClassifier
+from src.ai.backend_selection import (
+    CHECK_CLIPS, calibrate_backends, load_backend_profile, save_backend_profile
+)
+
+
+class FakeBackend:
+    """Sum-pool 'logits'; offset simulates a wrong backend, delay a slow one"""
+
+    def __init__(self, offset=0.0, delay=0):
+        self.offset = offset
+        self.delay = delay
+        self.inputs = []
+
+    def run(self, batch):
+        self.inputs.append(batch)
+        for _ in range(self.delay):
+            np.sort(np.random.default_rng(0).standard_normal(20000))
+        return batch.reshape(len(batch), 4, -1).sum(axis=-1) + self.offset
+
+
+def make_batches(n=20, batch_size=8):
+    """Preprocessed-clip-shaped batches"""
+    clips = np.random.default_rng(0).standard_normal((n, 1, 128, 431)).astype(np.float32)
+    return [clips[start:start + batch_size] for start in range(0, n, batch_size)]
+
+
+def test_parity_uses_given_clips():
+    """The parity check runs on the passed clips (capped), timing on the first one"""
+    batches = make_batches()
+    reference = FakeBackend()
+    calibrate_backends({'pytorch': lambda: reference}, batches, repeats=2)
+
+    expected = np.concatenate(batches)[:CHECK_CLIPS]
+    assert np.array_equal(reference.inputs[0], expected)
+    assert np.array_equal(reference.inputs[1], expected[:1])
+
+
+def test_winner_and_mismatch():
+    """Wrong backends are skipped, the fastest verified backend wins"""
+    builders = {
+        'pytorch': lambda: FakeBackend(delay=20),
+        'torchscript': lambda: FakeBackend(delay=0),
+        'channels_last': lambda: FakeBackend(offset=1.0),
+        'onnxruntime': lambda: (_ for _ in ()).throw(ImportError("no onnxruntime")),
+    }
+    winner, backend, results, reason = calibrate_backends(builders, make_batches(), repeats=3)
+
+    assert winner == 'torchscript'
+    assert results['channels_last']['status'] == 'mismatch'
+    assert results['onnxruntime']['status'] == 'unavailable'
+    assert results['pytorch']['status'] == 'ok'
+    assert 'eager' in reason
+
+
+def test_random_fallback():
+    """Without clips calibration still runs (on random input, with a warning)"""
+    winner, _, results, _ = calibrate_backends({'pytorch': FakeBackend}, None, repeats=1)
+    assert winner == 'pytorch' and results['pytorch']['max_abs_diff'] == 0.0
+
+
+def test_profile_round_trip():
+    """Profiles are keyed by checkpoint identity"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "backend_profile.json")
+        save_backend_profile("ckpt-a", 'torchscript', "fastest", {}, profile_path=path)
+
+        assert load_backend_profile("ckpt-a", profile_path=path)['backend'] == 'torchscript'
+        assert load_backend_profile("ckpt-b", profile_path=path) is None
+
+
+def test_classifier_recalibration_resets_precision():
+    """A recalibrated classifier serves fp32 and forgets bf16 results"""
+    classifier = SoundClassifier(use_mock=True)
+    classifier.use_mock = False
+    classifier.model = nn.Sequential(nn.Flatten(), nn.Linear(4, 3)).eval()
+    classifier.backend = TorchBackend(classifier.model, 'cpu', name='pytorch')
+    classifier.backend_name = 'pytorch'
+    classifier.precision = 'bf16'
+    classifier._checkpoint_hash = "abc"
+    classifier.memo.put("key", np.ones(3))
+    bf16_calls = []
+    classifier._enable_bf16 = lambda: bf16_calls.append(True)
+
+    winner = TorchBackend(classifier.model, 'cpu', name='torchscript')
+    original = model_handler.calibrate_backends, model_handler.save_backend_profile, model_handler.checkpoint_id
+    model_handler.calibrate_backends = lambda builders, batches, repeats: ('torchscript', winner, {}, "fastest")
+    model_handler.save_backend_profile = lambda *args: None
+    model_handler.checkpoint_id = lambda path: path
+    try:
+        classifier.calibrate_backends()
+        assert classifier.precision == 'fp32' and classifier.backend is winner
+        assert classifier.model_key == "abc:torchscript:fp32"
+        assert classifier.memo.get("key") is None
+        assert not bf16_calls
+
+        # bf16 requested in the settings: checked again on the new backend
+        classifier.requested_precision = 'bf16'
+        classifier.calibrate_backends()
+        assert bf16_calls == [True]
+    finally:
+        model_handler.calibrate_backends, model_handler.save_backend_profile, model_handler.checkpoint_id = original
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 BACKEND CALIBRATION TESTS")
+    print("="*60)
+
+    test_parity_uses_given_clips()
+    test_winner_and_mismatch()
+    test_random_fallback()
+    test_profile_round_trip()
+    test_classifier_recalibration_resets_precision()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Test the content-addressed feature cache (keys, round trip, eviction)
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from src.utils.feature_cache import FeatureCache
+from src.utils import hashing
+from src.utils.hashing import hash_file
+
+
+PARAMS = {'sample_rate': 44100, 'n_fft': 2048, 'hop_length': 512, 'n_mels': 128, 'max_seconds': None}
+
+
+def write_file(path, payload):
+    """Write bytes and return the path"""
+    with open(path, 'wb') as f:
+        f.write(payload)
+    return path
+
+
+def make_entry(seed=0, frames=431):
+    """Model input, dB spectrogram and probabilities for one clip"""
+    rng = np.random.default_rng(seed)
+    spec_db = rng.uniform(-80.0, 0.0, (128, frames)).astype(np.float32)
+    preprocessed = ((spec_db - spec_db.mean()) / (spec_db.std() + 1e-6))[None, None].astype(np.float32)
+    probabilities = rng.dirichlet(np.ones(50)).astype(np.float32)
+    return preprocessed, spec_db, probabilities
+
+
+def test_key_invalidation():
+    """Key changes with audio content, preprocessing params and checkpoint"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FeatureCache(os.path.join(tmp, "cache"))
+        audio = write_file(os.path.join(tmp, "clip.wav"), b"RIFF" + bytes(range(256)))
+
+        key = cache.make_key(audio, PARAMS, "checkpoint-a")
+        assert cache.make_key(audio, dict(PARAMS), "checkpoint-a") == key
+
+        assert cache.make_key(audio, dict(PARAMS, n_mels=64), "checkpoint-a") != key
+        assert cache.make_key(audio, dict(PARAMS, max_seconds=5.0), "checkpoint-a") != key
+        assert cache.make_key(audio, PARAMS, "checkpoint-b") != key
+
+        # Same path, new content (size changes, so the hash memo is not reused)
+        write_file(audio, b"RIFF" + bytes(range(255, -1, -1)) + b"x")
+        assert cache.make_key(audio, PARAMS, "checkpoint-a") != key
+
+        # Same content under another name shares the entry
+        with open(audio, 'rb') as f:
+            copy_path = write_file(os.path.join(tmp, "copy.wav"), f.read())
+        assert hash_file(copy_path) == hash_file(audio)
+        assert cache.make_key(copy_path, PARAMS, "checkpoint-a") == cache.make_key(audio, PARAMS, "checkpoint-a")
+
+
+def test_round_trip():
+    """float32 storage is exact, compact storage rebuilds the model input"""
+    preprocessed, spec_db, probabilities = make_entry()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for storage, atol in (('float32', 0.0), ('float16', 0.05), ('int8', 0.2)):
+            cache = FeatureCache(os.path.join(tmp, storage), storage=storage)
+            assert cache.get("missing") is None
+
+            cache.put("key", preprocessed, spec_db, probabilities)
+            entry = cache.get("key")
+
+            assert entry is not None
+            assert np.array_equal(entry['probabilities'], probabilities)
+            assert entry['preprocessed'].shape == (1, 1, 128, 431)
+            assert np.allclose(entry['spec_for_display'], spec_db, atol=atol)
+            assert np.allclose(entry['preprocessed'], preprocessed, atol=max(atol, 1e-5))
+            assert cache.hits == 1 and cache.misses == 1
+            print(f"  {storage:8s}: max model-input diff "
+                  f"{np.abs(entry['preprocessed'] - preprocessed).max():.2e}")
+
+
+def test_lru_eviction():
+    """Oldest entries are removed once the size budget is exceeded"""
+    preprocessed, spec_db, probabilities = make_entry()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FeatureCache(tmp, storage='float32')
+        cache.put("probe", preprocessed, spec_db, probabilities)
+        entry_bytes = os.path.getsize(os.path.join(tmp, "probe.npz"))
+        cache.clear()
+
+        # Room for three entries
+        cache.max_bytes = int(entry_bytes * 3.5)
+        for i, key in enumerate(("a", "b", "c")):
+            cache.put(key, preprocessed, spec_db, probabilities)
+            os.utime(os.path.join(tmp, f"{key}.npz"), (1000 + i, 1000 + i))
+
+        # Reading "a" makes "b" the least recently used
+        assert cache.get("a") is not None
+        cache.put("d", preprocessed, spec_db, probabilities)
+
+        assert cache.get("b") is None
+        for key in ("a", "c", "d"):
+            assert cache.get(key) is not None
+
+
+def test_replace_keeps_size():
+    """Overwriting a key does not count the old entry twice"""
+    preprocessed, spec_db, probabilities = make_entry()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FeatureCache(tmp, storage='float32')
+        cache.put("a", preprocessed, spec_db, probabilities)
+        cache.put("b", preprocessed, spec_db, probabilities)
+        for _ in range(5):
+            cache.put("a", preprocessed, spec_db, probabilities)
+
+        assert cache._total_bytes == cache._scan_size()
+
+
+def test_hash_memo_is_bounded():
+    """The file hash memo keeps at most FILE_HASH_MEMO_SIZE files"""
+    original_size = hashing.FILE_HASH_MEMO_SIZE
+    hashing.FILE_HASH_MEMO_SIZE = 3
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [write_file(os.path.join(tmp, f"{i}.bin"), bytes([i]) * 10) for i in range(5)]
+            digests = [hash_file(path) for path in paths]
+
+            assert len(hashing._file_hash_memo) <= 3
+            assert hash_file(paths[0]) == digests[0]
+    finally:
+        hashing.FILE_HASH_MEMO_SIZE = original_size
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 FEATURE CACHE TESTS")
+    print("="*60)
+
+    test_key_invalidation()
+    test_round_trip()
+    test_lru_eviction()
+    test_replace_keeps_size()
+    test_hash_memo_is_bounded()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
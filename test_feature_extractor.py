@@ -0,0 +1,117 @@
+"""
+Test the cached FeatureExtractor against the Kaggle-exact pipeline
+"""
+import numpy as np
+import torch
+import torch.nn.functional as F
+import torchaudio.transforms as T
+
+from src.ai.feature_extractor import (
+    SR, FIXED_WIDTH, get_feature_extractor, clear_feature_extractor_cache, EXTRACTOR_CACHE_SIZE
+)
+from src.ai.audio_processor import generate_mel_spectrogram, preprocess_for_model
+
+
+def kaggle_reference(waveform):
+    """
+    Preprocess exactly like the Kaggle training code (transforms rebuilt per call)
+    """
+    mel_spec = T.MelSpectrogram(sample_rate=SR, n_fft=2048, hop_length=512, n_mels=128)
+    db_trans = T.AmplitudeToDB(top_db=80)
+
+    with torch.no_grad():
+        spec = db_trans(mel_spec(waveform)).squeeze(0)
+        spec_for_display = spec.clone()
+        spec = (spec - spec.mean()) / (spec.std() + 1e-6)
+        if spec.shape[1] < FIXED_WIDTH:
+            spec = F.pad(spec, (0, FIXED_WIDTH - spec.shape[1]))
+        else:
+            spec = spec[:, :FIXED_WIDTH]
+
+    return spec.unsqueeze(0).unsqueeze(0).numpy().astype(np.float32), spec_for_display
+
+
+def make_waveform(seconds, seed=0):
+    """Synthetic mono clip: two tones plus noise"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(SR * seconds)) / SR
+    audio = 0.3 * np.sin(2 * np.pi * 440 * t) + 0.1 * np.sin(2 * np.pi * 3000 * t)
+    audio += 0.05 * rng.standard_normal(len(t))
+    return torch.from_numpy(audio.astype(np.float32)).unsqueeze(0)
+
+
+def test_matches_kaggle_pipeline():
+    """Extractor output must equal the per-call Kaggle pipeline"""
+    extractor = get_feature_extractor()
+
+    # Shorter than, equal to and longer than the 431-frame window
+    for seconds in (2.0, 5.0, 7.5):
+        waveform = make_waveform(seconds)
+
+        expected, expected_display = kaggle_reference(waveform)
+        preprocessed, spec_for_display = extractor(waveform)
+
+        assert preprocessed.shape == (1, 1, 128, FIXED_WIDTH)
+        assert preprocessed.dtype == np.float32
+        assert np.allclose(preprocessed, expected, atol=1e-6)
+        assert torch.allclose(spec_for_display, expected_display, atol=1e-5)
+        print(f"  {seconds:4.1f}s clip: max diff {np.abs(preprocessed - expected).max():.2e}")
+
+
+def test_backward_compatible_wrappers():
+    """generate_mel_spectrogram + preprocess_for_model use the same front end"""
+    waveform = make_waveform(5.0, seed=1)
+    expected, _ = kaggle_reference(waveform)
+
+    mel_spec = generate_mel_spectrogram(waveform.squeeze(0).numpy(), SR)
+    preprocessed = preprocess_for_model(mel_spec)
+
+    assert np.allclose(preprocessed, expected, atol=1e-6)
+
+
+def test_batch_matches_single():
+    """preprocess_batch over mixed lengths equals per-clip preprocessing"""
+    extractor = get_feature_extractor()
+    waveforms = [make_waveform(seconds, seed=i) for i, seconds in enumerate((1.3, 5.0, 6.2, 3.7))]
+
+    batch, specs_for_display = extractor.preprocess_batch(waveforms)
+
+    assert batch.shape == (len(waveforms), 1, 128, FIXED_WIDTH)
+    assert batch.flags['C_CONTIGUOUS']
+
+    for i, waveform in enumerate(waveforms):
+        expected, expected_display = extractor(waveform)
+        assert np.allclose(batch[i:i + 1], expected, atol=1e-4)
+        assert specs_for_display[i].shape == expected_display.shape
+        assert torch.allclose(specs_for_display[i], expected_display, atol=1e-3)
+
+
+def test_cache_reuse_and_eviction():
+    """Same parameters return the same instance, old entries are evicted"""
+    clear_feature_extractor_cache()
+
+    first = get_feature_extractor()
+    assert get_feature_extractor() is first
+
+    for n_mels in range(32, 32 + EXTRACTOR_CACHE_SIZE):
+        get_feature_extractor(n_mels=n_mels)
+
+    assert get_feature_extractor() is not first
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 FEATURE EXTRACTOR TESTS")
+    print("="*60)
+
+    test_matches_kaggle_pipeline()
+    test_backward_compatible_wrappers()
+    test_batch_matches_single()
+    test_cache_reuse_and_eviction()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Test the micro-batching InferenceEngine (batching, result routing, errors)
+"""
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from src.ai.inference_engine import InferenceEngine
+from src.ai.model_loader import ModelLoader
+
+
+class FakeClassifier:
+    """Records batch sizes; each output row echoes its input's marker value"""
+
+    use_mock = False
+    classes = [f"class_{i}" for i in range(4)]
+
+    def __init__(self, fail=False, delay=0.0):
+        self.fail = fail
+        self.delay = delay
+        self.batch_sizes = []
+
+    def predict_batch(self, batch):
+        self.batch_sizes.append(len(batch))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("forward pass failed")
+        markers = batch.reshape(len(batch), -1)[:, 0]
+        return np.stack([np.full(len(self.classes), marker) for marker in markers])
+
+
+def make_input(marker, frames=16):
+    """(1, 1, 8, frames) input whose first value identifies it"""
+    data = np.zeros((1, 1, 8, frames), dtype=np.float32)
+    data[0, 0, 0, 0] = marker
+    return data
+
+
+def test_groups_concurrent_requests():
+    """Requests arriving together share one forward pass, each gets its own row"""
+    classifier = FakeClassifier()
+    engine = InferenceEngine(classifier, max_batch_size=8, max_wait_ms=200)
+    try:
+        futures = [engine.submit(make_input(i)) for i in range(8)]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        engine.stop()
+
+    assert classifier.batch_sizes == [8]
+    for i, probs in enumerate(results):
+        assert probs.shape == (4,)
+        assert np.all(probs == i)
+
+    stats = engine.get_stats()
+    assert stats['requests'] == 8 and stats['batches'] == 1
+    assert stats['avg_batch_size'] == 8
+
+
+def test_max_batch_size_and_threads():
+    """Concurrent callers are split into batches of at most max_batch_size"""
+    classifier = FakeClassifier(delay=0.02)
+    engine = InferenceEngine(classifier, max_batch_size=4, max_wait_ms=50)
+    results = {}
+
+    def caller(i):
+        results[i] = engine.submit(make_input(i)).result(timeout=5)
+
+    try:
+        threads = [threading.Thread(target=caller, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        engine.stop()
+
+    assert sum(classifier.batch_sizes) == 10
+    assert max(classifier.batch_sizes) <= 4
+    assert all(np.all(results[i] == i) for i in range(10))
+    print(f"  batch sizes: {classifier.batch_sizes}")
+
+
+def test_shape_groups():
+    """Inputs of different time widths run as separate batches"""
+    classifier = FakeClassifier()
+    engine = InferenceEngine(classifier, max_batch_size=8, max_wait_ms=200)
+    try:
+        futures = [engine.submit(make_input(i, frames=16 if i % 2 else 32)) for i in range(6)]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        engine.stop()
+
+    assert sorted(classifier.batch_sizes) == [3, 3]
+    assert all(np.all(probs == i) for i, probs in enumerate(results))
+
+
+def test_exception_reaches_every_caller():
+    """A failed forward pass resolves every future in the batch with the error"""
+    engine = InferenceEngine(FakeClassifier(fail=True), max_batch_size=4, max_wait_ms=100)
+    try:
+        futures = [engine.submit(make_input(i)) for i in range(3)]
+        for future in futures:
+            try:
+                future.result(timeout=5)
+            except RuntimeError as e:
+                assert "forward pass failed" in str(e)
+            else:
+                raise AssertionError("expected RuntimeError")
+    finally:
+        engine.stop()
+
+    assert engine.get_stats()['requests'] == 0
+
+
+def test_stop_serves_pending():
+    """Stopping the engine still resolves requests already queued"""
+    classifier = FakeClassifier()
+    engine = InferenceEngine(classifier, max_batch_size=8, max_wait_ms=500)
+    futures = [engine.submit(make_input(i)) for i in range(3)]
+    engine.stop()
+
+    assert all(np.all(future.result(timeout=5) == i) for i, future in enumerate(futures))
+
+
+def test_failed_load_without_fallback():
+    """A failed load is not 'ready' and classify() degrades to a mock result"""
+    failed = Future()
+    failed.set_exception(ImportError("No module named 'timm'"))
+    engine = InferenceEngine(failed)
+
+    assert not engine.is_ready
+    result = engine.classify(make_input(1))
+    assert result.probabilities is None and result.label
+
+
+def test_loader_falls_back_to_mock():
+    """ModelLoader resolves to the fallback classifier and reports 'failed'"""
+    def broken_factory():
+        raise RuntimeError("calibration failed")
+
+    fallback = FakeClassifier()
+    fallback.use_mock = True
+    loader = ModelLoader(broken_factory, warmup=False, fallback=lambda: fallback)
+    states = []
+    loader.add_listener(states.append)
+    loader.start()
+
+    assert loader.wait(timeout=30) is fallback
+    loader._thread.join(timeout=5)
+    assert loader.is_ready
+    assert states[-1] == 'failed'
+
+    engine = InferenceEngine(loader.future)
+    assert engine.is_ready
+    assert engine.use_mock
+
+
+def test_loader_without_fallback_keeps_error():
+    """Without a fallback the future holds the load error"""
+    def broken_factory():
+        raise RuntimeError("calibration failed")
+
+    loader = ModelLoader(broken_factory, warmup=False)
+    loader.start()
+    loader._thread.join(timeout=30)
+
+    assert loader.state == 'failed'
+    assert not loader.is_ready
+    assert isinstance(loader.future.exception(), RuntimeError)
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 INFERENCE ENGINE TESTS")
+    print("="*60)
+
+    test_groups_concurrent_requests()
+    test_max_batch_size_and_threads()
+    test_shape_groups()
+    test_exception_reaches_every_caller()
+    test_stop_serves_pending()
+    test_failed_load_without_fallback()
+    test_loader_falls_back_to_mock()
+    test_loader_without_fallback_keeps_error()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
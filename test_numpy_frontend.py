@@ -0,0 +1,95 @@
+"""
+Parity test: torch-free NumPy front end vs torchaudio pipeline
+"""
+import subprocess
+import sys
+
+import numpy as np
+import torch
+import torchaudio.functional as AF
+import torchaudio.transforms as T
+
+from src.ai.audio_config import SR, FIXED_WIDTH
+from src.ai.feature_extractor import get_feature_extractor
+from src.ai import numpy_frontend
+
+
+# dB values: float32 FFT in torch vs float64 pocketfft in NumPy
+DB_ATOL = 1e-2
+# Model input after z-score (dB error divided by the clip's std)
+INPUT_ATOL = 1e-3
+
+
+def make_audio(seconds, sr=SR, seed=0):
+    """Synthetic mono clip: chirp plus noise"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(sr * seconds)) / sr
+    audio = 0.3 * np.sin(2 * np.pi * (200 + 800 * t) * t) + 0.05 * rng.standard_normal(len(t))
+    return audio.astype(np.float32)
+
+
+def test_filterbank_matches():
+    """Mel filterbank construction matches torchaudio"""
+    expected = AF.melscale_fbanks(1025, 0.0, float(SR // 2), 128, SR).numpy()
+    actual = numpy_frontend.melscale_fbanks(1025, 0.0, float(SR // 2), 128, SR)
+
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected, atol=1e-4)
+
+
+def test_preprocessing_matches():
+    """Mel + dB + z-score + pad/crop matches the torch extractor"""
+    torch_extractor = get_feature_extractor()
+    numpy_extractor = numpy_frontend.get_numpy_feature_extractor()
+
+    for seconds in (2.0, 5.0, 7.5):
+        audio = make_audio(seconds)
+
+        expected, expected_display = torch_extractor(torch.from_numpy(audio).unsqueeze(0))
+        actual, actual_display = numpy_extractor(audio)
+
+        assert actual.shape == (1, 1, 128, FIXED_WIDTH)
+        assert actual_display.shape == tuple(expected_display.shape)
+
+        db_diff = np.abs(actual_display - expected_display.numpy()).max()
+        input_diff = np.abs(actual - expected).max()
+        print(f"  {seconds:4.1f}s clip: dB max diff {db_diff:.2e}, input max diff {input_diff:.2e}")
+
+        assert db_diff < DB_ATOL
+        assert input_diff < INPUT_ATOL
+
+
+def test_resample_matches():
+    """Sinc resampling matches torchaudio.transforms.Resample"""
+    for sr in (48000, 22050, 16000):
+        audio = make_audio(1.0, sr=sr, seed=sr)
+
+        expected = T.Resample(sr, SR)(torch.from_numpy(audio).unsqueeze(0)).squeeze(0).numpy()
+        actual = numpy_frontend.resample(audio, sr, SR)
+
+        assert actual.shape == expected.shape
+        assert np.allclose(actual, expected, atol=1e-5)
+
+
+def test_import_does_not_load_torch():
+    """Worker processes must never import torch"""
+    code = "import sys, src.ai.numpy_frontend; sys.exit(int('torch' in sys.modules))"
+    assert subprocess.call([sys.executable, "-c", code]) == 0
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 NUMPY FRONT END PARITY TESTS")
+    print("="*60)
+
+    test_filterbank_matches()
+    test_preprocessing_matches()
+    test_resample_matches()
+    test_import_does_not_load_torch()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Test the bf16 agreement check inputs (reference clips, random fallback)
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from src.ai.precision import REFERENCE_BATCH_SIZE, check_bf16, load_reference_batches, reference_batch
+from src.utils.spectrogram_store import SpectrogramStoreBuilder
+
+
+def build_store(path, n):
+    """Store of n distinct z-scored clips"""
+    clips = np.random.default_rng(0).standard_normal((n, 1, 1, 128, 431)).astype(np.float32)
+    builder = SpectrogramStoreBuilder(path, capacity=n)
+    for i, clip in enumerate(clips):
+        builder.add(f"clip_{i}.wav", clip, 431)
+    builder.close()
+    return clips.reshape(n, 1, 128, 431)
+
+
+def test_reference_clips_from_store():
+    """Batches come from the store, capped at max_clips"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "reference")
+        clips = build_store(path, 20)
+
+        batches = load_reference_batches(path, max_clips=12)
+        assert [len(batch) for batch in batches] == [REFERENCE_BATCH_SIZE, 12 - REFERENCE_BATCH_SIZE]
+        assert np.array_equal(np.concatenate(batches), clips[:12])
+
+
+def test_random_fallback():
+    """A missing store falls back to the fixed random batch"""
+    with tempfile.TemporaryDirectory() as tmp:
+        batches = load_reference_batches(os.path.join(tmp, "missing"))
+    assert len(batches) == 1 and np.array_equal(batches[0], reference_batch())
+
+
+def test_check_uses_given_batches():
+    """Identical runs agree fully; a run that flips the top class is rejected"""
+    weights = np.random.default_rng(1).standard_normal((128 * 431, 5)).astype(np.float32)
+
+    def run(batch):
+        return batch.reshape(len(batch), -1) @ weights
+
+    batches = [reference_batch(seed) for seed in range(2)]
+    check = check_bf16(run, run, batches)
+    assert check['accepted'] and check['top1_agreement'] == 100.0
+
+    check = check_bf16(run, lambda batch: -run(batch), batches)
+    assert not check['accepted']
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 PRECISION CHECK TESTS")
+    print("="*60)
+
+    test_reference_clips_from_store()
+    test_random_fallback()
+    test_check_uses_given_batches()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
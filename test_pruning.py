@@ -0,0 +1,107 @@
+"""
+Test structured pruning (spec, parameter count, checkpoint round trip)
+"""
+import gc
+import os
+import tempfile
+
+import numpy as np
+import torch
+
+from prune_model import clip_targets
+from src.ai.model_handler import ESC50_CLASSES, ESC50_TARGET_ORDER, create_model, load_model
+from src.ai.pruning import CHANNEL_MULTIPLE, count_parameters, prune_model, save_pruned_checkpoint
+
+
+def make_model(seed=0):
+    """ConvNeXt-Tiny with non-uniform layer scales, so block ranking matters"""
+    torch.manual_seed(seed)
+    model = create_model().eval()
+    with torch.no_grad():
+        for stage in model.stages:
+            for block in stage.blocks:
+                block.gamma.uniform_(0.05, 1.0)
+    return model
+
+
+def make_input(seed=0):
+    """Short (2, 1, 128, 64) model input (the architecture is width-agnostic)"""
+    return torch.from_numpy(np.random.default_rng(seed).standard_normal((2, 1, 128, 64)).astype(np.float32))
+
+
+def test_no_pruning_is_identity():
+    """Zero ratios keep the architecture and the logits"""
+    model = make_model()
+    pruned, spec = prune_model(model)
+    assert spec['depths'] == [len(stage.blocks) for stage in model.stages]
+    assert count_parameters(pruned) == count_parameters(model)
+
+    batch = make_input()
+    with torch.no_grad():
+        assert torch.equal(pruned(batch), model(batch))
+
+
+def test_spec_and_parameter_count():
+    """MLP widths are rounded to CHANNEL_MULTIPLE, every stage keeps a block"""
+    model = make_model()
+    pruned, spec = prune_model(model, mlp_ratio=0.5, block_ratio=0.5)
+
+    assert spec['depths'] == [max(1, depth - int(depth * 0.5)) for depth in (3, 3, 9, 3)]
+    for stage, hidden_sizes in zip(pruned.stages, spec['mlp_hidden']):
+        full = 4 * stage.blocks[0].mlp.fc1.in_features
+        assert all(hidden == full // 2 and hidden % CHANNEL_MULTIPLE == 0 for hidden in hidden_sizes)
+
+    assert count_parameters(pruned) < 0.6 * count_parameters(model)
+    print(f"  parameters: {count_parameters(model) / 1e6:.1f}M -> {count_parameters(pruned) / 1e6:.1f}M")
+
+
+def test_checkpoint_round_trip():
+    """load_model() rebuilds the pruned shape and gives identical logits"""
+    pruned, spec = prune_model(make_model(), mlp_ratio=0.25, block_ratio=0.34)
+
+    batch = make_input(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pruned.pth")
+        save_pruned_checkpoint(pruned, spec, path, source_path="models/best_convnext_tiny.pth")
+        loaded = load_model(path, 'cpu')
+
+        assert [len(stage.blocks) for stage in loaded.stages] == spec['depths']
+        assert [[block.mlp.fc1.out_features for block in stage.blocks]
+                for stage in loaded.stages] == spec['mlp_hidden']
+        assert count_parameters(loaded) == count_parameters(pruned)
+        with torch.no_grad():
+            assert torch.equal(loaded(batch), pruned(batch))
+
+        # Weights are memory-mapped from the file: release them before cleanup (Windows)
+        del loaded
+        gc.collect()
+
+
+def test_esc50_filename_targets():
+    """ESC-50 file-name targets use the dataset's order, not ESC50_CLASSES"""
+    paths = ["esc50/1-100032-A-0.wav", "esc50/1-100038-A-14.wav", "esc50/5-9032-A-47.wav",
+             "clips/siren/recording.wav", "clips/misc/recording.wav", "esc50/1-1-A-99.wav"]
+    assert clip_targets(paths) == [
+        ESC50_CLASSES.index('dog'), ESC50_CLASSES.index('chirping_birds'), ESC50_CLASSES.index('airplane'),
+        ESC50_CLASSES.index('siren'), -1, -1,
+    ]
+    assert sorted(ESC50_TARGET_ORDER) == ESC50_CLASSES
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 PRUNING TESTS")
+    print("="*60)
+
+    test_no_pruning_is_identity()
+    test_spec_and_parameter_count()
+    test_checkpoint_round_trip()
+    test_esc50_filename_targets()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Test the cascade screener (distilled labels, recall-threshold selection, save/load)
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from src.ai.screener import (
+    Screener, distill_labels, evaluate_screener, fit_screener, pooled_mel_features
+)
+
+
+def make_dataset(n=400, positive_rate=0.25, seed=0):
+    """Overlapping Gaussian features: positives are louder on a few dims"""
+    rng = np.random.default_rng(seed)
+    labels = rng.random(n) < positive_rate
+    features = rng.standard_normal((n, 12))
+    features[labels, :3] += 1.5
+    return features.astype(np.float32), labels
+
+
+def test_pooled_features():
+    """Feature vector layout: 3 stats per band group plus 4 global stats"""
+    spec = np.random.default_rng(0).uniform(-80, 0, (128, 431)).astype(np.float32)
+    features = pooled_mel_features(spec)
+    assert features.shape == (3 * 128 // 4 + 4,)
+    assert features.dtype == np.float32
+    assert np.isclose(features[-4], spec.mean(), atol=1e-3)
+    assert np.allclose(pooled_mel_features(spec[None, None]), features)
+
+
+def test_distill_labels():
+    """Confident windows and alert-class windows are both interesting"""
+    classes = ['dog', 'rain', 'siren']
+    probabilities = np.array([
+        [0.9, 0.05, 0.05],   # confident dog
+        [0.4, 0.35, 0.25],   # unsure dog
+        [0.3, 0.3, 0.4],     # unsure siren (alert)
+    ])
+    labels = distill_labels(probabilities, 50.0, classes, ['siren'])
+    assert list(labels) == [True, False, True]
+
+
+def test_recall_threshold_selection():
+    """Threshold is the highest one that keeps the recall target on the training set"""
+    features, labels = make_dataset()
+
+    for recall_target in (0.9, 0.95, 0.98, 1.0):
+        screener = fit_screener(features, labels, recall_target=recall_target)
+        stats = evaluate_screener(screener, features, labels)
+
+        assert stats['recall'] >= recall_target, (recall_target, stats)
+        assert 0.0 < stats['pass_rate'] < 1.0
+
+        # One step stricter (the next positive score up) would miss the target
+        positive_scores = np.sort([screener.score_features(f) for f in features[labels]])
+        stricter = positive_scores[positive_scores > screener.threshold]
+        if len(stricter):
+            assert (positive_scores >= stricter[0]).mean() < recall_target
+        print(f"  recall target {recall_target:.2f}: recall {stats['recall']:.3f}, "
+              f"pass rate {stats['pass_rate']:.3f}")
+
+    # Higher recall targets can only lower the threshold
+    thresholds = [fit_screener(features, labels, recall_target=r).threshold for r in (0.8, 0.9, 0.99)]
+    assert thresholds[0] >= thresholds[1] >= thresholds[2]
+
+
+def test_no_positives():
+    """Without interesting windows the screener passes nothing"""
+    features, _ = make_dataset(n=50)
+    screener = fit_screener(features, np.zeros(50, dtype=bool))
+    assert screener.threshold == 1.0
+    assert evaluate_screener(screener, features, np.zeros(50, dtype=bool))['pass_rate'] == 0.0
+
+
+def test_save_load_round_trip():
+    """Saved screeners score identically after loading"""
+    # Louder copies of one spectrogram are interesting, quieter ones are not
+    spec = np.random.default_rng(1).uniform(-80, 0, (128, 431)).astype(np.float32)
+    shifts = np.linspace(-20, 20, 40)
+    screener = fit_screener(np.stack([pooled_mel_features(spec + shift) for shift in shifts]), shifts > 0)
+    screener.info = {'recall': 0.98, 'clips': 40}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "screener.npz")
+        screener.save(path)
+        loaded = Screener.load(path)
+
+    assert loaded.info == {'recall': 0.98, 'clips': 40}
+    assert loaded.threshold == screener.threshold
+    assert loaded.score(spec) == screener.score(spec)
+    assert loaded.is_interesting(spec + 20) and not loaded.is_interesting(spec - 20)
+
+
+def test_covers_confidence_threshold():
+    """Only settings at or above the training threshold may use the screener"""
+    features, labels = make_dataset(n=50)
+    screener = fit_screener(features, labels)
+    assert not screener.covers(50.0)  # Unknown training threshold
+
+    screener.info = {'confidence_threshold': 50.0}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "screener.npz")
+        screener.save(path)
+        loaded = Screener.load(path)
+
+    assert loaded.covers(50.0) and loaded.covers(80.0)
+    assert not loaded.covers(40.0)
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 CASCADE SCREENER TESTS")
+    print("="*60)
+
+    test_pooled_features()
+    test_distill_labels()
+    test_recall_threshold_selection()
+    test_no_positives()
+    test_save_load_round_trip()
+    test_covers_confidence_threshold()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Test the compact float16 / int8 spectrogram codec (round-trip error bounds)
+"""
+import numpy as np
+
+from src.ai.audio_config import N_MELS, FIXED_WIDTH
+from src.ai.numpy_frontend import normalize_spectrogram
+from src.ai.spectrogram_codec import (
+    CODEC_MODES, CompactSpectrogram, encode_spectrogram, decode_spectrogram, decode_model_input
+)
+
+
+def make_spec_db(frames=FIXED_WIDTH, seed=0):
+    """dB spectrogram spanning the full top_db=80 range"""
+    rng = np.random.default_rng(seed)
+    spec = rng.uniform(-80.0, 0.0, (N_MELS, frames)).astype(np.float32)
+    spec[0, 0], spec[-1, -1] = -80.0, 0.0
+    return spec
+
+
+def test_float32_lossless():
+    """float32 mode returns the input unchanged (and does not alias it)"""
+    spec = make_spec_db()
+    compact = encode_spectrogram(spec, 'float32')
+    spec[0, 0] = 123.0
+
+    decoded = decode_spectrogram(compact)
+    assert decoded.dtype == np.float32
+    assert decoded[0, 0] == -80.0
+    assert np.array_equal(decoded[1:], spec[1:])
+
+
+def test_float16_error_bound():
+    """float16 stays within 0.05 dB over the 80 dB range at half the size"""
+    spec = make_spec_db()
+    compact = encode_spectrogram(spec, 'float16')
+
+    error = np.abs(decode_spectrogram(compact) - spec).max()
+    assert compact.data.dtype == np.float16
+    assert compact.nbytes * 2 == spec.nbytes
+    assert error < 0.05
+    print(f"  float16: max error {error:.4f} dB")
+
+
+def test_int8_error_bound():
+    """int8 error is at most half a quantization step, at a quarter of the size"""
+    for seed, frames in ((0, FIXED_WIDTH), (1, 200), (2, 600)):
+        spec = make_spec_db(frames, seed)
+        compact = encode_spectrogram(spec, 'int8')
+
+        step = (spec.max() - spec.min()) / 255.0
+        error = np.abs(decode_spectrogram(compact) - spec).max()
+        assert compact.data.dtype == np.int8
+        assert compact.nbytes * 4 == spec.nbytes
+        assert np.isclose(compact.scale, step)
+        assert error <= step / 2 + 1e-4
+        print(f"  int8 ({frames} frames): max error {error:.4f} dB (step {step:.4f} dB)")
+
+
+def test_int8_constant_input():
+    """A flat spectrogram (zero range) decodes exactly"""
+    spec = np.full((N_MELS, 50), -42.0, dtype=np.float32)
+    assert np.allclose(decode_spectrogram(encode_spectrogram(spec, 'int8')), spec)
+
+
+def test_model_input_rebuild():
+    """Decoded model input matches z-scoring the original, padded/cropped to 431 frames"""
+    for frames in (200, FIXED_WIDTH, 600):
+        spec = make_spec_db(frames)
+        expected = normalize_spectrogram(spec, FIXED_WIDTH)
+
+        for mode, atol in (('float32', 1e-6), ('float16', 5e-3), ('int8', 1e-2)):
+            rebuilt = decode_model_input(encode_spectrogram(spec, mode))
+            assert rebuilt.shape == (1, 1, N_MELS, FIXED_WIDTH)
+            assert rebuilt.dtype == np.float32
+            assert np.allclose(rebuilt, expected, atol=atol)
+
+
+def test_array_round_trip():
+    """to_arrays / from_arrays (the .npz layout) preserves mode, scale and offset"""
+    spec = make_spec_db()
+    for mode in CODEC_MODES:
+        compact = encode_spectrogram(spec, mode)
+        restored = CompactSpectrogram.from_arrays(compact.to_arrays())
+        assert restored.mode == mode
+        assert np.array_equal(decode_spectrogram(restored), decode_spectrogram(compact))
+
+
+def test_unknown_mode():
+    """Unknown codec modes are rejected"""
+    try:
+        encode_spectrogram(make_spec_db(), 'bfloat16')
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 SPECTROGRAM CODEC TESTS")
+    print("="*60)
+
+    test_float32_lossless()
+    test_float16_error_bound()
+    test_int8_error_bound()
+    test_int8_constant_input()
+    test_model_input_rebuild()
+    test_array_round_trip()
+    test_unknown_mode()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
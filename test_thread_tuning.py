@@ -0,0 +1,112 @@
+"""
+Test the thread tuner (candidates, per-host profiles, settings precedence)
+"""
+import json
+import os
+import tempfile
+
+import torch
+
+from src.ai import thread_tuning
+from src.ai.thread_tuning import (
+    apply_thread_settings, candidate_threads, host_key, load_thread_profile, save_thread_profile
+)
+
+
+PROFILE = {
+    'batch_1': {'intra': 3, 'inter': 2, 'median_ms': 40.0, 'p90_ms': 45.0},
+    'batch_n': {'intra': 6, 'inter': 1, 'median_ms': 200.0, 'p90_ms': 210.0},
+    'batch_size': 8,
+}
+
+
+class FakeThreads:
+    """Stands in for torch's thread setters so the test process is not reconfigured"""
+
+    def __init__(self, intra=8, inter=8):
+        self.intra = intra
+        self.inter = inter
+
+    def __enter__(self):
+        self.saved = (torch.set_num_threads, torch.get_num_threads,
+                      torch.set_num_interop_threads, torch.get_num_interop_threads)
+        torch.set_num_threads = lambda n: setattr(self, 'intra', n)
+        torch.get_num_threads = lambda: self.intra
+        torch.set_num_interop_threads = lambda n: setattr(self, 'inter', n)
+        torch.get_num_interop_threads = lambda: self.inter
+        return self
+
+    def __exit__(self, *exc):
+        (torch.set_num_threads, torch.get_num_threads,
+         torch.set_num_interop_threads, torch.get_num_interop_threads) = self.saved
+
+
+def test_candidate_threads():
+    """Powers of two below the limit plus the limit itself"""
+    assert candidate_threads(1) == [1]
+    assert candidate_threads(8) == [1, 2, 4, 8]
+    assert candidate_threads(12) == [1, 2, 4, 8, 12]
+    assert candidate_threads()[-1] == (os.cpu_count() or 1)
+
+
+def test_profile_keyed_by_host():
+    """Saving for this host keeps the profiles of other hosts"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "thread_profile.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'other-host|x86_64|64': {'batch_1': {'intra': 32, 'inter': 4}}}, f)
+
+        assert load_thread_profile(path) is None
+        save_thread_profile(PROFILE, path)
+
+        assert load_thread_profile(path) == PROFILE
+        with open(path, encoding='utf-8') as f:
+            profiles = json.load(f)
+        assert set(profiles) == {'other-host|x86_64|64', host_key()}
+
+        original_host_key = thread_tuning.host_key
+        thread_tuning.host_key = lambda: 'other-host|x86_64|64'
+        try:
+            assert load_thread_profile(path)['batch_1']['intra'] == 32
+        finally:
+            thread_tuning.host_key = original_host_key
+
+
+def test_apply_precedence():
+    """Explicit settings win over the profile, the profile over PyTorch defaults"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "thread_profile.json")
+
+        # No profile: defaults stay
+        with FakeThreads(intra=8, inter=8):
+            assert apply_thread_settings(profile_path=path) == (8, 8)
+
+        save_thread_profile(PROFILE, path)
+
+        with FakeThreads():
+            assert apply_thread_settings(profile_path=path) == (3, 2)
+        with FakeThreads():
+            assert apply_thread_settings(target='batch_n', profile_path=path) == (6, 1)
+
+        # Overrides, one at a time: the other value still comes from the profile
+        with FakeThreads():
+            assert apply_thread_settings(intra_op_threads=5, profile_path=path) == (5, 2)
+        with FakeThreads():
+            assert apply_thread_settings(inter_op_threads=4, profile_path=path) == (3, 4)
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🧪 THREAD TUNING TESTS")
+    print("="*60)
+
+    test_candidate_threads()
+    test_profile_keyed_by_host()
+    test_apply_precedence()
+
+    print("\n✅ ALL TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
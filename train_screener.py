@@ -0,0 +1,126 @@
+"""
+Train the cascade screener by distilling the full model
+
+Every window of every clip is run through ConvNeXt once; windows the live
+view would report (confidence >= threshold, or an alert class on top) are
+the positives. A logistic screener on pooled mel statistics is fitted to
+those targets and saved for the live monitor's cascade mode.
+
+Usage:
+    python train_screener.py <audio_dir> [--checkpoint models/best_convnext_tiny.pth]
+                             [--output models/screener.npz] [--threshold 50] [--recall 0.98]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from evaluate_store import find_audio_files
+from src.ai.audio_config import SR, N_FFT, HOP_LENGTH, N_MELS, FIXED_WIDTH, CLIP_SECONDS
+from src.ai.audio_processor import get_audio_info, decode_audio
+from src.ai.feature_extractor import get_feature_extractor
+from src.ai.long_recording import window_starts
+from src.ai.model_handler import SoundClassifier, ESC50_CLASSES, ALERT_SOUNDS
+from src.ai.screener import (
+    SCREENER_PATH, DEFAULT_RECALL, pooled_mel_features, distill_labels, fit_screener, evaluate_screener
+)
+
+
+def collect_windows(paths, classifier, hop_seconds, batch_size=8):
+    """
+    Full-model probabilities and screener features for every window
+
+    Returns:
+        features (N, F), probabilities (N, num_classes), full-model ms per window
+    """
+    extractor = get_feature_extractor(SR, N_FFT, HOP_LENGTH, N_MELS)
+    features, probabilities = [], []
+    model_seconds = 0.0
+
+    for path in paths:
+        num_frames, sr = get_audio_info(path)
+        starts = window_starts(num_frames / sr, CLIP_SECONDS, hop_seconds)
+
+        for batch_start in range(0, len(starts), batch_size):
+            waveforms = [
+                decode_audio(path, max_seconds=CLIP_SECONDS, offset_seconds=start)
+                for start in starts[batch_start:batch_start + batch_size]
+            ]
+            batch, specs = extractor.preprocess_batch(waveforms, FIXED_WIDTH)
+
+            start_time = time.perf_counter()
+            probabilities.append(classifier.predict_batch(batch))
+            model_seconds += time.perf_counter() - start_time
+
+            features.extend(pooled_mel_features(spec.numpy()) for spec in specs)
+
+    probabilities = np.concatenate(probabilities) if probabilities else np.zeros((0, len(ESC50_CLASSES)))
+    model_ms = model_seconds * 1000 / max(len(features), 1)
+    return np.array(features), probabilities, model_ms
+
+
+def screener_cost_ms(screener, repeats=200):
+    """Average screener time per window (features + score) in ms"""
+    spec_db = np.random.default_rng(0).uniform(-80, 0, (N_MELS, FIXED_WIDTH)).astype(np.float32)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        screener.is_interesting(spec_db)
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distill the cascade screener from the full model")
+    parser.add_argument("audio_dir", help="Folder of training audio")
+    parser.add_argument("--checkpoint", default="models/best_convnext_tiny.pth")
+    parser.add_argument("--output", default=SCREENER_PATH)
+    parser.add_argument("--threshold", type=float, default=50.0,
+                        help="Confidence (%%) at which the live view reports a window")
+    parser.add_argument("--recall", type=float, default=DEFAULT_RECALL,
+                        help="Fraction of interesting windows the screener must pass")
+    parser.add_argument("--hop", type=float, default=CLIP_SECONDS / 2, help="Window hop in seconds")
+    args = parser.parse_args()
+
+    paths = find_audio_files(args.audio_dir)
+    if not paths:
+        print(f"[ERROR] No audio files in {args.audio_dir}")
+        return
+
+    classifier = SoundClassifier(model_path=args.checkpoint)
+    if classifier.use_mock:
+        print("[ERROR] Checkpoint could not be loaded")
+        return
+
+    print(f"[INFO] Labelling windows from {len(paths)} files with the full model...")
+    features, probabilities, model_ms = collect_windows(paths, classifier, args.hop)
+    labels = distill_labels(probabilities, args.threshold, ESC50_CLASSES, ALERT_SOUNDS)
+    print(f"[INFO] {len(labels)} windows, {int(labels.sum())} interesting")
+
+    screener = fit_screener(features, labels, args.recall)
+    stats = evaluate_screener(screener, features, labels)
+    screen_ms = screener_cost_ms(screener)
+
+    # Expected cost per window with the cascade: screener always, full model on pass
+    cascade_ms = screen_ms + stats['pass_rate'] * model_ms
+    screener.info = {
+        'confidence_threshold': args.threshold,
+        'recall': stats['recall'],
+        'pass_rate': stats['pass_rate'],
+        'windows': len(labels),
+    }
+    screener.save(args.output)
+
+    print("="*60)
+    print("Cascade screener")
+    print("="*60)
+    print(f"  Recall on interesting windows: {stats['recall'] * 100:6.1f}%")
+    print(f"  Precision:                     {stats['precision'] * 100:6.1f}%")
+    print(f"  Windows sent to full model:    {stats['pass_rate'] * 100:6.1f}%")
+    print(f"  Screener cost:                 {screen_ms:8.3f} ms/window")
+    print(f"  Full model cost:               {model_ms:8.1f} ms/window")
+    print(f"  Cascade cost:                  {cascade_ms:8.1f} ms/window "
+          f"({(1 - cascade_ms / model_ms) * 100 if model_ms else 0:.0f}% saved)")
+    print(f"[SUCCESS] Saved screener to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
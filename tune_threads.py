@@ -0,0 +1,54 @@
+"""
+Tune PyTorch thread counts for this machine
+
+Measures batch-1 and batch-N latency for every intra-/inter-op combination
+and saves the winners to the per-host thread profile. SoundClassifier
+applies the profile on load unless threads are set in the settings.
+
+Usage:
+    python tune_threads.py [model_path] [--batch-size 8] [--repeats 10] [--max-threads N]
+"""
+import argparse
+import os
+import sys
+
+from src.ai.checkpoint_io import resolve_checkpoint_path
+from src.ai.thread_tuning import THREAD_PROFILE_PATH, tune_threads
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PyTorch thread counts and save the best")
+    parser.add_argument("model_path", nargs='?', default="models/best_convnext_tiny.pth")
+    parser.add_argument("--batch-size", type=int, default=8, help="N for the batch-N measurement")
+    parser.add_argument("--repeats", type=int, default=10, help="Timed forwards per configuration")
+    parser.add_argument("--max-threads", type=int, default=None, help="Largest thread count tried")
+    parser.add_argument("--profile", default=THREAD_PROFILE_PATH)
+    args = parser.parse_args()
+
+    # Checked here: every candidate runs in its own child process
+    if not os.path.exists(resolve_checkpoint_path(args.model_path)):
+        print(f"[ERROR] Checkpoint not found: {args.model_path}")
+        sys.exit(1)
+
+    profile, rows = tune_threads(args.model_path, args.batch_size, args.repeats,
+                                 args.max_threads, args.profile)
+
+    print("="*60)
+    print("Thread tuning")
+    print("="*60)
+    print(f"  {'Inter':>5s} {'Intra':>5s} {'Batch':>5s} {'Median':>10s} {'p90':>10s} {'Per sample':>11s}")
+    for row in rows:
+        print(f"  {row['inter']:>5d} {row['intra']:>5d} {row['batch_size']:>5d} "
+              f"{row['median_ms']:>7.1f} ms {row['p90_ms']:>7.1f} ms "
+              f"{row['median_ms'] / row['batch_size']:>8.1f} ms")
+
+    single, batched = profile['batch_1'], profile['batch_n']
+    print(f"\n  Batch 1 (lowest p90):      intra={single['intra']}, inter={single['inter']} "
+          f"({single['p90_ms']:.1f} ms)")
+    print(f"  Batch {profile['batch_size']} (fastest/sample): intra={batched['intra']}, inter={batched['inter']} "
+          f"({batched['median_ms'] / profile['batch_size']:.1f} ms/sample)")
+    print(f"[SUCCESS] Saved thread profile to {args.profile}")
+
+
+if __name__ == "__main__":
+    main()